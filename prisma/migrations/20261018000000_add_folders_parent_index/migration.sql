@@ -0,0 +1,2 @@
+-- CreateIndex
+CREATE INDEX "folders_userId_parentId_idx" ON "folders"("userId", "parentId");
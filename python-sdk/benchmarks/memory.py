@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Key Vault SDK memory benchmark
+
+Measures how much memory a large key listing and folder tree hold once parsed,
+as the dictionaries the SDK returns by default and as the typed records returned
+with ``typed=True`` (see key_vault_sdk/models.py). The listings are generated in
+the server's JSON shape and parsed with json.loads, so repeated strings are
+separate objects exactly as they are after a real response.
+
+Usage:
+    python benchmarks/memory.py
+    python benchmarks/memory.py --keys 200000 --folders 500
+    python benchmarks/memory.py --json memory.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from key_vault_sdk.models import typed_folders, typed_keys  # noqa: E402
+
+TYPES = ('API_KEY', 'PASSWORD', 'SECRET', 'TOKEN', 'CERTIFICATE', 'SSH_KEY', 'OTHER')
+ENVIRONMENTS = ('DEVELOPMENT', 'STAGING', 'TESTING', 'PRODUCTION', 'LOCAL', 'SHARED')
+TAGS = ('payments', 'database', 'internal', 'legacy', 'third-party')
+
+
+def _timestamp(rng: random.Random) -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime(1_700_000_000 + rng.randrange(30_000_000)))
+
+
+def key_listing(keys: int, folders: int, seed: int = 1) -> str:
+    """JSON of one listing response holding ``keys`` keys spread over ``folders`` folders"""
+    rng = random.Random(seed)
+    folder_ids = [f"cm{seed:04d}folder{f:08d}" for f in range(folders)]
+    items = []
+    for k in range(keys):
+        items.append({
+            'id': f"cm{seed:04d}key{k:011d}",
+            'name': f"SERVICE_{k % 997}_KEY_{k}",
+            'description': f"Credential {k} for service {k % 997}" if k % 3 == 0 else None,
+            'type': rng.choice(TYPES),
+            'tags': rng.sample(TAGS, rng.randrange(3)),
+            'isFavorite': k % 10 == 0,
+            'environment': rng.choice(ENVIRONMENTS),
+            'folderId': folder_ids[k % folders],
+            'expiresAt': None,
+            'createdAt': _timestamp(rng),
+            'updatedAt': _timestamp(rng)
+        })
+    return json.dumps({'success': True, 'keys': items, 'total': keys, 'limit': keys, 'offset': 0})
+
+
+def folder_tree(folders: int, seed: int = 1) -> str:
+    """JSON of a /folders/tree response: projects of up to 20 folders, two levels deep"""
+    rng = random.Random(seed)
+    user_id = f"cm{seed:04d}user"
+    projects = []
+    parent = None
+    for f in range(folders):
+        node = {
+            'id': f"cm{seed:04d}folder{f:08d}",
+            'name': f"Folder{f}",
+            'description': None,
+            'color': rng.choice(('#3B82F6', '#10B981', '#F59E0B')),
+            'createdAt': _timestamp(rng),
+            'updatedAt': _timestamp(rng),
+            'userId': user_id,
+            'parentId': None,
+            '_count': {'keys': rng.randrange(100), 'other_folders': 0},
+            'children': []
+        }
+        if f % 20 == 0:
+            projects.append(node)
+            parent = node
+        else:
+            node['parentId'] = parent['id']
+            parent['children'].append(node)
+            parent['_count']['other_folders'] += 1
+    return json.dumps({'folders': projects})
+
+
+def measure(name: str, payload: str, build: Callable[[str], Any], records: int) -> Dict[str, Any]:
+    """
+    Measure the memory held by what ``build`` returns for a payload
+
+    Returns:
+        Dictionary with name, records, retained and peak bytes, bytes per record and build time
+    """
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build(payload)
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return {
+        'name': name,
+        'records': records,
+        'retained_bytes': retained,
+        'peak_bytes': peak,
+        'bytes_per_record': round(retained / records, 1) if records else 0.0,
+        'build_seconds': round(elapsed, 3)
+    }
+
+
+def _print_table(results: List[Dict[str, Any]]) -> None:
+    header = f"{'benchmark':<16} {'records':>9} {'retained MB':>12} {'peak MB':>9} {'B/record':>9} {'build s':>8}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(f"{r['name']:<16} {r['records']:>9} {r['retained_bytes'] / 2**20:>12.1f} "
+              f"{r['peak_bytes'] / 2**20:>9.1f} {r['bytes_per_record']:>9} {r['build_seconds']:>8}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--keys', type=int, default=200_000, help='Keys in the listing (default: 200000)')
+    parser.add_argument('--folders', type=int, default=500, help='Folders (default: 500)')
+    parser.add_argument('--json', metavar='FILE', help='Also write the results to FILE as JSON')
+    args = parser.parse_args(argv)
+
+    keys_payload = key_listing(args.keys, args.folders)
+    folders_payload = folder_tree(args.folders)
+
+    results = [
+        measure('keys: dict', keys_payload, json.loads, args.keys),
+        measure('keys: typed', keys_payload, lambda p: typed_keys(json.loads(p), None), args.keys),
+        measure('folders: dict', folders_payload, json.loads, args.folders),
+        measure('folders: typed', folders_payload, lambda p: typed_folders(json.loads(p)), args.folders)
+    ]
+
+    _print_table(results)
+    for kind in ('keys', 'folders'):
+        plain, typed = (r for r in results if r['name'].startswith(kind + ':'))
+        print(f"{kind}: typed records hold {plain['retained_bytes'] / typed['retained_bytes']:.1f}x less memory")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
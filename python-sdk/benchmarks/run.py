@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Key Vault SDK benchmarks
+
+Runs the SDK against an in-process stub server (see stub_server.py) and reports
+throughput and latency percentiles for the main lookup methods in three modes:
+
+    sequential  one thread, every client-side cache disabled
+    threaded    --threads threads sharing one client, caches disabled
+    cached      one thread, value/path/name caches and the search index enabled and warmed first
+
+Usage:
+    python benchmarks/run.py
+    python benchmarks/run.py --latency-ms 20 --keys-per-folder 200 --threads 16
+    python benchmarks/run.py --json results.json
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from key_vault_sdk import KeyVault  # noqa: E402
+from stub_server import StubDataSet, StubServer  # noqa: E402
+
+MODES = ('sequential', 'threaded', 'cached')
+BATCH_SIZE = 10
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+def _operations(data: StubDataSet, folders: int, keys_per_folder: int) -> Dict[str, Callable[[KeyVault, int], Any]]:
+    """Benchmark name -> fn(client, iteration)"""
+    folder_ids = [fid for fid in data.folders if fid != 'p0' and fid.startswith('p0')] or ['p0']
+    names = [f"KEY_{k}" for k in range(keys_per_folder)]
+    batch = names[:BATCH_SIZE]
+
+    def get_key_by_name(kv, i):
+        return kv.get_key_by_name(folder_ids[i % len(folder_ids)], names[i % len(names)])
+
+    def get_multiple_keys(kv, i):
+        return kv.get_multiple_keys(folder_ids[i % len(folder_ids)], batch, parallel=True)
+
+    def get_keys_by_path(kv, i):
+        return kv.get_keys_by_path(f"Project0/Folder{i % max(folders, 1)}" if folders else "Project0")
+
+    def search_keys(kv, i):
+        return kv.search_keys(names[i % len(names)], limit=20)
+
+    return {
+        'get_key_by_name': get_key_by_name,
+        'get_multiple_keys': get_multiple_keys,
+        'get_keys_by_path': get_keys_by_path,
+        'search_keys': search_keys
+    }
+
+
+def _client(stub: StubServer, mode: str, threads: int) -> KeyVault:
+    if mode == 'cached':
+        return KeyVault(api_url=stub.api_url, token="bench", cache_ttl=300, max_workers=threads,
+                        search_index_ttl=300)
+    return KeyVault(api_url=stub.api_url, token="bench", cache_ttl=None, path_cache_ttl=0,
+                    name_cache_ttl=0, max_workers=threads, coalesce_requests=False)
+
+
+def run_benchmark(stub: StubServer, name: str, op: Callable[[KeyVault, int], Any], mode: str,
+                  iterations: int, threads: int) -> Dict[str, Any]:
+    """
+    Time one operation in one mode
+
+    Returns:
+        Dictionary with name, mode, ops, seconds, ops_per_sec, p50/p95/p99/max
+        latency in milliseconds and requests_per_op
+    """
+    kv = _client(stub, mode, threads)
+    try:
+        # One untimed pass opens connections and, in cached mode, fills the caches
+        for i in range(iterations if mode == 'cached' else 1):
+            op(kv, i)
+        stub.reset_counts()
+
+        latencies: List[float] = []
+        lock = threading.Lock()
+
+        def timed(i):
+            start = time.perf_counter()
+            op(kv, i)
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+
+        start = time.perf_counter()
+        if mode == 'threaded':
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                list(pool.map(timed, range(iterations)))
+        else:
+            for i in range(iterations):
+                timed(i)
+        total = time.perf_counter() - start
+    finally:
+        kv.close()
+
+    ordered = sorted(latencies)
+    return {
+        'name': name,
+        'mode': mode,
+        'ops': iterations,
+        'seconds': round(total, 4),
+        'ops_per_sec': round(iterations / total, 1) if total else 0.0,
+        'p50_ms': round(_percentile(ordered, 0.50) * 1000, 3),
+        'p95_ms': round(_percentile(ordered, 0.95) * 1000, 3),
+        'p99_ms': round(_percentile(ordered, 0.99) * 1000, 3),
+        'max_ms': round(ordered[-1] * 1000, 3) if ordered else 0.0,
+        'requests_per_op': round(stub.request_count() / iterations, 2)
+    }
+
+
+def _print_table(results: List[Dict[str, Any]]) -> None:
+    header = f"{'benchmark':<20} {'mode':<11} {'ops/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/op':>7}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(f"{r['name']:<20} {r['mode']:<11} {r['ops_per_sec']:>10} {r['p50_ms']:>9} "
+              f"{r['p95_ms']:>9} {r['p99_ms']:>9} {r['requests_per_op']:>7}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Key Vault SDK against a local stub server")
+    parser.add_argument('--latency-ms', type=float, default=2.0, help="Stub latency per request (default: 2)")
+    parser.add_argument('--projects', type=int, default=2, help="Projects in the data set (default: 2)")
+    parser.add_argument('--folders', type=int, default=5, help="Subfolders per project (default: 5)")
+    parser.add_argument('--keys-per-folder', type=int, default=50, help="Keys per folder (default: 50)")
+    parser.add_argument('--iterations', type=int, default=200, help="Operations per benchmark (default: 200)")
+    parser.add_argument('--threads', type=int, default=8, help="Threads in threaded mode (default: 8)")
+    parser.add_argument('--mode', choices=MODES, action='append', help="Only run these modes (repeatable)")
+    parser.add_argument('--only', action='append', help="Only run these benchmarks (repeatable)")
+    parser.add_argument('--legacy', action='store_true', help="Act like an older server (unscoped /keys/path, no bulk or changes routes)")
+    parser.add_argument('--json', metavar='FILE', help="Also write the results as JSON ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    if args.keys_per_folder < BATCH_SIZE:
+        parser.error(f"--keys-per-folder must be at least {BATCH_SIZE}")
+
+    data = StubDataSet(args.projects, args.folders, args.keys_per_folder)
+    operations = _operations(data, args.folders, args.keys_per_folder)
+    if args.only:
+        unknown = set(args.only) - set(operations)
+        if unknown:
+            parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+        operations = {name: op for name, op in operations.items() if name in args.only}
+
+    results = []
+    with StubServer(data, latency_ms=args.latency_ms, legacy=args.legacy) as stub:
+        for name, op in operations.items():
+            for mode in args.mode or MODES:
+                results.append(run_benchmark(stub, name, op, mode, args.iterations, args.threads))
+
+    config = {k: v for k, v in vars(args).items() if k != 'json'}
+    if args.json == '-':
+        json.dump({'config': config, 'results': results}, sys.stdout, indent=2)
+        print()
+    else:
+        print(f"Stub latency {args.latency_ms} ms, {args.projects} projects x {args.folders} folders "
+              f"x {args.keys_per_folder} keys, {args.iterations} ops per benchmark\n")
+        _print_table(results)
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump({'config': config, 'results': results}, f, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""
+Key Vault Stub Server - In-process stand-in for the Key Vault API used by the benchmarks
+
+Serves the read-only endpoints the SDK uses from a generated data set, with an
+artificial per-request latency:
+
+    GET /api/auth/permissions
+    GET /api/folders
+    GET /api/folders/tree[?projectId=...]
+    GET /api/keys?folderId=...|search=...
+    GET /api/keys/{id}[?includeValue=true]
+    GET /api/keys/path?path=...      (legacy=True: the older response without scope or paging)
+    GET /api/keys/bulk?folderId=...|ids=...  (not served with legacy=True)
+    GET /api/keys/changes[?cursor=...]       (not served with legacy=True)
+
+Folder and key listings carry an ETag and are answered with 304 Not Modified
+when the request's If-None-Match matches.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# Listing routes that carry an ETag and answer If-None-Match with 304, like the server
+ETAG_ROUTES = frozenset(['/folders', '/folders/tree', '/keys'])
+
+
+class StubDataSet:
+    """
+    Generated projects, folders and keys
+
+    Every project has ``folders_per_project`` child folders, and every folder
+    (projects included) holds ``keys_per_folder`` keys named KEY_0, KEY_1, ...
+    """
+
+    def __init__(self, projects: int = 2, folders_per_project: int = 5, keys_per_folder: int = 50):
+        self.projects: List[Dict[str, Any]] = []
+        self.folders: Dict[str, Dict[str, Any]] = {}
+        self.keys: Dict[str, Dict[str, Any]] = {}
+        self.keys_by_folder: Dict[str, List[Dict[str, Any]]] = {}
+
+        for p in range(projects):
+            project = self._add_folder(f"p{p}", f"Project{p}", None, keys_per_folder)
+            self.projects.append(project)
+            for f in range(folders_per_project):
+                self._add_folder(f"p{p}f{f}", f"Folder{f}", project['id'], keys_per_folder)
+
+    def _add_folder(self, folder_id: str, name: str, parent_id: Optional[str],
+                    keys_per_folder: int) -> Dict[str, Any]:
+        folder = {'id': folder_id, 'name': name, 'parentId': parent_id, 'description': None}
+        self.folders[folder_id] = folder
+
+        keys = []
+        for k in range(keys_per_folder):
+            key = {
+                'id': f"{folder_id}k{k}",
+                'name': f"KEY_{k}",
+                'description': None,
+                'type': 'API_KEY' if k % 2 == 0 else 'SECRET',
+                'tags': [],
+                'isFavorite': k % 10 == 0,
+                'environment': 'production',
+                'folderId': folder_id,
+                'createdAt': '2024-01-01T00:00:00.000Z',
+                'updatedAt': '2024-01-01T00:00:00.000Z',
+                'value': f"secret-{folder_id}-{k}"
+            }
+            keys.append(key)
+            self.keys[key['id']] = key
+        self.keys_by_folder[folder_id] = keys
+        return folder
+
+    def tree(self, project_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Folders nested under their parents, like /api/folders/tree"""
+        nodes = {fid: dict(folder, children=[]) for fid, folder in self.folders.items()}
+        roots = []
+        for node in nodes.values():
+            parent = nodes.get(node['parentId']) if node['parentId'] else None
+            if parent is not None:
+                parent['children'].append(node)
+            else:
+                roots.append(node)
+        if project_id is not None:
+            return [nodes[project_id]] if project_id in nodes else []
+        return roots
+
+    def resolve(self, path: str) -> Optional[Dict[str, Any]]:
+        """Find a folder by a case-insensitive path like 'Project0/Folder1'"""
+        parent_id = None
+        folder = None
+        for part in [p.strip().lower() for p in path.split('/') if p.strip()]:
+            folder = next((f for f in self.folders.values()
+                           if f['parentId'] == parent_id and f['name'].lower() == part), None)
+            if folder is None:
+                return None
+            parent_id = folder['id']
+        return folder
+
+
+def _summary(key: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in key.items() if k != 'value'}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive, like the real deployment
+    disable_nagle_algorithm = True  # Headers and body go out in separate writes
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        # Bodies are ignored; POSTs are routed like GETs
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        self.do_GET()
+
+    def do_GET(self):
+        stub = self.server.stub
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        route, status, body = stub.handle(url.path, query)
+        stub.record(route)
+        if stub.latency:
+            time.sleep(stub.latency)
+
+        payload = json.dumps(body).encode('utf-8')
+        etag = None
+        if status == 200 and route in ETAG_ROUTES:
+            etag = '"%s"' % hashlib.sha1(payload).hexdigest()
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in stub.headers.items():
+            self.send_header(name, value)
+        if etag:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class StubServer:
+    """
+    Threaded HTTP server for a StubDataSet on a free local port
+
+    Example:
+        >>> with StubServer(latency_ms=5) as stub:
+        ...     kv = KeyVault(api_url=stub.api_url, token="bench")
+    """
+
+    def __init__(self, data: Optional[StubDataSet] = None, latency_ms: float = 0.0,
+                 legacy: bool = False):
+        """
+        Initialize the server
+
+        Args:
+            data: Data set to serve (default: StubDataSet())
+            latency_ms: Delay added to every response, in milliseconds
+            legacy: Serve /keys/path without scope support and no /keys/bulk or
+                    /keys/changes, like older servers
+        """
+        self.data = data or StubDataSet()
+        self.latency = latency_ms / 1000.0
+        self.legacy = legacy
+        self.headers: Dict[str, str] = {}  # Extra headers sent with every response
+        self.requests: Counter = Counter()
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def api_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def record(self, route: str) -> None:
+        with self._lock:
+            self.requests[route] += 1
+
+    def request_count(self) -> int:
+        """Total number of requests served so far"""
+        with self._lock:
+            return sum(self.requests.values())
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.requests.clear()
+
+    def handle(self, path: str, query: Dict[str, str]) -> Tuple[str, int, Dict[str, Any]]:
+        """Route a request; returns (route template, status, JSON body)"""
+        data = self.data
+        if not path.startswith('/api/'):
+            return 'other', 404, {'error': 'Not found'}
+        parts = path[len('/api/'):].strip('/').split('/')
+
+        if parts == ['auth', 'permissions']:
+            return '/auth/permissions', 200, {'permissions': ['*']}
+
+        if parts == ['folders']:
+            return '/folders', 200, {'folders': data.projects}
+
+        if parts == ['folders', 'tree']:
+            return '/folders/tree', 200, {'folders': data.tree(query.get('projectId'))}
+
+        if parts == ['keys']:
+            limit = int(query.get('limit', 20))
+            offset = int(query.get('offset', 0))
+            if 'folderId' in query:
+                keys = data.keys_by_folder.get(query['folderId'], [])
+            elif 'search' in query:
+                term = query['search'].lower()
+                keys = [key for key in data.keys.values()
+                        if term in key['name'].lower() or term in (key['description'] or '').lower()
+                        or query['search'] in key['tags']]
+                if 'type' in query:
+                    keys = [key for key in keys if key['type'] == query['type']]
+                if 'favorite' in query:
+                    keys = [key for key in keys if key['isFavorite'] == (query['favorite'] == 'true')]
+            else:
+                return '/keys', 400, {'error': 'folderId or search is required'}
+            page = [_summary(key) for key in keys[offset:offset + limit]]
+            return '/keys', 200, {'success': True, 'keys': page, 'total': len(keys),
+                                  'limit': limit, 'offset': offset}
+
+        if parts == ['keys', 'path']:
+            folder = data.resolve(query.get('path', ''))
+            if folder is None:
+                return '/keys/path', 404, {'error': 'Subfolder not found', 'path': query.get('path')}
+            if self.legacy:
+                # Older servers ignore scope and paging and list the whole folder
+                keys = data.keys_by_folder[folder['id']]
+                return '/keys/path', 200, {'success': True, 'path': query.get('path'),
+                                           'totalKeys': len(keys), 'keys': [_summary(key) for key in keys]}
+            keys = data.keys_by_folder[folder['id']]
+            limit = int(query.get('limit', len(keys)))
+            offset = int(query.get('offset', 0))
+            return '/keys/path', 200, {
+                'success': True, 'scope': 'folder', 'folder': folder, 'total': len(keys),
+                'limit': limit, 'offset': offset,
+                'keys': [_summary(key) for key in keys[offset:offset + limit]]
+            }
+
+        if parts == ['keys', 'changes'] and not self.legacy:
+            # The data set never changes, so the feed is every key once; the
+            # cursor is the number of keys already reported
+            ids = list(data.keys)
+            start = int(query.get('cursor', 0))
+            limit = int(query.get('limit', 500))
+            page = [_summary(data.keys[key_id]) for key_id in ids[start:start + limit]]
+            return '/keys/changes', 200, {
+                'success': True, 'updated': page, 'deleted': [],
+                'cursor': str(start + len(page)), 'hasMore': start + len(page) < len(ids)
+            }
+
+        if parts == ['keys', 'bulk'] and not self.legacy:
+            if 'ids' in query:
+                keys = [data.keys[i] for i in query['ids'].split(',') if i in data.keys]
+            else:
+                keys = data.keys_by_folder.get(query.get('folderId'), [])
+            if 'environment' in query:
+                keys = [key for key in keys if key['environment'].lower() == query['environment'].lower()]
+            return '/keys/bulk', 200, {'success': True, 'keys': keys[:500], 'total': min(len(keys), 500),
+                                       'truncated': len(keys) > 500}
+
+        if len(parts) == 2 and parts[0] == 'keys':
+            key = data.keys.get(parts[1])
+            if key is None:
+                return '/keys/{id}', 404, {'error': 'Key not found'}
+            body = key if query.get('includeValue') == 'true' else _summary(key)
+            return '/keys/{id}', 200, {'success': True, 'key': body}
+
+        return 'other', 404, {'error': 'Not found'}
+
+    def start(self) -> "StubServer":
+        """Start serving on a daemon thread"""
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='KeyVaultStub', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving"""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -9,7 +9,29 @@ Usage:
     key_value = kv.get_key_value(key_id="key-id")
 """
 
-from .client import KeyVault, KeyVaultError, KeyVaultAuthError, KeyVaultNotFoundError
+from .client import (
+    KeyVault, KeyVaultError, KeyVaultAuthError, KeyVaultNotFoundError, KeyVaultUnavailableError,
+    KeyVaultCircuitOpenError
+)
+from .cache import TTLCache
+from .refresher import BackgroundRefresher
+from .retry import RetryPolicy, CircuitBreaker
+from .transport import PooledTransport
+from .disk_cache import DiskCache
+from .snapshot import SecretSnapshot
+from .tree import FolderTree
+from .replica import KeyReplica, ReplicaWatcher
+from .search_index import KeySearchIndex
+from .models import Key, Folder, Project
+from .manifest import KeyVaultManifestError
+from .instrumentation import Instrumentation, MetricsCollector
+from .async_client import AsyncKeyVault
 
 __version__ = "1.0.2"
-__all__ = ["KeyVault", "KeyVaultError", "KeyVaultAuthError", "KeyVaultNotFoundError"] 
\ No newline at end of file
+__all__ = [
+    "KeyVault", "AsyncKeyVault", "KeyVaultError", "KeyVaultAuthError", "KeyVaultNotFoundError",
+    "KeyVaultUnavailableError", "KeyVaultCircuitOpenError", "KeyVaultManifestError", "TTLCache",
+    "BackgroundRefresher", "RetryPolicy", "CircuitBreaker", "PooledTransport",
+    "DiskCache", "SecretSnapshot", "Instrumentation", "MetricsCollector", "FolderTree",
+    "KeyReplica", "ReplicaWatcher", "KeySearchIndex", "Key", "Folder", "Project"
+] 
\ No newline at end of file
@@ -0,0 +1,409 @@
+"""
+Key Vault Agent - Local daemon that serves Key Vault lookups over a Unix socket
+
+One long-running agent per host keeps the warm HTTP session, caches and
+permissions. Short-lived processes (cron jobs, CLIs, batch tasks) then get their
+secrets with a local round trip instead of a TLS handshake and several API calls.
+
+Run it with:
+    KEYVAULT_TOKEN=... key-vault-agent --api-url https://yourdomain.com/api
+
+Clients use it automatically when ``KEYVAULT_AGENT_SOCKET`` is set (or when
+``KeyVault(..., agent_socket=...)`` is given) and fall back to the API otherwise.
+
+Protocol: newline-delimited JSON over a stream socket. A connection starts with
+``{"hello": <sha256 of the client's token>}``; the agent only serves clients
+configured with its own token. Each request is ``{"method": ..., "args": {...}}``
+and each reply ``{"ok": true, "result": ...}`` or
+``{"ok": false, "error": {"type": ..., "message": ...}}``.
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+from . import client as client_module
+from .client import KeyVault, KeyVaultError
+
+# Client methods the agent answers; everything else is refused
+AGENT_METHODS = frozenset([
+    'get_key', 'get_key_by_name', 'get_multiple_keys', 'get_values_bulk',
+    'get_keys_by_path', 'get_project_keys', 'get_environment_keys',
+    'list_keys', 'list_folders', 'list_projects', 'get_folder', 'search_keys',
+    'get_stats', 'test_connection',
+    'load_permissions', 'has_permission', 'has_any_permission', 'has_all_permissions',
+    'get_permissions', 'get_roles'
+])
+
+# Exceptions that are re-raised with the same type in the calling process
+_ERROR_TYPES = {
+    name: getattr(client_module, name)
+    for name in ('KeyVaultError', 'KeyVaultAuthError', 'KeyVaultNotFoundError',
+                 'KeyVaultUnavailableError', 'KeyVaultCircuitOpenError')
+}
+
+# Largest request or reply line accepted, in bytes
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+
+class AgentUnavailableError(Exception):
+    """The agent could not be reached or refused the client; callers fall back to the API"""
+    pass
+
+
+def default_socket_path() -> str:
+    """
+    Get the agent's default socket path
+
+    Returns:
+        ``$KEYVAULT_AGENT_SOCKET``, else a per-user path in ``$XDG_RUNTIME_DIR`` or /tmp
+    """
+    path = os.environ.get('KEYVAULT_AGENT_SOCKET')
+    if path:
+        return path
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, 'key-vault-agent.sock')
+    return f"/tmp/key-vault-agent-{os.getuid()}.sock"
+
+
+def token_fingerprint(token: str) -> str:
+    """SHA-256 of a token, sent instead of the token itself in the handshake"""
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+def _peer_uid(sock: socket.socket) -> Optional[int]:
+    """Get the UID of the process on the other end of a Unix socket, where supported"""
+    if hasattr(socket, 'SO_PEERCRED'):  # Linux
+        creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+        return struct.unpack('3i', creds)[1]
+    return None
+
+
+class _AgentHandler(socketserver.StreamRequestHandler):
+    """Serves one client connection"""
+
+    def handle(self):
+        agent = self.server.agent
+
+        uid = _peer_uid(self.connection)
+        if uid is not None and uid not in agent.allowed_uids:
+            return
+
+        hello = self._read()
+        if hello is None:
+            return
+        if not hmac.compare_digest(str(hello.get('hello', '')), agent.fingerprint):
+            self._write({'ok': False, 'error': {'type': 'AgentUnavailableError',
+                                                'message': 'Token does not match the agent'}})
+            return
+        self._write({'ok': True})
+
+        with self.server.lock:
+            self.server.connections.add(self.connection)
+        try:
+            while True:
+                message = self._read()
+                if message is None:
+                    return
+                self._write(agent.dispatch(message.get('method'), message.get('args') or {}))
+        finally:
+            with self.server.lock:
+                self.server.connections.discard(self.connection)
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        line = self.rfile.readline(MAX_MESSAGE_SIZE + 1)
+        if not line or len(line) > MAX_MESSAGE_SIZE:
+            return None
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return None
+        return message if isinstance(message, dict) else None
+
+    def _write(self, reply: Dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(reply, separators=(',', ':'), default=str).encode('utf-8') + b'\n')
+        self.wfile.flush()
+
+
+class _AgentServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connections = set()  # Connected clients, closed on shutdown
+        self.lock = threading.Lock()
+
+
+class KeyVaultAgent:
+    """
+    Serves a KeyVault client's methods to local processes over a Unix socket
+
+    The socket is created with mode 0600, and on Linux connections from other
+    users are rejected by checking the peer's credentials.
+    """
+
+    def __init__(self, client: KeyVault, socket_path: Optional[str] = None,
+                 allowed_uids: Optional[Iterable[int]] = None):
+        """
+        Initialize the agent
+
+        Args:
+            client: Warm KeyVault client whose methods are served
+            socket_path: Where to listen (default: default_socket_path())
+            allowed_uids: Users allowed to connect (default: the agent's own user)
+        """
+        self.client = client
+        self.client._agent = None  # Never forward the agent's own calls to itself
+        self.socket_path = socket_path or default_socket_path()
+        self.allowed_uids = set(allowed_uids) if allowed_uids is not None else {os.getuid()}
+        self.fingerprint = token_fingerprint(client.token)
+        self._server: Optional[_AgentServer] = None
+
+    def dispatch(self, method: Optional[str], args: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run one client method and build the reply
+
+        Args:
+            method: Name of a method in AGENT_METHODS
+            args: Keyword arguments for the method
+
+        Returns:
+            Reply dictionary
+        """
+        if method not in AGENT_METHODS:
+            return {'ok': False, 'error': {'type': 'KeyVaultError', 'message': f"Unsupported method: {method}"}}
+
+        try:
+            result = getattr(self.client, method)(**args)
+        except KeyVaultError as e:
+            return {'ok': False, 'error': {'type': type(e).__name__, 'message': str(e)}}
+        except Exception as e:
+            return {'ok': False, 'error': {'type': 'KeyVaultError', 'message': f"Agent error: {str(e)}"}}
+        return {'ok': True, 'result': result}
+
+    def _remove_stale_socket(self) -> None:
+        try:
+            mode = os.lstat(self.socket_path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise KeyVaultError(f"{self.socket_path} exists and is not a socket")
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except OSError:
+            os.unlink(self.socket_path)  # Left behind by an agent that exited
+        else:
+            raise KeyVaultError(f"Another agent is already listening on {self.socket_path}")
+        finally:
+            probe.close()
+
+    def serve_forever(self) -> None:
+        """Bind the socket and serve until shutdown() is called"""
+        self._remove_stale_socket()
+
+        old_umask = os.umask(0o177)  # Socket file is created with mode 0600
+        try:
+            self._server = _AgentServer(self.socket_path, _AgentHandler)
+        finally:
+            os.umask(old_umask)
+        self._server.agent = self
+
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+
+    def start(self) -> threading.Thread:
+        """
+        Serve on a daemon thread
+
+        Returns:
+            The serving thread
+        """
+        thread = threading.Thread(target=self.serve_forever, name='KeyVaultAgent', daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self) -> None:
+        """Stop serving, disconnect all clients and remove the socket"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        # Like an agent process exiting: clients notice and reconnect or fall back
+        with self._server.lock:
+            connections = list(self._server.connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class AgentClient:
+    """
+    Connection from a KeyVault client to a local agent
+
+    Each thread keeps its own connection, opened on first use.
+    """
+
+    def __init__(self, socket_path: str, token: str, timeout: float = 30):
+        """
+        Initialize the agent client
+
+        Args:
+            socket_path: The agent's socket
+            token: The client's API token; only its fingerprint is sent
+            timeout: Seconds to wait for a reply
+        """
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._fingerprint = token_fingerprint(token)
+        self._local = threading.local()
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+            stream = sock.makefile('rwb')
+            stream.write(json.dumps({'hello': self._fingerprint}).encode('utf-8') + b'\n')
+            stream.flush()
+            reply = json.loads(stream.readline(MAX_MESSAGE_SIZE + 1) or b'{}')
+        except (OSError, ValueError) as e:
+            sock.close()
+            raise AgentUnavailableError(str(e))
+        if not isinstance(reply, dict) or not reply.get('ok'):
+            sock.close()
+            error = reply.get('error') if isinstance(reply, dict) else None
+            raise AgentUnavailableError((error or {}).get('message', 'Agent refused the connection'))
+        return sock, stream
+
+    def call(self, method: str, args: Dict[str, Any]) -> Any:
+        """
+        Call a client method in the agent
+
+        Args:
+            method: Method name
+            args: Keyword arguments
+
+        Returns:
+            The method's result
+
+        Raises:
+            AgentUnavailableError: If the agent cannot be reached or its reply is unusable
+            KeyVaultError: Or a subclass, as raised by the method in the agent
+        """
+        conn = getattr(self._local, 'conn', None)
+        request = json.dumps({'method': method, 'args': args}).encode('utf-8') + b'\n'
+
+        for attempt in range(2):
+            if conn is None:
+                conn = self._local.conn = self._connect()
+            sock, stream = conn
+            try:
+                stream.write(request)
+                stream.flush()
+                line = stream.readline(MAX_MESSAGE_SIZE + 1)
+            except OSError:
+                line = b''
+            if line:
+                break
+            # The agent restarted or dropped an idle connection; reconnect once
+            self.close()
+            conn = None
+        else:
+            raise AgentUnavailableError("Agent closed the connection")
+
+        # A reply that is cut off, oversized or not JSON leaves the stream out of
+        # step; drop the connection and let the caller fall back to the API
+        try:
+            reply = json.loads(line) if len(line) <= MAX_MESSAGE_SIZE else None
+        except ValueError:
+            reply = None
+        if not isinstance(reply, dict):
+            self.close()
+            raise AgentUnavailableError("Invalid reply from the agent")
+
+        if reply.get('ok'):
+            return reply.get('result')
+
+        error = reply.get('error') or {}
+        error_type = _ERROR_TYPES.get(error.get('type'), KeyVaultError)
+        raise error_type(error.get('message', 'Agent error'))
+
+    def close(self) -> None:
+        """Close this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        self._local.conn = None
+        if conn is not None:
+            sock, stream = conn
+            try:
+                stream.close()
+            except OSError:
+                pass  # Flushing a request the agent never read; the socket is gone anyway
+            finally:
+                sock.close()
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Command-line entry point: run an agent in the foreground"""
+    parser = argparse.ArgumentParser(
+        prog='key-vault-agent',
+        description='Serve Key Vault lookups to local processes over a Unix socket.'
+    )
+    parser.add_argument('--api-url', default=os.environ.get('KEYVAULT_API_URL'),
+                        help='Key Vault API URL (default: $KEYVAULT_API_URL)')
+    parser.add_argument('--socket', default=None,
+                        help='Socket path (default: $KEYVAULT_AGENT_SOCKET or a per-user runtime path)')
+    parser.add_argument('--cache-ttl', type=float, default=300,
+                        help='Seconds to cache key values (default: 300)')
+    parser.add_argument('--max-staleness', type=float, default=3600,
+                        help='Seconds past the TTL to serve cached values while the API is down (default: 3600)')
+    parser.add_argument('--preload', action='append', default=[], metavar='PATH',
+                        help='Folder path to load and keep refreshed, e.g. MyApp/Production (repeatable)')
+    args = parser.parse_args(argv)
+
+    token = os.environ.get('KEYVAULT_TOKEN')
+    if not args.api_url or not token:
+        parser.error('--api-url (or $KEYVAULT_API_URL) and $KEYVAULT_TOKEN are required')
+
+    kv = KeyVault(api_url=args.api_url, token=token, cache_ttl=args.cache_ttl,
+                  max_staleness=args.max_staleness, agent_socket='')
+    kv.load_permissions()
+    if args.preload:
+        kv.start_refresher(paths=args.preload)
+
+    agent = KeyVaultAgent(kv, socket_path=args.socket)
+
+    def stop(signum, frame):
+        # shutdown() blocks until serve_forever() returns, so run it off the main thread
+        threading.Thread(target=agent.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    print(f"Key Vault agent listening on {agent.socket_path}", file=sys.stderr)
+    agent.serve_forever()
+    kv.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,960 @@
+"""
+Key Vault Async Client - asyncio client for interacting with the Key Vault API
+
+Requires the optional ``aiohttp`` dependency:
+    pip install amay-key-vault-sdk[async]
+"""
+
+import asyncio
+import json
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Any
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .cache import TTLCache
+from .instrumentation import Instrumentation, endpoint_template
+from .retry import CircuitBreaker, RetryPolicy
+from .singleflight import AsyncSingleFlight, request_key
+from .client import (
+    REVALIDATED_ROUTES, VALIDATOR_TTL,
+    KeyVaultError, KeyVaultNotFoundError, KeyVaultUnavailableError, KeyVaultCircuitOpenError,
+    _build_path_index, _missing_path_part, _raise_for_status, _server_path_params, _split_path
+)
+
+
+class AsyncKeyVault:
+    """
+    Key Vault SDK asyncio Client
+
+    Mirrors the read-only surface of KeyVault with coroutine methods. All requests
+    share one pooled aiohttp session, so many concurrent lookups can run on a
+    single event loop without a thread pool.
+
+    Example:
+        >>> async with AsyncKeyVault(api_url="https://yourdomain.com/api", token="your-token") as kv:
+        ...     value = await kv.get_key_by_name("folder-123", "stripe-secret-key")
+    """
+
+    def __init__(self, api_url: str, token: str, timeout: int = 30,
+                 cache_ttl: Optional[float] = None, cache_size: int = 1000,
+                 max_connections: int = 100, max_concurrency: int = 8,
+                 path_cache_ttl: Optional[float] = 300,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 max_connections_per_host: int = 0,
+                 connect_timeout: Optional[float] = None,
+                 read_timeout: Optional[float] = None, keep_alive: bool = True,
+                 connector: Optional["aiohttp.BaseConnector"] = None,
+                 coalesce_requests: bool = True,
+                 hooks: Optional[List[Instrumentation]] = None,
+                 revalidate: bool = True):
+        """
+        Initialize the async Key Vault client
+
+        Args:
+            api_url: Base URL of the Key Vault API (e.g., https://yourdomain.com/api)
+            token: Your API token for authentication
+            timeout: Request timeout in seconds (default: 30)
+            cache_ttl: If set, cache decrypted key values in memory for this many seconds
+            cache_size: Maximum number of cached key values (default: 1000)
+            max_connections: Size of the pooled connection limit (default: 100)
+            max_concurrency: Concurrent value fetches in get_multiple_keys (default: 8)
+            path_cache_ttl: Seconds to reuse a project's folder path index when resolving
+                            paths (default: 300, None or 0 to rebuild it on every call)
+            retry_policy: Retry policy for idempotent requests (default: RetryPolicy(),
+                          3 retries with jittered backoff, timeouts not retried;
+                          RetryPolicy(max_retries=0) disables)
+            circuit_breaker: Optional CircuitBreaker that fails fast while the API is down
+            max_connections_per_host: Connection limit per host (default: 0, no limit
+                                      beyond max_connections)
+            connect_timeout: Seconds to wait for a connection (default: no separate limit)
+            read_timeout: Seconds to wait between reads of a response (default: no separate limit)
+            keep_alive: Reuse connections between requests (default: True)
+            connector: aiohttp connector shared with other clients; it is not closed
+                       by close(), and the connection arguments above are ignored
+            coalesce_requests: Let concurrent identical GET requests share one HTTP
+                               call instead of each sending their own (default: True)
+            hooks: Instrumentation hooks notified around every HTTP attempt
+            revalidate: Keep the last folder and key listings with their ETags and ask the
+                        server with If-None-Match, so unchanged listings cost a bodyless 304
+        """
+        if aiohttp is None:
+            raise KeyVaultError(
+                "AsyncKeyVault requires aiohttp. Install it with: pip install amay-key-vault-sdk[async]"
+            )
+
+        self.api_url = api_url.rstrip('/')
+        self.token = token
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.keep_alive = keep_alive
+        self.connector = connector
+        self.max_concurrency = max_concurrency
+        self.headers = {
+            'Authorization': f'Bearer {token}',
+            'Content-Type': 'application/json',
+            'User-Agent': f'KeyVault-Python-SDK/1.0.0'
+        }
+        self.session = None  # Created lazily inside the running event loop
+        self.permissions = None  # Cache for user permissions
+        self.cache = TTLCache(cache_ttl, cache_size) if cache_ttl else None  # Cache for key values
+        self._permissions_lock = None
+        self._prefetch_tasks = set()  # Pending page prefetches, cancelled on close()
+        # Cache of {project name: {normalized path: folder}} for path resolution
+        self._path_index = TTLCache(path_cache_ttl, 256) if path_cache_ttl else None
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.circuit_breaker = circuit_breaker
+        self._single_flight = AsyncSingleFlight() if coalesce_requests else None
+        # Cache of {request: (ETag, raw body)} for listings revalidated with If-None-Match
+        self._validators = TTLCache(VALIDATOR_TTL, 256) if revalidate else None
+        self.not_modified = 0  # Responses answered with 304 Not Modified
+        self._hooks: List[Instrumentation] = list(hooks or [])
+        self._server_path_lookup = True  # Cleared once the server proves too old for /keys/path
+
+    async def __aenter__(self) -> "AsyncKeyVault":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session"""
+        for task in list(self._prefetch_tasks):
+            task.cancel()
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Get the pooled HTTP session, creating it on first use"""
+        if self.session is None or self.session.closed:
+            connector = self.connector
+            if connector is None:
+                connector = aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.max_connections_per_host,
+                    force_close=not self.keep_alive
+                )
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                connector_owner=self.connector is None,
+                timeout=aiohttp.ClientTimeout(
+                    total=self.timeout,
+                    connect=self.connect_timeout,
+                    sock_read=self.read_timeout
+                )
+            )
+        return self.session
+
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        Make an HTTP request to the Key Vault API
+
+        Concurrent identical GET requests are coalesced into a single HTTP call
+        unless the client was created with ``coalesce_requests=False``.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            **kwargs: Additional arguments for aiohttp
+
+        Returns:
+            API response as dictionary
+
+        Raises:
+            KeyVaultError: For API errors
+            KeyVaultAuthError: For authentication errors
+            KeyVaultNotFoundError: For not found errors
+            KeyVaultUnavailableError: When the API cannot be reached
+            KeyVaultCircuitOpenError: When the circuit breaker is open
+        """
+        revalidate = (self._validators is not None and method.upper() == 'GET'
+                      and endpoint_template(endpoint) in REVALIDATED_ROUTES)
+
+        if self._single_flight is None or method.upper() != 'GET':
+            return await self._send_request(method, endpoint, revalidate=revalidate, **kwargs)
+
+        return await self._single_flight.do(
+            request_key(method, endpoint, kwargs),
+            lambda: self._send_request(method, endpoint, revalidate=revalidate, **kwargs)
+        )
+
+    async def _send_request(self, method: str, endpoint: str, revalidate: bool = False,
+                            **kwargs) -> Dict[str, Any]:
+        """Helper method to send one request, with retries and the circuit breaker"""
+        if endpoint.startswith('/'):
+            url = self.api_url + endpoint
+        else:
+            url = self.api_url + '/' + endpoint
+
+        validator_key = request_key(method, endpoint, kwargs) if revalidate else None
+        validator = self._validators.get(validator_key) if revalidate else None
+        if validator is not None:
+            kwargs['headers'] = dict(kwargs.get('headers') or {}, **{'If-None-Match': validator[0]})
+
+        policy = self.retry_policy if self.retry_policy.allows(method) else None
+        attempt = 0
+
+        while True:
+            # Fail fast instead of waiting out the timeout while the API is down
+            if self.circuit_breaker is not None and not self.circuit_breaker.allow_request():
+                raise KeyVaultCircuitOpenError("Circuit breaker is open: Key Vault API unavailable")
+
+            retry_after = None
+            event = None
+            if self._hooks:
+                event = {
+                    'method': method,
+                    'endpoint': endpoint,
+                    'route': endpoint_template(endpoint),
+                    'params': kwargs.get('params'),
+                    'attempt': attempt
+                }
+                self._notify('before_request', event)
+                started = time.perf_counter()
+
+            try:
+                async with self._get_session().request(method, url, **kwargs) as response:
+                    body = await response.read()
+                    text = body.decode(response.charset or 'utf-8', errors='replace')
+                    status = response.status
+                    retry_after_header = response.headers.get('Retry-After')
+                    etag = response.headers.get('ETag') if revalidate else None
+            except asyncio.TimeoutError:
+                error = KeyVaultUnavailableError("Request timeout")
+                if policy is not None and not policy.retry_timeouts:
+                    policy = None  # This attempt already waited out the full timeout
+            except aiohttp.ClientConnectionError:
+                error = KeyVaultUnavailableError("Connection error")
+            except aiohttp.ClientError as e:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+                error = KeyVaultError(f"Request failed: {str(e)}")
+                if event is not None:
+                    self._notify_after(event, started, None, 0, error)
+                raise error
+            else:
+                error = None
+                if event is not None:
+                    self._notify_after(event, started, status, len(body), None)
+                if self.circuit_breaker is not None:
+                    if status >= 500:
+                        self.circuit_breaker.record_failure()
+                    else:
+                        self.circuit_breaker.record_success()
+
+                if (policy is None or attempt >= policy.max_retries
+                        or not policy.should_retry_status(status)):
+                    if validator is not None and status == 304:
+                        self.not_modified += 1
+                        self._validators.set(validator_key, validator)
+                        return json.loads(validator[1])
+
+                    # Handle different response status codes
+                    _raise_for_status(status, text)
+
+                    # Parse JSON response
+                    try:
+                        result = json.loads(text)
+                    except ValueError:
+                        raise KeyVaultError(f"Invalid JSON response: {text}")
+                    if etag:
+                        self._validators.set(validator_key, (etag, body))
+                    return result
+
+                retry_after = policy.parse_retry_after(retry_after_header)
+
+            if error is not None:
+                if event is not None:
+                    self._notify_after(event, started, None, 0, error)
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+                if policy is None or attempt >= policy.max_retries:
+                    raise error
+
+            await asyncio.sleep(policy.get_backoff(attempt, retry_after))
+            attempt += 1
+
+    def _notify(self, callback: str, event: Dict[str, Any]) -> None:
+        """Helper method to pass an event to every hook that implements the callback"""
+        for hook in list(self._hooks):
+            handler = getattr(hook, callback, None)
+            if handler is None:
+                continue
+            try:
+                handler(event)
+            except Exception:
+                # A broken hook must never break the request it observes
+                pass
+
+    def _notify_after(self, event: Dict[str, Any], started: float, status: Optional[int],
+                      size: int, error: Optional[Exception]) -> None:
+        """Helper method to complete a request event and pass it to the after_request hooks"""
+        event['latency'] = time.perf_counter() - started
+        event['status'] = status
+        event['bytes'] = size
+        event['error'] = error
+        self._notify('after_request', event)
+
+    def add_hook(self, hook: Instrumentation) -> None:
+        """Register an instrumentation hook"""
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Instrumentation) -> None:
+        """Unregister an instrumentation hook added with add_hook() or hooks="""
+        self._hooks.remove(hook)
+
+    async def _require_permission(self, permission: str) -> None:
+        """Raise KeyVaultError unless the user has the given permission"""
+        if not await self.has_permission(permission):
+            raise KeyVaultError(f"Insufficient permissions: {permission} required")
+
+    async def list_keys(self, folder_id: str, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """
+        List keys in a folder (with RBAC permission check)
+
+        Args:
+            folder_id: Folder ID to list keys from
+            limit: Number of keys to return (default: 20, max: 100)
+            offset: Number of keys to skip (default: 0)
+
+        Returns:
+            Dictionary containing keys list and pagination info
+        """
+        await self._require_permission('keys:read')
+
+        params = {
+            'folderId': folder_id,
+            'limit': min(limit, 100),  # Cap at 100
+            'offset': offset
+        }
+
+        response = await self._make_request('GET', '/keys', params=params)
+
+        if not response.get('success', True):
+            raise KeyVaultError(response.get('error', 'Failed to list keys'))
+
+        return {
+            'keys': response.get('keys', []),
+            'total': response.get('total', 0),
+            'limit': response.get('limit', limit),
+            'offset': response.get('offset', offset)
+        }
+
+    async def get_key(self, key_id: str, include_value: bool = False) -> Dict[str, Any]:
+        """
+        Get a key by ID (with RBAC permission check)
+
+        Args:
+            key_id: The key's ID
+            include_value: If True, include the decrypted key value
+
+        Returns:
+            Key object with metadata and optionally the value
+        """
+        # Serve decrypted values from the cache when enabled
+        if include_value and self.cache is not None:
+            cached = self.cache.get(key_id)
+            if cached is not None:
+                return dict(cached)
+
+        await self._require_permission('keys:read')
+
+        params = {'includeValue': str(include_value).lower()}
+
+        response = await self._make_request('GET', f'/keys/{key_id}', params=params)
+
+        if not response.get('success', True):
+            raise KeyVaultError(response.get('error', 'Failed to fetch key'))
+
+        key = response.get('key', {})
+        if include_value and self.cache is not None and 'value' in key:
+            self.cache.set(key_id, dict(key))
+
+        return key
+
+    async def get_key_by_name(self, folder_id: str, key_name: str) -> str:
+        """
+        Get a key's value by name (convenience method)
+
+        Args:
+            folder_id: Folder containing the key
+            key_name: Name of the key to retrieve
+
+        Returns:
+            The decrypted key value as string
+        """
+        key = None
+        async for candidate in self.iter_keys(folder_id):
+            if candidate['name'] == key_name:
+                key = candidate
+                break
+
+        if not key:
+            raise KeyVaultNotFoundError(f"Key '{key_name}' not found in folder")
+
+        key_with_value = await self.get_key(key_id=key['id'], include_value=True)
+
+        return key_with_value.get('value', '')
+
+    async def get_multiple_keys(self, folder_id: str, key_names: List[str],
+                                max_concurrency: Optional[int] = None,
+                                errors: Optional[Dict[str, Exception]] = None) -> Dict[str, str]:
+        """
+        Get multiple keys by name, fetching the values concurrently
+
+        Args:
+            folder_id: Folder containing the keys
+            key_names: List of key names to retrieve
+            max_concurrency: Concurrent fetches for this call (default: the client's max_concurrency)
+            errors: Optional dictionary that receives per-key exceptions;
+                    failed keys are then returned as None instead of raising
+
+        Returns:
+            Dictionary mapping key names to their values (None if not found)
+        """
+        keys_dict = {name: None for name in key_names}
+
+        # Page through the folder until every requested key has been seen
+        folder_keys = {}
+        if keys_dict:
+            async for key in self.iter_keys(folder_id):
+                if key['name'] in keys_dict and key['name'] not in folder_keys:
+                    folder_keys[key['name']] = key
+                    if len(folder_keys) == len(keys_dict):
+                        break
+
+        wanted = [name for name in keys_dict if name in folder_keys]
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def fetch(name):
+            async with semaphore:
+                key = await self.get_key(key_id=folder_keys[name]['id'], include_value=True)
+                return key.get('value', '')
+
+        results = await asyncio.gather(*(fetch(name) for name in wanted), return_exceptions=True)
+
+        failures = {}
+        for name, value in zip(wanted, results):
+            if isinstance(value, Exception):
+                failures[name] = value
+            else:
+                keys_dict[name] = value
+
+        if failures:
+            if errors is None:
+                raise next(iter(failures.values()))
+            errors.update(failures)
+
+        return keys_dict
+
+    def iter_keys(self, folder_id: str, page_size: int = 100,
+                  prefetch: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every key in a folder, fetching pages lazily
+
+        Args:
+            folder_id: Folder ID to list keys from
+            page_size: Number of keys to request per page (default: 100, max: 100)
+            prefetch: If True, fetch the next page concurrently while the
+                      current one is being consumed
+
+        Yields:
+            Key objects (without values)
+        """
+        page_size = min(page_size, 100)
+        return self._iter_pages(
+            lambda offset: self.list_keys(folder_id=folder_id, limit=page_size, offset=offset),
+            page_size,
+            prefetch
+        )
+
+    def iter_search(self, search: str, key_type: Optional[str] = None,
+                    favorite: Optional[bool] = None, page_size: int = 100,
+                    prefetch: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every search result, fetching pages lazily
+
+        Args:
+            search: Search term
+            key_type: Filter by key type (e.g., 'API_KEY', 'PASSWORD')
+            favorite: Filter by favorite status
+            page_size: Number of keys to request per page (default: 100)
+            prefetch: If True, fetch the next page concurrently while the
+                      current one is being consumed
+
+        Yields:
+            Key objects matching the search
+        """
+        return self._iter_pages(
+            lambda offset: self.search_keys(search, key_type=key_type, favorite=favorite,
+                                            limit=page_size, offset=offset),
+            page_size,
+            prefetch
+        )
+
+    async def _iter_pages(self, fetch_page: Callable[[int], Awaitable[Dict[str, Any]]],
+                          page_size: int, prefetch: bool) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Helper async generator that walks an offset-paginated listing
+
+        Args:
+            fetch_page: Coroutine function returning the page at a given offset
+            page_size: Number of keys requested per page
+            prefetch: If True, request the next page before yielding the current one
+
+        Yields:
+            Items from the 'keys' list of each page
+        """
+        offset = 0
+        next_page = None
+
+        try:
+            page = await fetch_page(offset)
+            while True:
+                keys = page.get('keys', [])
+                if not keys:
+                    return
+
+                offset += len(keys)
+                total = page.get('total', 0)
+                has_more = offset < total if total else len(keys) >= page_size
+
+                if has_more and prefetch:
+                    next_page = asyncio.ensure_future(fetch_page(offset))
+                    self._prefetch_tasks.add(next_page)
+                    next_page.add_done_callback(self._prefetch_tasks.discard)
+
+                for key in keys:
+                    yield key
+
+                if not has_more:
+                    return
+                if next_page is not None:
+                    page, next_page = await next_page, None
+                else:
+                    page = await fetch_page(offset)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def list_folders(self, project_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        List all folders with hierarchical structure
+
+        Args:
+            project_id: If provided, only return folders within this project
+
+        Returns:
+            Dictionary containing folders list with hierarchical structure
+        """
+        if project_id:
+            response = await self._make_request('GET', f'/folders/tree?projectId={project_id}')
+        else:
+            response = await self._make_request('GET', '/folders/tree')
+
+        return {
+            'folders': response.get('folders', [])
+        }
+
+    async def list_projects(self) -> List[Dict[str, Any]]:
+        """
+        List only root folders (projects)
+
+        Returns:
+            List of project folders
+        """
+        response = await self._make_request('GET', '/folders')
+        return response.get('folders', [])
+
+    async def get_folder(self, folder_id: str) -> Dict[str, Any]:
+        """
+        Get a specific folder with its contents (with RBAC permission check)
+
+        Args:
+            folder_id: The folder's ID
+
+        Returns:
+            Dictionary containing folder object and its keys
+        """
+        await self._require_permission('folders:read')
+
+        response = await self._make_request('GET', f'/folders/{folder_id}')
+
+        return {
+            'folder': response.get('folder', {}),
+            'keys': response.get('keys', [])
+        }
+
+    async def search_keys(self, search: str, key_type: Optional[str] = None,
+                          favorite: Optional[bool] = None, limit: int = 20,
+                          offset: int = 0) -> Dict[str, Any]:
+        """
+        Search for keys across all folders
+
+        Args:
+            search: Search term
+            key_type: Filter by key type (e.g., 'API_KEY', 'PASSWORD')
+            favorite: Filter by favorite status
+            limit: Number of keys to return (default: 20)
+            offset: Number of keys to skip (default: 0)
+
+        Returns:
+            Dictionary containing search results and pagination info
+        """
+        params = {
+            'search': search,
+            'limit': limit,
+            'offset': offset
+        }
+
+        if key_type:
+            params['type'] = key_type
+        if favorite is not None:
+            params['favorite'] = str(favorite).lower()
+
+        response = await self._make_request('GET', '/keys', params=params)
+
+        return {
+            'keys': response.get('keys', []),
+            'total': response.get('total', 0),
+            'limit': response.get('limit', limit),
+            'offset': response.get('offset', offset)
+        }
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """
+        Get folder and key statistics
+
+        Returns:
+            Dictionary containing statistics about keys and folders
+        """
+        response = await self._make_request('GET', '/stats')
+        return response.get('stats', {})
+
+    async def test_connection(self) -> bool:
+        """
+        Test the connection to the Key Vault API
+
+        Returns:
+            True if connection is successful
+        """
+        try:
+            await self.list_folders()
+            return True
+        except Exception:
+            return False
+
+    async def get_keys_by_path(self, path: str, environment: Optional[str] = None,
+                               limit: int = 100, offset: int = 0) -> Dict[str, Any]:
+        """
+        Get keys by path (most user-friendly method)
+
+        Args:
+            path: Path like 'ProjectName/Subfolder' or 'ProjectName'
+            environment: Filter by environment (DEVELOPMENT, STAGING, PRODUCTION, etc.)
+            limit: Number of keys to return (default: 100)
+            offset: Number of keys to skip (default: 0)
+
+        Returns:
+            Dictionary containing the keys (metadata only, without values), total
+            count, folder info, and path
+        """
+        try:
+            # Resolve the path and list its keys in one round trip when the server supports it
+            result = await self._get_keys_by_server_path(path, environment, limit, offset)
+            if result is not None:
+                return result
+
+            target_folder = await self._resolve_path_to_folder(path)
+
+            if not target_folder:
+                raise KeyVaultError(f"Path not found: {path}")
+
+            params = {
+                'folderId': target_folder['id'],
+                'limit': min(limit, 100),
+                'offset': offset
+            }
+
+            if environment:
+                params['environment'] = environment.upper()
+
+            response = await self._make_request('GET', '/keys', params=params)
+
+            if not response.get('success', True):
+                raise KeyVaultError(response.get('error', 'Failed to fetch keys'))
+
+            return {
+                'keys': response.get('keys', []),
+                'total': response.get('total', 0),
+                'folder': target_folder,
+                'path': path
+            }
+
+        except Exception as e:
+            raise KeyVaultError(f"Failed to get keys by path '{path}': {str(e)}")
+
+    async def _get_keys_by_server_path(self, path: str, environment: Optional[str],
+                                       limit: int, offset: int) -> Optional[Dict[str, Any]]:
+        """Helper method to resolve a path and list its keys through /keys/path"""
+        if not self._server_path_lookup:
+            return None
+
+        try:
+            response = await self._make_request(
+                'GET', '/keys/path', params=_server_path_params(path, environment, limit, offset)
+            )
+        except KeyVaultNotFoundError:
+            # The path doesn't exist or the route can't see it; resolve just this
+            # one client-side, which raises if it really doesn't exist
+            return None
+
+        if response.get('scope') != 'folder':
+            # Servers before scope support ignore scope, paging and environment;
+            # resolve client-side from now on
+            self._server_path_lookup = False
+            return None
+
+        keys = response.get('keys', [])
+        return {
+            'keys': keys,
+            'total': response.get('total', len(keys)),
+            'folder': response['folder'],
+            'path': path
+        }
+
+    async def _resolve_path_to_folder(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Helper method to resolve a path to a folder object
+
+        Args:
+            path: Path like 'ProjectName/Subfolder/SubSubfolder'
+
+        Returns:
+            Folder object
+
+        Raises:
+            KeyVaultNotFoundError: If the project or a folder on the path doesn't exist
+        """
+        path_parts = _split_path(path)
+        path_key = '/'.join(part.lower() for part in path_parts)
+
+        try:
+            index, cached = await self._get_path_index(path_parts[0])
+            folder = index.get(path_key)
+
+            if folder is None and cached:
+                # The cached tree may predate the folder; rebuild it once before giving up
+                index, _ = await self._get_path_index(path_parts[0], refresh=True)
+                folder = index.get(path_key)
+
+            if folder is None:
+                missing = _missing_path_part(index, path_parts)
+                raise KeyVaultNotFoundError(f"Subfolder not found: {missing} in path {path}")
+
+            return folder
+
+        except KeyVaultNotFoundError as e:
+            raise KeyVaultNotFoundError(f"Path resolution failed: {str(e)}")
+        except Exception as e:
+            raise KeyVaultError(f"Path resolution failed: {str(e)}")
+
+    async def _get_path_index(self, project_name: str, refresh: bool = False):
+        """
+        Helper method to get the path index of a project
+
+        Args:
+            project_name: Name of the project (case-insensitive)
+            refresh: If True, ignore the cached index and rebuild it
+
+        Returns:
+            Tuple of (path index, whether it came from the cache)
+        """
+        project_key = project_name.lower()
+
+        if self._path_index is not None and not refresh:
+            index = self._path_index.get(project_key)
+            if index is not None:
+                return index, True
+
+        projects = await self.list_projects()
+        root_project = next((p for p in projects if
+                             p['name'].strip().lower() == project_key), None)
+
+        if not root_project:
+            raise KeyVaultNotFoundError(f"Project not found: {project_name}")
+
+        folders_data = await self.list_folders(project_id=root_project['id'])
+        index = _build_path_index(root_project, folders_data.get('folders', []))
+
+        if self._path_index is not None:
+            self._path_index.set(project_key, index)
+
+        return index, False
+
+    def refresh_paths(self, project_name: Optional[str] = None) -> None:
+        """
+        Drop cached folder paths so the next path lookup refetches the tree
+
+        Args:
+            project_name: Only drop this project's paths (default: all projects)
+        """
+        if self._path_index is None:
+            return
+        if project_name is None:
+            self._path_index.clear()
+        else:
+            self._path_index.invalidate(project_name.strip().lower())
+
+    async def get_project_keys(self, project_name: str, environment: Optional[str] = None,
+                               limit: int = 100, offset: int = 0) -> Dict[str, Any]:
+        """
+        Get keys from a project by name (convenience method)
+
+        Returns:
+            Same as get_keys_by_path
+        """
+        return await self.get_keys_by_path(project_name, environment, limit, offset)
+
+    async def get_environment_keys(self, project_name: str, environment: str,
+                                   limit: int = 100, offset: int = 0) -> Dict[str, Any]:
+        """
+        Get keys from a specific environment in a project (convenience method)
+
+        Returns:
+            Same as get_keys_by_path with environment filter
+        """
+        return await self.get_keys_by_path(project_name, environment, limit, offset)
+
+    # RBAC Methods
+
+    async def load_permissions(self) -> List[str]:
+        """
+        Load user permissions from the server
+
+        Returns:
+            List of permission strings
+        """
+        try:
+            response = await self._make_request('GET', '/auth/permissions')
+            if response.get('permissions'):
+                self.permissions = set(response['permissions'])
+                return list(self.permissions)
+            else:
+                self.permissions = set()
+                return []
+        except KeyVaultUnavailableError:
+            # Don't cache an empty permission set because of a transient outage
+            raise
+        except Exception as e:
+            print(f"Warning: Failed to load permissions: {e}")
+            self.permissions = set()
+            return []
+
+    async def _ensure_permissions(self) -> None:
+        """Load permissions once, even when many coroutines ask at the same time"""
+        if self.permissions is not None:
+            return
+        if self._permissions_lock is None:
+            self._permissions_lock = asyncio.Lock()
+        async with self._permissions_lock:
+            if self.permissions is None:
+                await self.load_permissions()
+
+    async def has_permission(self, permission: str) -> bool:
+        """
+        Check if user has a specific permission
+
+        Args:
+            permission: Permission to check (e.g., 'keys:read')
+
+        Returns:
+            True if user has permission
+        """
+        await self._ensure_permissions()
+        return permission in self.permissions or '*' in self.permissions
+
+    async def has_any_permission(self, permissions: List[str]) -> bool:
+        """
+        Check if user has any of the specified permissions
+
+        Args:
+            permissions: List of permissions to check
+
+        Returns:
+            True if user has any of the permissions
+        """
+        await self._ensure_permissions()
+        return any(p in self.permissions or '*' in self.permissions for p in permissions)
+
+    async def has_all_permissions(self, permissions: List[str]) -> bool:
+        """
+        Check if user has all of the specified permissions
+
+        Args:
+            permissions: List of permissions to check
+
+        Returns:
+            True if user has all permissions
+        """
+        await self._ensure_permissions()
+        return all(p in self.permissions or '*' in self.permissions for p in permissions)
+
+    async def get_permissions(self) -> List[str]:
+        """
+        Get user's current permissions
+
+        Returns:
+            List of permission strings
+        """
+        await self._ensure_permissions()
+        return list(self.permissions)
+
+    async def get_roles(self) -> List[Dict[str, Any]]:
+        """
+        Get user's roles
+
+        Returns:
+            List of role objects
+        """
+        response = await self._make_request('GET', '/auth/roles')
+        return response.get('roles', [])
+
+    # Cache Methods
+
+    def invalidate(self, key_id: str) -> bool:
+        """
+        Drop a key's cached value so the next lookup fetches it from the server
+
+        Returns:
+            True if a cached value was removed
+        """
+        if self.cache is None:
+            return False
+        return self.cache.invalidate(key_id)
+
+    def clear_cache(self) -> None:
+        """Drop all cached key values"""
+        if self.cache is not None:
+            self.cache.clear()
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get value cache statistics
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, size, maxsize and ttl
+            (empty if caching is disabled)
+        """
+        if self.cache is None:
+            return {}
+        return self.cache.stats()
@@ -0,0 +1,169 @@
+"""
+Key Vault Cache - In-process caching helpers for the Key Vault SDK
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with a per-entry time-to-live
+
+    Entries expire ``ttl`` seconds after they were stored. When the cache holds
+    ``maxsize`` entries, the least recently used entry is evicted to make room.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1000):
+        """
+        Initialize the cache
+
+        Args:
+            ttl: Default time-to-live of an entry in seconds
+            maxsize: Maximum number of entries kept in memory (default: 1000)
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            The cached value, or ``default``
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                # Expired entries stay until evicted so get_stale() can still serve them
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def get_stale(self, key: Hashable, max_staleness: float, default: Any = None) -> Any:
+        """
+        Get a cached value even if it has expired, within a staleness bound
+
+        Args:
+            key: Cache key
+            max_staleness: Seconds past expiry for which the value is still returned
+            default: Value returned when the key is missing or too stale
+
+        Returns:
+            The cached value, or ``default``
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            value, expires_at = entry
+            now = time.monotonic()
+            if expires_at + max_staleness < now:
+                return default
+
+            if expires_at <= now:
+                self.stale_hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value in the cache
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live for this entry (default: the cache's ttl)
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> bool:
+        """
+        Remove a single entry
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if an entry was removed
+        """
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Remove all entries and reset the hit/miss counters"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.stale_hits = 0
+
+    def entries(self) -> List[Tuple[Hashable, Any, float]]:
+        """
+        Get every entry, including expired ones, in least to most recently used order
+
+        Returns:
+            List of (key, value, seconds until expiry) tuples; restore an entry
+            with ``set(key, value, ttl=seconds)``
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [(key, value, expires_at - now) for key, (value, expires_at) in self._data.items()]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with hits, misses, stale hits, hit rate, current size and max size
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'stale_hits': self.stale_hits,
+                'hit_rate': self.hits / total if total else 0.0,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and entry[1] > time.monotonic()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
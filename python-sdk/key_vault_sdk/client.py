@@ -2,10 +2,46 @@
 Key Vault Client - Main client for interacting with the Key Vault API
 """
 
+import functools
+import hashlib
+import inspect
+import json
+import os
+import threading
+import time
+import weakref
 import requests
-from typing import Dict, List, Optional, Union, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Union, Any
 from urllib.parse import urljoin
 
+from .cache import TTLCache
+from .instrumentation import Instrumentation, endpoint_template
+from .refresher import BackgroundRefresher
+from .models import iter_typed_keys, typed_folders, typed_keys, typed_projects
+from .replica import KeyReplica, ReplicaWatcher
+from .retry import CircuitBreaker, RetryPolicy
+from .search_index import KeySearchIndex
+from .singleflight import SingleFlight, request_key
+from .transport import PooledTransport
+from .tree import FolderTree, _build_path_index
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .disk_cache import DiskCache
+    from .snapshot import SecretSnapshot
+
+# Maximum number of keys the server returns from one /keys/bulk request
+BULK_MAX_KEYS = 500
+
+# Listing routes whose responses carry an ETag and are revalidated with If-None-Match
+REVALIDATED_ROUTES = frozenset(['/folders', '/folders/tree', '/keys'])
+
+# Seconds a revalidated response is kept; it is only reused after a 304
+VALIDATOR_TTL = 3600
+
+# Maximum number of changes of each kind the server returns from one /keys/changes request
+CHANGES_PAGE_SIZE = 500
+
 
 class KeyVaultError(Exception):
     """Base exception for Key Vault SDK errors"""
@@ -22,6 +58,183 @@ class KeyVaultNotFoundError(KeyVaultError):
     pass
 
 
+class KeyVaultUnavailableError(KeyVaultError):
+    """The API could not be reached (timeout, connection failure or server error)"""
+    pass
+
+
+class KeyVaultCircuitOpenError(KeyVaultUnavailableError):
+    """Request rejected without being sent because the circuit breaker is open"""
+    pass
+
+
+def _raise_for_status(status_code: int, text: str) -> None:
+    """
+    Raise the matching SDK exception for an error HTTP status
+    
+    Args:
+        status_code: HTTP status code of the response
+        text: Raw response body
+        
+    Raises:
+        KeyVaultAuthError: For 401 responses
+        KeyVaultNotFoundError: For 404 responses
+        KeyVaultUnavailableError: For 5xx responses
+        KeyVaultError: For any other 4xx response
+    """
+    if status_code == 401:
+        raise KeyVaultAuthError("Invalid API token or token expired")
+    elif status_code == 404:
+        raise KeyVaultNotFoundError("Resource not found")
+    elif status_code >= 400:
+        try:
+            error_data = json.loads(text)
+            error_msg = error_data.get('error', f'HTTP {status_code}')
+        except (ValueError, AttributeError):
+            error_msg = f'HTTP {status_code}: {text}'
+        if status_code >= 500:
+            raise KeyVaultUnavailableError(error_msg)
+        raise KeyVaultError(error_msg)
+
+
+def _split_path(path: str) -> List[str]:
+    """
+    Split a folder path like 'Project/Subfolder' into its non-empty parts
+    
+    Raises:
+        KeyVaultError: If the path is empty or not a string
+    """
+    if not path or not isinstance(path, str):
+        raise KeyVaultError("Path must be a non-empty string")
+
+    path_parts = [part.strip() for part in path.split('/') if part.strip()]
+    
+    if not path_parts:
+        raise KeyVaultError("Invalid path format")
+    
+    return path_parts
+
+
+def _server_path_params(path: str, environment: Optional[str], limit: int, offset: int) -> Dict[str, Any]:
+    """Build the query of a /keys/path request for a single folder's keys"""
+    params = {
+        'path': '/'.join(_split_path(path)),
+        'scope': 'folder',
+        'limit': min(limit, 100),
+        'offset': offset
+    }
+    if environment:
+        params['environment'] = environment.upper()
+    return params
+
+
+def _missing_path_part(index: Dict[str, Dict[str, Any]], path_parts: List[str]) -> str:
+    """Return the first part of a path that has no entry in a path index"""
+    prefix = path_parts[0].lower()
+    for part in path_parts[1:]:
+        prefix = f"{prefix}/{part.lower()}"
+        if prefix not in index:
+            return part
+    return path_parts[-1]
+
+
+def _traced(method: Callable) -> Callable:
+    """Decorator that reports a client method's latency to the on_call hooks"""
+    name = method.__name__
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self._hooks:
+            return method(self, *args, **kwargs)
+        
+        started = time.perf_counter()
+        error = None
+        try:
+            return method(self, *args, **kwargs)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._notify('on_call', {
+                'name': name,
+                'latency': time.perf_counter() - started,
+                'error': error
+            })
+    
+    return wrapper
+
+
+def _typed(convert: Callable[[Any, "KeyVault", Dict[str, Any]], Any]) -> Callable:
+    """
+    Decorator that adds a keyword-only ``typed`` flag returning model records
+    
+    The result is converted after the method (and any agent call) returned, so
+    agents and hooks keep exchanging plain dictionaries.
+    
+    Args:
+        convert: Function of (result, client, bound arguments) returning the typed result
+    """
+    def decorator(method: Callable) -> Callable:
+        signature = inspect.signature(method)
+        
+        @functools.wraps(method)
+        def wrapper(self, *args, typed: bool = False, **kwargs):
+            result = method(self, *args, **kwargs)
+            if not typed:
+                return result
+            return convert(result, self, signature.bind(self, *args, **kwargs).arguments)
+
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter('typed', inspect.Parameter.KEYWORD_ONLY, default=False, annotation=bool)
+        ])
+        return wrapper
+    
+    return decorator
+
+
+def _via_agent(method: Callable) -> Callable:
+    """
+    Decorator that forwards a client method to the local agent when one is configured
+    
+    If the agent cannot be reached the method runs in-process against the API.
+    """
+    signature = inspect.signature(method)
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        agent = self._agent
+        if agent is None:
+            return method(self, *args, **kwargs)
+        
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        arguments.pop('self')
+        if arguments.get('errors') is not None:
+            # Per-key errors are reported through a dict the caller owns
+            return method(self, *args, **kwargs)
+        
+        from .agent import AgentUnavailableError
+        try:
+            return agent.call(method.__name__, arguments)
+        except AgentUnavailableError:
+            return method(self, *args, **kwargs)
+    
+    return wrapper
+
+
+# Live clients, reset in the child process after a fork
+_clients: "weakref.WeakSet[KeyVault]" = weakref.WeakSet()
+
+
+def _reset_clients_after_fork() -> None:
+    for client in list(_clients):
+        client._after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_clients_after_fork)
+
+
 class KeyVault:
     """
     Key Vault SDK Client
@@ -31,7 +244,22 @@ class KeyVault:
     via the Key Vault web platform.
     """
     
-    def __init__(self, api_url: str, token: str, timeout: int = 30):
+    def __init__(self, api_url: str, token: str, timeout: int = 30,
+                 cache_ttl: Optional[float] = None, cache_size: int = 1000,
+                 max_workers: int = 8, path_cache_ttl: Optional[float] = 300,
+                 name_cache_ttl: Optional[float] = 300, max_staleness: float = 0,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 pool_connections: int = 10, pool_maxsize: Optional[int] = None,
+                 pool_block: bool = False, connect_timeout: Optional[float] = None,
+                 read_timeout: Optional[float] = None, keep_alive: bool = True,
+                 transport: Optional[PooledTransport] = None,
+                 coalesce_requests: bool = True,
+                 disk_cache: Optional["DiskCache"] = None,
+                 snapshot: Optional["SecretSnapshot"] = None,
+                 agent_socket: Optional[str] = None,
+                 hooks: Optional[List[Instrumentation]] = None,
+                 revalidate: bool = True, search_index_ttl: Optional[float] = None):
         """
         Initialize the Key Vault client
         
@@ -39,22 +267,189 @@ class KeyVault:
             api_url: Base URL of the Key Vault API (e.g., https://yourdomain.com/api)
             token: Your API token for authentication
             timeout: Request timeout in seconds (default: 30)
+            cache_ttl: If set, cache decrypted key values in memory for this many seconds
+            cache_size: Maximum number of cached key values (default: 1000)
+            max_workers: Thread pool size for parallel lookups (default: 8)
+            path_cache_ttl: Seconds to reuse a project's folder path index when resolving
+                            paths (default: 300, None or 0 to rebuild it on every call)
+            name_cache_ttl: Seconds to remember each folder's key name to ID mapping
+                            (default: 300, None or 0 to list the folder on every lookup)
+            max_staleness: Seconds past cache_ttl for which a cached value may still be
+                           served while the API is unreachable (default: 0, never)
+            retry_policy: Retry policy for idempotent requests (default: RetryPolicy(),
+                          3 retries with jittered backoff, timeouts not retried;
+                          RetryPolicy(max_retries=0) disables)
+            circuit_breaker: Optional CircuitBreaker that fails fast while the API is down
+            pool_connections: Number of per-host connection pools to keep (default: 10)
+            pool_maxsize: Connections kept open per host (default: max(10, max_workers))
+            pool_block: Wait for a free pooled connection instead of opening an extra
+                        one when the pool is exhausted (default: False)
+            connect_timeout: Seconds to wait for a connection (default: timeout)
+            read_timeout: Seconds to wait for a response once connected (default: timeout)
+            keep_alive: Reuse connections between requests (default: True); False sends
+                        'Connection: close' so every request opens a fresh connection
+            transport: PooledTransport shared with other clients; the pool_* arguments
+                       are ignored when it is given
+            coalesce_requests: Let concurrent identical GET requests share one HTTP
+                               call instead of each sending their own (default: True)
+            disk_cache: Optional DiskCache; the client starts warm from its snapshot and
+                        writes a new one on save_cache(), close() and each background refresh
+            snapshot: Optional SecretSnapshot; keys found in it are read from shared
+                      memory instead of the API, see create_snapshot()
+            agent_socket: Unix socket of a local key-vault-agent to answer lookups
+                          (default: $KEYVAULT_AGENT_SOCKET if set, '' to never use an agent);
+                          calls fall back to the API whenever the agent is unreachable
+            hooks: Instrumentation hooks notified around every HTTP attempt and SDK call,
+                   e.g. [MetricsCollector()]
+            revalidate: Keep the last folder and key listings with their ETags and ask the
+                        server with If-None-Match, so unchanged listings cost a bodyless 304
+            search_index_ttl: If set, answer search_keys() from a local index of key metadata,
+                              loaded from the change feed on the first search and brought up
+                              to date with one delta request once it is this many seconds old
+                              (servers without a change feed are searched as usual)
         """
         self.api_url = api_url.rstrip('/')
         self.token = token
         self.timeout = timeout
+        if connect_timeout is None and read_timeout is None:
+            self._request_timeout = timeout
+        else:
+            self._request_timeout = (
+                timeout if connect_timeout is None else connect_timeout,
+                timeout if read_timeout is None else read_timeout
+            )
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = PooledTransport(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize if pool_maxsize is not None else max(10, max_workers),
+                pool_block=pool_block
+            )
+        self.transport = transport
         self.session = requests.Session()
+        self.session.mount('https://', transport)
+        self.session.mount('http://', transport)
         self.session.headers.update({
             'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json',
             'User-Agent': f'KeyVault-Python-SDK/1.0.0'
         })
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
         self.permissions = None  # Cache for user permissions
+        self.cache = TTLCache(cache_ttl, cache_size) if cache_ttl else None  # Cache for key values
+        self.max_workers = max_workers
+        # Cache of {project name: {normalized path: folder}} for path resolution
+        self._path_index = TTLCache(path_cache_ttl, 256) if path_cache_ttl else None
+        # Cache of {folder ID: {key name: key ID}} filled from key listings
+        self._name_index = TTLCache(name_cache_ttl, 1024) if name_cache_ttl else None
+        self.max_staleness = max_staleness
+        self._refresher = None  # Background refresher, see start_refresher()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.circuit_breaker = circuit_breaker
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        # Cache of {request: (ETag, raw body)} for listings revalidated with If-None-Match
+        self._validators = TTLCache(VALIDATOR_TTL, 256) if revalidate else None
+        self.not_modified = 0  # Responses answered with 304 Not Modified
+        # Key metadata for local search, kept current from the change feed
+        self.search_index = KeySearchIndex() if search_index_ttl else None
+        self.search_index_ttl = search_index_ttl
+        self._search_index_lock = threading.RLock()
+        self._hooks: List[Instrumentation] = list(hooks or [])
+        self.snapshot = snapshot
+        self._server_path_lookup = True  # Cleared once the server proves too old for /keys/path
+        if agent_socket is None:
+            agent_socket = os.environ.get('KEYVAULT_AGENT_SOCKET')
+        self._agent = None
+        if agent_socket:
+            from .agent import AgentClient
+            self._agent = AgentClient(agent_socket, token, timeout=timeout)
+        self.disk_cache = disk_cache
+        if disk_cache is not None:
+            self.load_cache()
+        _clients.add(self)
+    
+    @staticmethod
+    def create_transport(pool_connections: int = 10, pool_maxsize: int = 10,
+                         pool_block: bool = False, tcp_keepalive: bool = True) -> PooledTransport:
+        """
+        Create a pooled transport that several clients can share
+        
+        Args:
+            pool_connections: Number of per-host connection pools to keep (default: 10)
+            pool_maxsize: Connections kept open per host (default: 10)
+            pool_block: Wait for a free connection when the pool is exhausted (default: False)
+            tcp_keepalive: Send TCP keep-alive probes on idle connections (default: True)
+            
+        Returns:
+            PooledTransport to pass as ``transport=`` to each KeyVault
+            
+        Example:
+            >>> transport = KeyVault.create_transport(pool_maxsize=32)
+            >>> kv_a = KeyVault(api_url="https://yourdomain.com/api", token="token-a", transport=transport)
+            >>> kv_b = KeyVault(api_url="https://yourdomain.com/api", token="token-b", transport=transport)
+        """
+        return PooledTransport(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            tcp_keepalive=tcp_keepalive
+        )
+    
+    def close(self) -> None:
+        """
+        Stop the background refresher, save the disk cache and release pooled connections
+        
+        A shared transport is left open for the other clients using it.
+        """
+        self.stop_refresher()
+        if self._agent is not None:
+            self._agent.close()
+        try:
+            if self.disk_cache is not None:
+                self.save_cache()
+        finally:
+            if not self._owns_transport:
+                # Session.close() would close every mounted adapter, including the shared one
+                self.session.adapters.clear()
+            self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def _after_fork(self) -> None:
+        """
+        Helper method to make a forked child's copy of the client usable
+        
+        Pooled sockets are dropped by the transport's own fork hook. Locks that
+        another parent thread may have held at fork time are replaced, and the
+        refresher thread, which does not survive a fork, is forgotten.
+        """
+        for cache in (self.cache, self._path_index, self._name_index):
+            if cache is not None:
+                cache._lock = threading.Lock()
+        if self.circuit_breaker is not None:
+            self.circuit_breaker._lock = threading.Lock()
+        if self._single_flight is not None:
+            self._single_flight = SingleFlight()
+        if self.search_index is not None:
+            self.search_index._lock = threading.Lock()
+        self._search_index_lock = threading.RLock()
+        if self._agent is not None:
+            from .agent import AgentClient
+            self._agent = AgentClient(self._agent.socket_path, self.token, timeout=self._agent.timeout)
+        self._refresher = None
     
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """
         Make an HTTP request to the Key Vault API
         
+        Concurrent identical GET requests are coalesced into a single HTTP call
+        unless the client was created with ``coalesce_requests=False``.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
@@ -67,107 +462,230 @@ class KeyVault:
             KeyVaultError: For API errors
             KeyVaultAuthError: For authentication errors
             KeyVaultNotFoundError: For not found errors
+            KeyVaultUnavailableError: When the API cannot be reached
+            KeyVaultCircuitOpenError: When the circuit breaker is open
         """
+        revalidate = (self._validators is not None and method.upper() == 'GET'
+                      and endpoint_template(endpoint) in REVALIDATED_ROUTES)
+        
+        if self._single_flight is None or method.upper() != 'GET':
+            return self._send_request(method, endpoint, revalidate=revalidate, **kwargs)
+        
+        return self._single_flight.do(
+            request_key(method, endpoint, kwargs),
+            lambda: self._send_request(method, endpoint, revalidate=revalidate, **kwargs)
+        )
+    
+    def _send_request(self, method: str, endpoint: str, revalidate: bool = False,
+                      **kwargs) -> Dict[str, Any]:
+        """Helper method to send one request, with retries and the circuit breaker"""
         # Fix URL construction to preserve the /api path
         if endpoint.startswith('/'):
             url = self.api_url + endpoint
         else:
             url = self.api_url + '/' + endpoint
         
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                timeout=self.timeout,
-                **kwargs
-            )
+        validator_key = request_key(method, endpoint, kwargs) if revalidate else None
+        validator = self._validators.get(validator_key) if revalidate else None
+        if validator is not None:
+            kwargs['headers'] = dict(kwargs.get('headers') or {}, **{'If-None-Match': validator[0]})
+        
+        policy = self.retry_policy if self.retry_policy.allows(method) else None
+        attempt = 0
+        
+        while True:
+            # Fail fast instead of waiting out the timeout while the API is down
+            if self.circuit_breaker is not None and not self.circuit_breaker.allow_request():
+                raise KeyVaultCircuitOpenError("Circuit breaker is open: Key Vault API unavailable")
             
-            # Handle different response status codes
-            if response.status_code == 401:
-                raise KeyVaultAuthError("Invalid API token or token expired")
-            elif response.status_code == 404:
-                raise KeyVaultNotFoundError("Resource not found")
-            elif response.status_code >= 400:
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get('error', f'HTTP {response.status_code}')
-                except:
-                    error_msg = f'HTTP {response.status_code}: {response.text}'
-                raise KeyVaultError(error_msg)
+            retry_after = None
+            event = None
+            if self._hooks:
+                event = {
+                    'method': method,
+                    'endpoint': endpoint,
+                    'route': endpoint_template(endpoint),
+                    'params': kwargs.get('params'),
+                    'attempt': attempt
+                }
+                self._notify('before_request', event)
+                started = time.perf_counter()
             
-            # Parse JSON response
             try:
-                return response.json()
-            except ValueError:
-                raise KeyVaultError(f"Invalid JSON response: {response.text}")
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    timeout=self._request_timeout,
+                    **kwargs
+                )
+            except requests.exceptions.Timeout:
+                error = KeyVaultUnavailableError("Request timeout")
+                if policy is not None and not policy.retry_timeouts:
+                    policy = None  # This attempt already waited out the full timeout
+            except requests.exceptions.ConnectionError:
+                error = KeyVaultUnavailableError("Connection error")
+            except requests.exceptions.RequestException as e:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+                error = KeyVaultError(f"Request failed: {str(e)}")
+                if event is not None:
+                    self._notify_after(event, started, None, error)
+                raise error
+            else:
+                error = None
+                if event is not None:
+                    self._notify_after(event, started, response, None)
+                if self.circuit_breaker is not None:
+                    if response.status_code >= 500:
+                        self.circuit_breaker.record_failure()
+                    else:
+                        self.circuit_breaker.record_success()
+                
+                if (policy is None or attempt >= policy.max_retries
+                        or not policy.should_retry_status(response.status_code)):
+                    if validator is not None and response.status_code == 304:
+                        self.not_modified += 1
+                        self._validators.set(validator_key, validator)
+                        return json.loads(validator[1])
+                    
+                    result = self._handle_response(response)
+                    etag = response.headers.get('ETag') if revalidate else None
+                    if etag:
+                        self._validators.set(validator_key, (etag, response.content))
+                    return result
                 
-        except requests.exceptions.Timeout:
-            raise KeyVaultError("Request timeout")
-        except requests.exceptions.ConnectionError:
-            raise KeyVaultError("Connection error")
-        except requests.exceptions.RequestException as e:
-            raise KeyVaultError(f"Request failed: {str(e)}")
+                retry_after = policy.parse_retry_after(response.headers.get('Retry-After'))
+            
+            if error is not None:
+                if event is not None:
+                    self._notify_after(event, started, None, error)
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+                if policy is None or attempt >= policy.max_retries:
+                    raise error
+            
+            time.sleep(policy.get_backoff(attempt, retry_after))
+            attempt += 1
     
-    def list_keys(self, folder_id: str, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+    def _notify(self, callback: str, event: Dict[str, Any]) -> None:
+        """Helper method to pass an event to every hook that implements the callback"""
+        for hook in list(self._hooks):
+            handler = getattr(hook, callback, None)
+            if handler is None:
+                continue
+            try:
+                handler(event)
+            except Exception:
+                # A broken hook must never break the request it observes
+                pass
+    
+    def _notify_after(self, event: Dict[str, Any], started: float,
+                      response: Optional[requests.Response], error: Optional[Exception]) -> None:
+        """Helper method to complete a request event and pass it to the after_request hooks"""
+        event['latency'] = time.perf_counter() - started
+        event['status'] = response.status_code if response is not None else None
+        event['bytes'] = len(response.content) if response is not None else 0
+        event['error'] = error
+        self._notify('after_request', event)
+    
+    def add_hook(self, hook: Instrumentation) -> None:
         """
-        List keys in a folder
+        Register an instrumentation hook
         
         Args:
-            folder_id: Folder ID to list keys from
-            limit: Number of keys to return (default: 20, max: 100)
-            offset: Number of keys to skip (default: 0)
-            
-        Returns:
-            Dictionary containing keys list and pagination info
+            hook: Object implementing any of before_request, after_request and on_call
             
         Example:
-            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
-            >>> result = kv.list_keys(folder_id="folder-123", limit=50)
-            >>> print(f"Found {len(result['keys'])} keys")
+            >>> from key_vault_sdk import MetricsCollector
+            >>> metrics = MetricsCollector()
+            >>> kv.add_hook(metrics)
         """
-        params = {
-            'folderId': folder_id,
-            'limit': min(limit, 100),  # Cap at 100
-            'offset': offset
-        }
-        
-        response = self._make_request('GET', '/keys', params=params)
-        
-        if not response.get('success', True):
-            raise KeyVaultError(response.get('error', 'Failed to list keys'))
+        self._hooks.append(hook)
+    
+    def remove_hook(self, hook: Instrumentation) -> None:
+        """Unregister an instrumentation hook added with add_hook() or hooks="""
+        self._hooks.remove(hook)
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool usage
         
+        Returns:
+            Dictionary with the per-host pool size and, for each host pool, its idle
+            connections, connections opened so far and requests sent
+        """
+        manager = self.transport.poolmanager
+        pools = []
+        for pool_key in manager.pools.keys():
+            pool = manager.pools.get(pool_key)
+            if pool is None:
+                continue
+            pools.append({
+                'host': pool.host,
+                'port': pool.port,
+                'scheme': pool.scheme,
+                # The queue is padded with None placeholders for connections not yet opened
+                'idle': sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool is not None else 0,
+                'connections_opened': pool.num_connections,
+                'requests': pool.num_requests
+            })
         return {
-            'keys': response.get('keys', []),
-            'total': response.get('total', 0),
-            'limit': response.get('limit', limit),
-            'offset': response.get('offset', offset)
+            'maxsize': self.transport._pool_maxsize,
+            'block': self.transport._pool_block,
+            'pools': pools
         }
     
-    def get_key(self, key_id: str, include_value: bool = False) -> Dict[str, Any]:
+    def metrics(self) -> Dict[str, Any]:
         """
-        Get a key by ID
+        Get the client's internal counters
         
-        Args:
-            key_id: The key's ID
-            include_value: If True, include the decrypted key value
-            
         Returns:
-            Key object with metadata and optionally the value
+            Dictionary with cache statistics (values, paths, key names and listing
+            validators), the number of 304 Not Modified responses, the number of
+            coalesced requests, the circuit breaker state and pool usage
             
         Example:
-            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
-            >>> key = kv.get_key(key_id="key-123", include_value=True)
-            >>> print(f"Key: {key['name']}, Value: {key['value']}")
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token", cache_ttl=60)
+            >>> print(kv.metrics()['cache']['values']['hit_rate'])
         """
-        params = {'includeValue': str(include_value).lower()}
+        def cache_stats(cache):
+            return cache.stats() if cache is not None else {}
         
-        response = self._make_request('GET', f'/keys/{key_id}', params=params)
+        return {
+            'cache': {
+                'values': cache_stats(self.cache),
+                'paths': cache_stats(self._path_index),
+                'names': cache_stats(self._name_index),
+                'validators': cache_stats(self._validators)
+            },
+            'search_index': len(self.search_index) if self.search_index is not None else None,
+            'not_modified': self.not_modified,
+            'coalesced': self._single_flight.shared if self._single_flight is not None else 0,
+            'circuit_breaker': self.circuit_breaker.state if self.circuit_breaker is not None else None,
+            'pool': self.pool_stats()
+        }
+    
+    def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
+        """
+        Helper method to turn an HTTP response into a dictionary or an SDK exception
         
-        if not response.get('success', True):
-            raise KeyVaultError(response.get('error', 'Failed to fetch key'))
+        Args:
+            response: The HTTP response
+            
+        Returns:
+            API response as dictionary
+        """
+        # Handle different response status codes
+        _raise_for_status(response.status_code, response.text)
         
-        return response.get('key', {})
+        # Parse JSON response
+        try:
+            return response.json()
+        except ValueError:
+            raise KeyVaultError(f"Invalid JSON response: {response.text}")
     
+    @_traced
+    @_via_agent
     def get_key_by_name(self, folder_id: str, key_name: str) -> str:
         """
         Get a key's value by name (convenience method)
@@ -184,63 +702,451 @@ class KeyVault:
             >>> api_key = kv.get_key_by_name(folder_id="folder-123", key_name="stripe-secret-key")
             >>> print(f"API Key: {api_key}")
         """
-        # First, list keys to find the one we want
-        result = self.list_keys(folder_id=folder_id, limit=100)
-        
-        # Find the key by name
-        key = next((k for k in result['keys'] if k['name'] == key_name), None)
-        
-        if not key:
+        # Resolve the ID from the name index, listing the folder only on a miss
+        key_id = self._find_keys_by_name(folder_id, [key_name]).get(key_name)
+
+        if not key_id:
             raise KeyVaultNotFoundError(f"Key '{key_name}' not found in folder")
-        
+
         # Get the key with value
-        key_with_value = self.get_key(key_id=key['id'], include_value=True)
-        
-        return key_with_value.get('value', '')
-    
-    def get_multiple_keys(self, folder_id: str, key_names: List[str]) -> Dict[str, str]:
+        value = self._get_named_value(folder_id, key_name, key_id)
+
+        if value is None:
+            raise KeyVaultNotFoundError(f"Key '{key_name}' not found in folder")
+
+        return value
+
+    @_traced
+    @_via_agent
+    def get_multiple_keys(self, folder_id: str, key_names: List[str],
+                          parallel: bool = False, max_workers: Optional[int] = None,
+                          errors: Optional[Dict[str, Exception]] = None) -> Dict[str, str]:
         """
         Get multiple keys by name
-        
+
         Args:
             folder_id: Folder containing the keys
             key_names: List of key names to retrieve
-            
+            parallel: If True, fetch the values concurrently on a thread pool
+            max_workers: Thread pool size for this call (default: the client's max_workers)
+            errors: Optional dictionary that receives per-key exceptions in parallel mode;
+                    failed keys are then returned as None instead of raising
+
         Returns:
             Dictionary mapping key names to their values
-            
+
         Example:
             >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
             >>> keys = kv.get_multiple_keys(
-            ...     folder_id="folder-123", 
+            ...     folder_id="folder-123",
             ...     key_names=["stripe-key", "database-password", "api-secret"]
             ... )
             >>> print(f"Retrieved {len(keys)} keys")
         """
-        # Get all keys from the folder
-        result = self.list_keys(folder_id=folder_id, limit=100)
-        folder_keys = {k['name']: k for k in result['keys']}
-        
+        # Resolve IDs from the name index, listing the folder only for misses
+        key_ids = self._find_keys_by_name(folder_id, key_names)
+
+        if parallel:
+            return self._get_values_parallel(folder_id, key_ids, key_names, max_workers, errors)
+
         # Get values for requested keys
         keys_dict = {}
         for key_name in key_names:
-            if key_name in folder_keys:
-                key_with_value = self.get_key(
-                    key_id=folder_keys[key_name]['id'], 
-                    include_value=True
-                )
-                keys_dict[key_name] = key_with_value.get('value', '')
+            if key_name in key_ids:
+                keys_dict[key_name] = self._get_named_value(folder_id, key_name, key_ids[key_name])
             else:
                 keys_dict[key_name] = None  # Key not found
+
+        return keys_dict
+
+    def _find_keys_by_name(self, folder_id: str, key_names: List[str]) -> Dict[str, str]:
+        """
+        Helper method to look up key IDs by name
+
+        Names are answered from the folder's name index first; the folder is only
+        listed for the remaining names, stopping once all of them are found.
+
+        Args:
+            folder_id: Folder containing the keys
+            key_names: Names of the keys to find
+
+        Returns:
+            Dictionary mapping the names that were found to their key IDs
+        """
+        key_ids = {}
+        if self.snapshot is not None:
+            for name in key_names:
+                key = self.snapshot.get_by_name(folder_id, name)
+                if key is not None:
+                    key_ids[name] = key['id']
+
+        index = self._name_index.get(folder_id) if self._name_index is not None else None
+        if index:
+            key_ids.update((name, index[name]) for name in key_names if name in index and name not in key_ids)
+
+        missing = set(key_names) - set(key_ids)
+        if not missing:
+            return key_ids
+
+        for key in self.iter_keys(folder_id):
+            if key['name'] in missing:
+                key_ids[key['name']] = key['id']
+                missing.discard(key['name'])
+                if not missing:
+                    break
+
+        return key_ids
+
+    def _get_named_value(self, folder_id: str, key_name: str, key_id: str) -> Optional[str]:
+        """
+        Helper method to fetch a key's value, guarding against a stale name index
+
+        If the key was deleted or renamed since it was indexed, the index entry is
+        dropped and the folder is listed again to find the current key.
+
+        Returns:
+            The decrypted value, or None if no key with that name exists anymore
+        """
+        try:
+            key = self.get_key(key_id=key_id, include_value=True)
+            if key.get('name', key_name) == key_name:
+                return key.get('value', '')
+        except KeyVaultNotFoundError:
+            pass
+
+        self._forget_key_name(folder_id, key_name)
+        self.invalidate(key_id)
+
+        key = next((k for k in self.iter_keys(folder_id) if k['name'] == key_name), None)
+        if key is None:
+            return None
+        return self.get_key(key_id=key['id'], include_value=True).get('value', '')
+
+    def _get_values_parallel(self, folder_id: str, key_ids: Dict[str, str], key_names: List[str],
+                             max_workers: Optional[int] = None,
+                             errors: Optional[Dict[str, Exception]] = None) -> Dict[str, str]:
+        """
+        Helper method to fetch key values concurrently over the shared session
+
+        Args:
+            folder_id: Folder containing the keys
+            key_ids: Mapping of key names to key IDs
+            key_names: Names of the keys to fetch
+            max_workers: Thread pool size (default: the client's max_workers)
+            errors: Optional dictionary that receives per-key exceptions
+
+        Returns:
+            Dictionary mapping key names to their values (None if missing or failed)
+        """
+        keys_dict = {name: None for name in key_names}
+        wanted = [name for name in keys_dict if name in key_ids]
+
+        if not wanted:
+            return keys_dict
+
+        # Load permissions once up front instead of racing to load them in every worker
+        if self.permissions is None:
+            self.load_permissions()
+
+        def fetch(name):
+            return self._get_named_value(folder_id, name, key_ids[name])
+
+        workers = min(max_workers or self.max_workers, len(wanted))
+        failures = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {name: executor.submit(fetch, name) for name in wanted}
+            for name, future in futures.items():
+                try:
+                    keys_dict[name] = future.result()
+                except Exception as e:
+                    failures[name] = e
+
+        if failures:
+            if errors is None:
+                # Without an errors dict, behave like the sequential mode and raise
+                raise next(iter(failures.values()))
+            errors.update(failures)
+
+        return keys_dict
+
+    def _remember_key_names(self, folder_id: str, keys: List[Dict[str, Any]]) -> None:
+        """
+        Helper method to add listed keys to the folder's name index
+
+        Args:
+            folder_id: Folder the keys were listed from
+            keys: Key objects from a listing response
+        """
+        if self._name_index is None or not keys:
+            return
+
+        index = dict(self._name_index.get(folder_id) or {})
+        for key in keys:
+            index.setdefault(key['name'], key['id'])
+        self._name_index.set(folder_id, index)
+
+    def _forget_key_name(self, folder_id: str, key_name: str) -> None:
+        """Helper method to drop one stale entry from a folder's name index"""
+        if self._name_index is None:
+            return
+
+        index = self._name_index.get(folder_id)
+        if index and key_name in index:
+            index = dict(index)
+            del index[key_name]
+            self._name_index.set(folder_id, index)
+
+    def warm_name_index(self, folder_ids: List[str]) -> Dict[str, int]:
+        """
+        Pre-load the name index for a set of folders (e.g., at startup)
+
+        Args:
+            folder_ids: Folders whose keys should be indexed by name
+
+        Returns:
+            Dictionary mapping each folder ID to the number of keys indexed
+
+        Example:
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
+            >>> kv.warm_name_index(["folder-123", "folder-456"])
+            >>> api_key = kv.get_key_by_name("folder-123", "stripe-secret-key")  # one request
+        """
+        if self._name_index is None:
+            raise KeyVaultError("Name index is disabled (name_cache_ttl is not set)")
+
+        if self.permissions is None:
+            self.load_permissions()
+
+        def index_folder(folder_id):
+            # Drop the old entry so keys deleted since the last listing disappear
+            self._name_index.invalidate(folder_id)
+            return sum(1 for _ in self.iter_keys(folder_id))
+
+        workers = max(1, min(self.max_workers, len(folder_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            counts = list(executor.map(index_folder, folder_ids))
+
+        return dict(zip(folder_ids, counts))
+
+    @_traced
+    @_via_agent
+    def get_values_bulk(self, folder_id: Optional[str] = None, key_ids: Optional[List[str]] = None,
+                        environment: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get many keys with their decrypted values in a single request
+        
+        Args:
+            folder_id: Fetch every key in this folder
+            key_ids: Fetch these keys (combined with folder_id if both are given)
+            environment: Filter by environment (DEVELOPMENT, STAGING, PRODUCTION, etc.)
+            
+        Returns:
+            Dictionary containing the keys (each with its 'value'), the total count,
+            and whether the server truncated the result
+            
+        Raises:
+            KeyVaultError: If neither folder_id nor key_ids is given
+            
+        Example:
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
+            >>> result = kv.get_values_bulk(folder_id="folder-123")
+            >>> env = {key['name']: key['value'] for key in result['keys']}
+        """
+        if not folder_id and not key_ids:
+            raise KeyVaultError("Either folder_id or key_ids is required")
+        
+        # Check permission before making request
+        if not self.has_permission('keys:read'):
+            raise KeyVaultError("Insufficient permissions: keys:read required")
+        
+        params = {}
+        if folder_id:
+            params['folderId'] = folder_id
+        if environment:
+            params['environment'] = environment.upper()
+        
+        # The server caps each request, so long ID lists are sent in chunks
+        chunks = [key_ids[i:i + BULK_MAX_KEYS] for i in range(0, len(key_ids), BULK_MAX_KEYS)] \
+            if key_ids else [None]
+        
+        keys = []
+        truncated = False
+        try:
+            for chunk in chunks:
+                chunk_params = dict(params)
+                if chunk:
+                    chunk_params['ids'] = ','.join(chunk)
+                
+                response = self._make_request('GET', '/keys/bulk', params=chunk_params)
+                
+                if not response.get('success', True):
+                    raise KeyVaultError(response.get('error', 'Failed to fetch keys'))
+                
+                keys.extend(response.get('keys', []))
+                truncated = truncated or response.get('truncated', False)
+        except KeyVaultNotFoundError:
+            # Older servers have no bulk route; fall back to one request per key
+            keys = self._get_values_individually(folder_id, key_ids, environment)
+        
+        if self.cache is not None:
+            for key in keys:
+                if 'value' in key:
+                    self.cache.set(key['id'], dict(key))
+        if folder_id and not key_ids and not environment and not truncated:
+            self._remember_key_names(folder_id, keys)
+        
+        return {
+            'keys': keys,
+            'total': len(keys),
+            'truncated': truncated
+        }
+
+    def _get_values_individually(self, folder_id: Optional[str], key_ids: Optional[List[str]],
+                                 environment: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Helper method that emulates the bulk route with one request per key
+        
+        Like the bulk route, every key is fetched from the API; the value cache
+        and snapshot are bypassed so refreshes see current values.
+        
+        Returns:
+            List of key objects with their values
+        """
+        if key_ids:
+            ids = list(key_ids)
+        else:
+            ids = [key['id'] for key in self.iter_keys(folder_id)]
+        
+        if not ids:
+            return []
+        
+        def fetch(key_id):
+            try:
+                response = self._make_request('GET', f'/keys/{key_id}', params={'includeValue': 'true'})
+            except KeyVaultNotFoundError:
+                return None
+            if not response.get('success', True):
+                raise KeyVaultError(response.get('error', 'Failed to fetch key'))
+            return response.get('key') or None
+        
+        workers = min(self.max_workers, len(ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            keys = [key for key in executor.map(fetch, ids) if key]
+        
+        if environment:
+            keys = [key for key in keys if (key.get('environment') or '').upper() == environment.upper()]
+        
+        return keys
+
+    @_typed(lambda keys, kv, args: iter_typed_keys(keys, kv, args['folder_id']))
+    def iter_keys(self, folder_id: str, page_size: int = 100,
+                  prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every key in a folder, fetching pages lazily
+        
+        Args:
+            folder_id: Folder ID to list keys from
+            page_size: Number of keys to request per page (default: 100, max: 100)
+            prefetch: If True, fetch the next page in the background while the
+                      current one is being consumed
+            typed: If True (keyword-only), yield Key records instead of dictionaries
+            
+        Yields:
+            Key objects (without values)
+            
+        Example:
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
+            >>> for key in kv.iter_keys(folder_id="folder-123", prefetch=True):
+            ...     print(key['name'])
+        """
+        page_size = min(page_size, 100)
+        return self._iter_pages(
+            lambda offset: self.list_keys(folder_id=folder_id, limit=page_size, offset=offset),
+            page_size,
+            prefetch
+        )
+
+    @_typed(lambda keys, kv, args: iter_typed_keys(keys, kv))
+    def iter_search(self, search: str, key_type: Optional[str] = None,
+                    favorite: Optional[bool] = None, page_size: int = 100,
+                    prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every search result, fetching pages lazily
+        
+        Args:
+            search: Search term
+            key_type: Filter by key type (e.g., 'API_KEY', 'PASSWORD')
+            favorite: Filter by favorite status
+            page_size: Number of keys to request per page (default: 100)
+            prefetch: If True, fetch the next page in the background while the
+                      current one is being consumed
+            typed: If True (keyword-only), yield Key records instead of dictionaries
+            
+        Yields:
+            Key objects matching the search
+            
+        Example:
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
+            >>> for key in kv.iter_search("database", key_type="PASSWORD"):
+            ...     print(key['name'])
+        """
+        return self._iter_pages(
+            lambda offset: self.search_keys(search, key_type=key_type, favorite=favorite,
+                                            limit=page_size, offset=offset),
+            page_size,
+            prefetch
+        )
+
+    def _iter_pages(self, fetch_page: Callable[[int], Dict[str, Any]], page_size: int,
+                    prefetch: bool) -> Iterator[Dict[str, Any]]:
+        """
+        Helper generator that walks an offset-paginated listing
+        
+        Args:
+            fetch_page: Function returning the page at a given offset
+            page_size: Number of keys requested per page
+            prefetch: If True, request the next page before yielding the current one
+            
+        Yields:
+            Items from the 'keys' list of each page
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        offset = 0
         
-        return keys_dict
+        try:
+            page = fetch_page(offset)
+            while True:
+                keys = page.get('keys', [])
+                if not keys:
+                    return
+                
+                offset += len(keys)
+                total = page.get('total', 0)
+                has_more = offset < total if total else len(keys) >= page_size
+                
+                next_page = None
+                if has_more and executor is not None:
+                    next_page = executor.submit(fetch_page, offset)
+                
+                yield from keys
+                
+                if not has_more:
+                    return
+                page = next_page.result() if next_page is not None else fetch_page(offset)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
 
+    @_typed(lambda result, kv, args: typed_folders(result))
+    @_traced
+    @_via_agent
     def list_folders(self, project_id: Optional[str] = None) -> Dict[str, Any]:
         """
         List all folders with hierarchical structure
         
         Args:
             project_id: If provided, only return folders within this project
+            typed: If True (keyword-only), return Folder records instead of dictionaries
             
         Returns:
             Dictionary containing folders list with hierarchical structure
@@ -262,10 +1168,16 @@ class KeyVault:
             'folders': response.get('folders', [])
         }
 
+    @_typed(lambda projects, kv, args: typed_projects(projects))
+    @_traced
+    @_via_agent
     def list_projects(self) -> List[Dict[str, Any]]:
         """
         List only root folders (projects)
         
+        Args:
+            typed: If True (keyword-only), return Project records instead of dictionaries
+            
         Returns:
             List of project folders
             
@@ -278,41 +1190,27 @@ class KeyVault:
         response = self._make_request('GET', '/folders')
         return response.get('folders', [])
 
-    def get_folder(self, folder_id: str) -> Dict[str, Any]:
-        """
-        Get a specific folder with its contents
-        
-        Args:
-            folder_id: The folder's ID
-            
-        Returns:
-            Dictionary containing folder object and its keys
-            
-        Example:
-            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
-            >>> folder_data = kv.get_folder(folder_id="folder-123")
-            >>> print(f"Folder: {folder_data['folder']['name']}")
-            >>> print(f"Contains {len(folder_data['keys'])} keys")
-        """
-        response = self._make_request('GET', f'/folders/{folder_id}')
-        
-        return {
-            'folder': response.get('folder', {}),
-            'keys': response.get('keys', [])
-        }
-
+    @_typed(lambda result, kv, args: typed_keys(result, kv))
+    @_traced
+    @_via_agent
     def search_keys(self, search: str, key_type: Optional[str] = None, 
                    favorite: Optional[bool] = None, limit: int = 20, 
                    offset: int = 0) -> Dict[str, Any]:
         """
         Search for keys across all folders
         
+        Keys match when the term appears in their name or description (ignoring
+        case) or equals one of their tags. If the client was created with
+        search_index_ttl, the search is answered from the local search index,
+        unless the server has no change feed to build it from.
+        
         Args:
             search: Search term
             key_type: Filter by key type (e.g., 'API_KEY', 'PASSWORD')
             favorite: Filter by favorite status
             limit: Number of keys to return (default: 20)
             offset: Number of keys to skip (default: 0)
+            typed: If True (keyword-only), return Key records instead of dictionaries
             
         Returns:
             Dictionary containing search results and pagination info
@@ -322,6 +1220,12 @@ class KeyVault:
             >>> results = kv.search_keys(search="database", key_type="PASSWORD")
             >>> print(f"Found {len(results['keys'])} database passwords")
         """
+        index = self.search_index
+        if index is not None and self._refresh_search_index_if_stale(index):
+            # Answered from memory; at most one small delta request when the index has aged
+            return index.search(search, key_type=key_type, favorite=favorite,
+                                limit=limit, offset=offset)
+        
         params = {
             'search': search,
             'limit': limit,
@@ -342,6 +1246,8 @@ class KeyVault:
             'offset': response.get('offset', offset)
         }
 
+    @_traced
+    @_via_agent
     def get_stats(self) -> Dict[str, Any]:
         """
         Get folder and key statistics
@@ -358,7 +1264,8 @@ class KeyVault:
         response = self._make_request('GET', '/stats')
         return response.get('stats', {})
 
-    def navigate_folder_tree(self, project_id: str) -> Dict[str, Any]:
+    @_traced
+    def navigate_folder_tree(self, project_id: str) -> FolderTree:
         """
         Navigate through folder tree structure (convenience method)
         
@@ -366,53 +1273,23 @@ class KeyVault:
             project_id: The project ID to navigate
             
         Returns:
-            Dictionary with folder tree and navigation helpers
+            FolderTree indexing the project's folders by ID, name and path. It is
+            also a dictionary with 'folders', 'find_folder_by_name' and 'get_folder_path'
             
         Example:
             >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
             >>> tree = kv.navigate_folder_tree(project_id="project-123")
             >>> # Print folder structure
-            >>> def print_tree(folders, level=0):
-            ...     for folder in folders:
-            ...         print("  " * level + f"📁 {folder['name']}")
-            ...         if folder.get('children'):
-            ...             print_tree(folder['children'], level + 1)
-            >>> print_tree(tree['folders'])
+            >>> for folder in tree.walk():
+            ...     print(f"📁 {tree.path_of(folder['id'])}")
+            >>> payments = tree.find_folder_by_path("MyApp/Production/Payments")
+            >>> print(tree.parent(payments['id'])['name'])
         """
         folders = self.list_folders(project_id=project_id)
-        
-        def find_folder_by_name(folder_list, name):
-            """Find a folder by name in the tree"""
-            for folder in folder_list:
-                if folder['name'] == name:
-                    return folder
-                if folder.get('children'):
-                    found = find_folder_by_name(folder['children'], name)
-                    if found:
-                        return found
-            return None
-        
-        def get_folder_path(folder_list, target_id, path=None):
-            """Get the path to a folder"""
-            if path is None:
-                path = []
-            
-            for folder in folder_list:
-                current_path = path + [folder]
-                if folder['id'] == target_id:
-                    return current_path
-                if folder.get('children'):
-                    found_path = get_folder_path(folder['children'], target_id, current_path)
-                    if found_path:
-                        return found_path
-            return None
-        
-        return {
-            'folders': folders['folders'],
-            'find_folder_by_name': lambda name: find_folder_by_name(folders['folders'], name),
-            'get_folder_path': lambda folder_id: get_folder_path(folders['folders'], folder_id)
-        }
+        return FolderTree(folders['folders'])
     
+    @_traced
+    @_via_agent
     def test_connection(self) -> bool:
         """
         Test the connection to the Key Vault API
@@ -436,6 +1313,8 @@ class KeyVault:
 
     # RBAC Methods
 
+    @_traced
+    @_via_agent
     def load_permissions(self) -> List[str]:
         """
         Load user permissions from the server
@@ -443,6 +1322,9 @@ class KeyVault:
         Returns:
             List of permission strings
             
+        Raises:
+            KeyVaultUnavailableError: If the API cannot be reached
+            
         Example:
             >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
             >>> permissions = kv.load_permissions()
@@ -456,11 +1338,16 @@ class KeyVault:
             else:
                 self.permissions = set()
                 return []
+        except KeyVaultUnavailableError:
+            # Don't cache an empty permission set because of a transient outage
+            raise
         except Exception as e:
             print(f"Warning: Failed to load permissions: {e}")
             self.permissions = set()
             return []
 
+    @_traced
+    @_via_agent
     def has_permission(self, permission: str) -> bool:
         """
         Check if user has a specific permission
@@ -482,6 +1369,8 @@ class KeyVault:
             self.load_permissions()
         return permission in self.permissions or '*' in self.permissions
 
+    @_traced
+    @_via_agent
     def has_any_permission(self, permissions: List[str]) -> bool:
         """
         Check if user has any of the specified permissions
@@ -501,6 +1390,8 @@ class KeyVault:
             self.load_permissions()
         return any(p in self.permissions or '*' in self.permissions for p in permissions)
 
+    @_traced
+    @_via_agent
     def has_all_permissions(self, permissions: List[str]) -> bool:
         """
         Check if user has all of the specified permissions
@@ -520,6 +1411,8 @@ class KeyVault:
             self.load_permissions()
         return all(p in self.permissions or '*' in self.permissions for p in permissions)
 
+    @_traced
+    @_via_agent
     def get_permissions(self) -> List[str]:
         """
         Get user's current permissions
@@ -537,6 +1430,8 @@ class KeyVault:
             self.load_permissions()
         return list(self.permissions)
 
+    @_traced
+    @_via_agent
     def get_roles(self) -> List[Dict[str, Any]]:
         """
         Get user's roles
@@ -553,6 +1448,9 @@ class KeyVault:
         response = self._make_request('GET', '/auth/roles')
         return response.get('roles', [])
 
+    @_typed(lambda result, kv, args: typed_keys(result, kv, args['folder_id']))
+    @_traced
+    @_via_agent
     def list_keys(self, folder_id: str, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
         """
         List keys in a folder (with RBAC permission check)
@@ -561,6 +1459,7 @@ class KeyVault:
             folder_id: Folder ID to list keys from
             limit: Number of keys to return (default: 20, max: 100)
             offset: Number of keys to skip (default: 0)
+            typed: If True (keyword-only), return Key records instead of dictionaries
             
         Returns:
             Dictionary containing keys list and pagination info
@@ -588,6 +1487,11 @@ class KeyVault:
         if not response.get('success', True):
             raise KeyVaultError(response.get('error', 'Failed to list keys'))
         
+        self._remember_key_names(folder_id, response.get('keys', []))
+        if self.search_index is not None:
+            self.search_index.apply(dict(key, folderId=key.get('folderId', folder_id))
+                                    for key in response.get('keys', []))
+        
         return {
             'keys': response.get('keys', []),
             'total': response.get('total', 0),
@@ -595,6 +1499,8 @@ class KeyVault:
             'offset': response.get('offset', offset)
         }
 
+    @_traced
+    @_via_agent
     def get_key(self, key_id: str, include_value: bool = False) -> Dict[str, Any]:
         """
         Get a key by ID (with RBAC permission check)
@@ -614,19 +1520,510 @@ class KeyVault:
             >>> key = kv.get_key(key_id="key-123", include_value=True)
             >>> print(f"Key: {key['name']}, Value: {key['value']}")
         """
+        # Keys in a shared snapshot are read straight from memory
+        if self.snapshot is not None:
+            key = self.snapshot.get(key_id)
+            if key is not None:
+                if not include_value:
+                    key.pop('value', None)
+                return key
+
+        # Serve decrypted values from the cache when enabled
+        if include_value and self.cache is not None:
+            cached = self.cache.get(key_id)
+            if cached is not None:
+                return dict(cached)
+
+            # Keys kept warm by the refresher never wait on the network, even if stale
+            if self._refresher is not None and self._refresher.covers(key_id):
+                stale = self.cache.get_stale(key_id, self.max_staleness)
+                if stale is not None:
+                    return dict(stale)
+
         # Check permission before making request
         if not self.has_permission('keys:read'):
             raise KeyVaultError("Insufficient permissions: keys:read required")
 
         params = {'includeValue': str(include_value).lower()}
         
-        response = self._make_request('GET', f'/keys/{key_id}', params=params)
+        try:
+            response = self._make_request('GET', f'/keys/{key_id}', params=params)
+        except KeyVaultUnavailableError:
+            # Fall back to the last known value while the API is unreachable
+            if include_value and self.cache is not None:
+                stale = self.cache.get_stale(key_id, self.max_staleness)
+                if stale is not None:
+                    return dict(stale)
+            raise
         
         if not response.get('success', True):
             raise KeyVaultError(response.get('error', 'Failed to fetch key'))
         
-        return response.get('key', {})
+        key = response.get('key', {})
+        if include_value and self.cache is not None and 'value' in key:
+            self.cache.set(key_id, dict(key))
+        
+        return key
+
+    def start_refresher(self, key_ids: Optional[List[str]] = None, paths: Optional[List[str]] = None,
+                        interval: Optional[float] = None) -> BackgroundRefresher:
+        """
+        Keep a set of keys and paths warm by refreshing them on a background thread
+        
+        The values are loaded once before this method returns and then re-fetched
+        every ``interval`` seconds, ahead of their cache expiry. If the API becomes
+        unreachable, the last known values are served for up to ``max_staleness``
+        seconds past their expiry.
+        
+        Args:
+            key_ids: Key IDs to keep warm
+            paths: Folder paths like 'MyApp/Production' whose keys are kept warm
+            interval: Seconds between refreshes (default: half of cache_ttl)
+            
+        Returns:
+            The running BackgroundRefresher; call register() on it to add more keys
+            
+        Raises:
+            KeyVaultError: If caching is disabled or the initial load fails
+            
+        Example:
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token",
+            ...               cache_ttl=60, max_staleness=3600)
+            >>> kv.start_refresher(paths=["MyApp/Production"])
+            >>> key = kv.get_key("key-123", include_value=True)  # always served from memory
+        """
+        if self.cache is None:
+            raise KeyVaultError("The refresher requires the value cache (set cache_ttl)")
+        
+        if self._refresher is None:
+            self._refresher = BackgroundRefresher(self, interval or self.cache.ttl / 2)
+        elif interval:
+            self._refresher.interval = interval
+        
+        self._refresher.register(key_ids=key_ids, paths=paths)
+        self._refresher.refresh()
+        self._refresher.start()
+        
+        return self._refresher
+
+    def create_snapshot(self, key_ids: Optional[List[str]] = None,
+                        folder_ids: Optional[List[str]] = None,
+                        paths: Optional[List[str]] = None,
+                        path: Optional[str] = None) -> "SecretSnapshot":
+        """
+        Load keys once and share them with forked worker processes
+        
+        The values are written to a read-only memory-mapped snapshot that this
+        client reads first from then on. Call it in the parent process before the
+        workers fork: they inherit the mapping, share its memory pages and never
+        ask the API for these keys. Pooled connections are not shared; each child
+        opens its own.
+        
+        Args:
+            key_ids: Key IDs to include
+            folder_ids: Folder IDs whose keys are included
+            paths: Folder paths like 'MyApp/Production' whose keys are included
+            path: Optional file for the snapshot, so unrelated processes can map it
+                  with SecretSnapshot.open(); by default an unlinked file in
+                  /dev/shm is used that only this process and its children can read
+            
+        Returns:
+            The new SecretSnapshot (also set as ``kv.snapshot``)
+            
+        Example:
+            >>> # gunicorn.conf.py, with preload_app = True
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
+            >>> kv.create_snapshot(paths=["MyApp/Production"])
+            >>> # Workers forked from here read kv.get_key_by_name(...) from shared memory
+        """
+        from .snapshot import SecretSnapshot
+
+        keys: Dict[str, Dict[str, Any]] = {}
+        if key_ids:
+            for key in self.get_values_bulk(key_ids=key_ids)['keys']:
+                keys[key['id']] = key
+
+        folder_ids = list(folder_ids or [])
+        for folder_path in paths or []:
+            folder_ids.append(self._resolve_path_to_folder(folder_path)['id'])
+        for folder_id in folder_ids:
+            result = self.get_values_bulk(folder_id=folder_id)
+            if result.get('truncated'):
+                raise KeyVaultError(
+                    f"Folder {folder_id} has more than {BULK_MAX_KEYS} keys; list key_ids explicitly"
+                )
+            for key in result['keys']:
+                keys[key['id']] = key
+
+        previous = self.snapshot
+        self.snapshot = SecretSnapshot.create(keys.values(), path=path)
+        if previous is not None:
+            previous.close()
+        return self.snapshot
+
+    def load_manifest(self, manifest: Union[str, "os.PathLike[str]", Dict[str, Any]],
+                      plan_cache: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        Load every secret an application needs from a declarative manifest
+
+        Each distinct folder path is resolved once and each folder is searched
+        once, concurrently; then all values are fetched with one bulk request. If
+        any secret cannot be found, nothing is fetched and a single
+        KeyVaultManifestError lists every failure.
+
+        With plan_cache, the resolved key and folder IDs (never values) are saved
+        to that file, and later loads of the same manifest go straight to the bulk
+        fetch. Entries whose key was deleted, renamed or moved are resolved again
+        and the plan is rewritten. Optional entries that were missing are
+        remembered as missing; delete the plan file to look for them again.
+
+        Args:
+            manifest: Path to a .json, .yaml/.yml or .toml manifest, or a parsed dictionary
+            plan_cache: Optional file where the resolved ID plan is cached
+
+        Returns:
+            Dictionary mapping each manifest alias to its value (None for missing
+            optional entries)
+
+        Raises:
+            KeyVaultManifestError: If the manifest is invalid or required secrets are missing
+
+        Example:
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
+            >>> secrets = kv.load_manifest("keyvault.yaml", plan_cache=".keyvault-plan.json")
+            >>> os.environ.update(secrets)
+        """
+        from .manifest import load_manifest
+
+        return load_manifest(self, manifest, plan_cache=plan_cache)
+
+    def stop_refresher(self) -> None:
+        """
+        Stop the background refresher started by start_refresher()
+        
+        Example:
+            >>> kv.stop_refresher()
+        """
+        if self._refresher is not None:
+            self._refresher.stop()
+            self._refresher = None
+
+    def sync(self, replica: KeyReplica) -> Dict[str, Any]:
+        """
+        Bring a local replica up to date using the server's change feed
+        
+        Only keys created, updated or deleted since the replica's last sync are
+        transferred; values are fetched in bulk for the changed keys alone. The
+        first sync of an empty replica loads every key in its scope. Changed keys
+        are also refreshed in (or dropped from) this client's caches.
+        
+        Args:
+            replica: The replica to update
+            
+        Returns:
+            Dictionary with the number of 'updated' and 'deleted' keys and the new 'cursor'
+            
+        Raises:
+            KeyVaultNotFoundError: If the replica's folder or project doesn't exist, or the
+                                   server has no change feed
+            
+        Example:
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
+            >>> replica = KeyReplica(project_id="project-123")
+            >>> kv.sync(replica)  # full load
+            >>> kv.sync(replica)  # only what changed since
+            >>> db_password = replica.get_by_name("folder-123", "DATABASE_PASSWORD")['value']
+        """
+        if not self.has_permission('keys:read'):
+            raise KeyVaultError("Insufficient permissions: keys:read required")
+        
+        updated_count = 0
+        deleted_count = 0
+        for response in self._iter_changes(replica.cursor, replica.folder_id, replica.project_id):
+            updated = response.get('updated', [])
+            deleted = [change['id'] for change in response.get('deleted', [])]
+            
+            # Keys deleted after the feed was read are missing here; their
+            # deletion is reported by a later page or sync
+            values = {}
+            if updated:
+                result = self.get_values_bulk(key_ids=[key['id'] for key in updated])
+                values = {key['id']: key.get('value') for key in result['keys']}
+            records = [dict(key, value=values[key['id']]) for key in updated if key['id'] in values]
+            
+            previous = replica.apply(records, deleted, response.get('cursor'))
+            
+            for old in previous:
+                if old.get('folderId'):
+                    self._forget_key_name(old['folderId'], old['name'])
+            for key in records:
+                if key.get('folderId'):
+                    self._remember_key_names(key['folderId'], [key])
+            if self.cache is not None:
+                for key_id in deleted:
+                    self.cache.invalidate(key_id)
+            if self.search_index is not None:
+                self.search_index.apply(updated, deleted)
+            
+            updated_count += len(records)
+            deleted_count += len(deleted)
+        
+        return {'updated': updated_count, 'deleted': deleted_count, 'cursor': replica.cursor}
+
+    def _iter_changes(self, cursor: Optional[str], folder_id: Optional[str] = None,
+                      project_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Helper generator that pages through the change feed
+        
+        Args:
+            cursor: Feed position to start from (None for a full load)
+            folder_id: Only report changes in this folder
+            project_id: Only report changes in this project and its subfolders
+            
+        Yields:
+            Change feed responses, until one reports no more changes
+        """
+        while True:
+            params = {'limit': CHANGES_PAGE_SIZE}
+            if cursor:
+                params['cursor'] = cursor
+            if folder_id:
+                params['folderId'] = folder_id
+            if project_id:
+                params['projectId'] = project_id
+            
+            response = self._make_request('GET', '/keys/changes', params=params)
+            
+            if not response.get('success', True):
+                raise KeyVaultError(response.get('error', 'Failed to fetch key changes'))
+            
+            yield response
+            
+            cursor = response.get('cursor') or cursor
+            if not response.get('hasMore'):
+                return
+
+    def refresh_search_index(self) -> Dict[str, Any]:
+        """
+        Bring the local search index up to date from the change feed
+        
+        The first refresh loads the metadata of every key the token can read;
+        later ones only transfer keys changed since the previous refresh. No
+        values are fetched. search_keys() calls this on its own once the index
+        is older than search_index_ttl.
+        
+        Returns:
+            Dictionary with the number of 'updated' and 'deleted' keys and the new 'cursor'
+            
+        Raises:
+            KeyVaultError: If the client was created without search_index_ttl
+            KeyVaultNotFoundError: If the server has no change feed; the index is then
+                                   disabled and search_keys() asks the server instead
+            
+        Example:
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token",
+            ...               search_index_ttl=30)
+            >>> kv.refresh_search_index()  # e.g. at startup, before the first search
+        """
+        if self.search_index is None:
+            raise KeyVaultError("Search index is disabled (search_index_ttl is not set)")
+        
+        if not self.has_permission('keys:read'):
+            raise KeyVaultError("Insufficient permissions: keys:read required")
+        
+        index = self.search_index
+        updated_count = 0
+        deleted_count = 0
+        with self._search_index_lock:
+            try:
+                for response in self._iter_changes(index.cursor):
+                    updated = response.get('updated', [])
+                    deleted = [change['id'] for change in response.get('deleted', [])]
+                    index.apply(updated, deleted, response.get('cursor'))
+                    updated_count += len(updated)
+                    deleted_count += len(deleted)
+            except KeyVaultNotFoundError:
+                # Older servers have no change feed, so the index can't be kept
+                # complete; searches go to the server from now on
+                self.search_index = None
+                raise
+        
+        return {'updated': updated_count, 'deleted': deleted_count, 'cursor': index.cursor}
+
+    def _refresh_search_index_if_stale(self, index: KeySearchIndex) -> bool:
+        """
+        Helper method that refreshes the search index once it is older than its TTL
+        
+        Returns:
+            True if the index can answer searches, False if the server has no change feed
+        """
+        last_sync = index.last_sync
+        if last_sync is not None and time.time() - last_sync < self.search_index_ttl:
+            return True
+        
+        with self._search_index_lock:
+            # Another thread may have refreshed (or disabled) it while this one waited
+            if self.search_index is not index:
+                return False
+            last_sync = index.last_sync
+            if last_sync is not None and time.time() - last_sync < self.search_index_ttl:
+                return True
+            try:
+                self.refresh_search_index()
+            except KeyVaultNotFoundError:
+                return False
+        return True
+
+    def watch(self, replica: KeyReplica, interval: float = 30,
+              on_change: Optional[Callable[[Dict[str, Any]], None]] = None) -> ReplicaWatcher:
+        """
+        Keep a replica up to date by syncing it on a background thread
+        
+        The replica is synced once before this method returns, then every
+        ``interval`` seconds.
+        
+        Args:
+            replica: The replica to keep current
+            interval: Seconds between syncs (default: 30)
+            on_change: Called with the sync summary after each sync that changed keys
+            
+        Returns:
+            The running ReplicaWatcher; call stop() on it to stop syncing
+            
+        Example:
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
+            >>> replica = KeyReplica(folder_id="folder-123")
+            >>> watcher = kv.watch(replica, interval=10,
+            ...                    on_change=lambda s: print(f"{s['updated']} keys changed"))
+            >>> api_key = replica.get_by_name("folder-123", "STRIPE_KEY")['value']
+            >>> watcher.stop()
+        """
+        watcher = ReplicaWatcher(self, replica, interval, on_change)
+        watcher.sync()
+        watcher.start()
+        return watcher
+
+    def invalidate(self, key_id: str) -> bool:
+        """
+        Drop a key's cached value so the next lookup fetches it from the server
+        
+        Args:
+            key_id: The key's ID
+            
+        Returns:
+            True if a cached value was removed
+            
+        Example:
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token", cache_ttl=60)
+            >>> kv.invalidate("key-123")
+        """
+        if self.cache is None:
+            return False
+        return self.cache.invalidate(key_id)
+
+    def clear_cache(self) -> None:
+        """
+        Drop all cached key values
+        
+        Example:
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token", cache_ttl=60)
+            >>> kv.clear_cache()
+        """
+        if self.cache is not None:
+            self.cache.clear()
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get value cache statistics
+        
+        Returns:
+            Dictionary with hits, misses, hit_rate, size, maxsize and ttl
+            (empty if caching is disabled)
+            
+        Example:
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token", cache_ttl=60)
+            >>> stats = kv.cache_stats()
+            >>> print(f"Hit rate: {stats['hit_rate']:.0%}")
+        """
+        if self.cache is None:
+            return {}
+        return self.cache.stats()
+
+    def _cache_owner(self) -> str:
+        """Fingerprint of the API URL and token a disk snapshot belongs to"""
+        return hashlib.sha256(f"{self.api_url}\n{self.token}".encode('utf-8')).hexdigest()
+
+    def save_cache(self) -> None:
+        """
+        Write the client's caches to the disk cache
+        
+        Saves cached key values, resolved folder paths, key name to ID maps and
+        permissions, so the next process using the same disk cache starts warm.
+        
+        Raises:
+            KeyVaultError: If no disk cache is configured or the file cannot be written
+            
+        Example:
+            >>> from key_vault_sdk import DiskCache
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token", cache_ttl=300,
+            ...               disk_cache=DiskCache("/var/cache/myapp/vault.bin", key=cache_key))
+            >>> kv.save_cache()
+        """
+        if self.disk_cache is None:
+            raise KeyVaultError("No disk cache configured")
+
+        def entries(cache):
+            return [list(entry) for entry in cache.entries()] if cache is not None else []
+
+        snapshot = {
+            'owner': self._cache_owner(),
+            'saved_at': time.time(),
+            'permissions': sorted(self.permissions) if self.permissions is not None else None,
+            'values': entries(self.cache),
+            'paths': entries(self._path_index),
+            'names': entries(self._name_index)
+        }
+        try:
+            self.disk_cache.save(snapshot)
+        except OSError as e:
+            raise KeyVaultError(f"Failed to write cache file: {str(e)}")
+
+    def load_cache(self) -> bool:
+        """
+        Fill the client's caches from the disk cache
+        
+        Called automatically when the client is created with a disk cache. Entries
+        keep the expiry they had when saved; expired values can still be served
+        while the API is down within ``max_staleness``. A snapshot written for a
+        different API URL or token is ignored.
+        
+        Returns:
+            True if a snapshot was loaded
+        """
+        if self.disk_cache is None:
+            return False
 
+        snapshot = self.disk_cache.load()
+        if snapshot is None or snapshot.get('owner') != self._cache_owner():
+            return False
+
+        elapsed = max(time.time() - snapshot.get('saved_at', 0), 0.0)
+
+        def restore(cache, entries):
+            if cache is None:
+                return
+            for key, value, expires_in in entries or []:
+                cache.set(key, value, ttl=expires_in - elapsed)
+
+        restore(self.cache, snapshot.get('values'))
+        restore(self._path_index, snapshot.get('paths'))
+        restore(self._name_index, snapshot.get('names'))
+        if self.permissions is None and snapshot.get('permissions') is not None:
+            self.permissions = set(snapshot['permissions'])
+        return True
+
+    @_traced
+    @_via_agent
     def get_folder(self, folder_id: str) -> Dict[str, Any]:
         """
         Get a specific folder with its contents (with RBAC permission check)
@@ -657,6 +2054,8 @@ class KeyVault:
             'keys': response.get('keys', [])
         }
 
+    @_traced
+    @_via_agent
     def get_keys_by_path(self, path: str, environment: Optional[str] = None, 
                          limit: int = 100, offset: int = 0) -> Dict[str, Any]:
         """
@@ -669,7 +2068,8 @@ class KeyVault:
             offset: Number of keys to skip (default: 0)
             
         Returns:
-            Dictionary containing keys, total count, folder info, and path
+            Dictionary containing the keys (metadata only, without values), total
+            count, folder info, and path
             
         Raises:
             KeyVaultError: If path not found or other errors
@@ -680,6 +2080,11 @@ class KeyVault:
             >>> print(f"Found {len(result['keys'])} keys in {result['path']}")
         """
         try:
+            # Resolve the path and list its keys in one round trip when the server supports it
+            result = self._get_keys_by_server_path(path, environment, limit, offset)
+            if result is not None:
+                return result
+            
             # Parse the path and find the target folder
             target_folder = self._resolve_path_to_folder(path)
             
@@ -702,6 +2107,9 @@ class KeyVault:
             if not response.get('success', True):
                 raise KeyVaultError(response.get('error', 'Failed to fetch keys'))
 
+            if not environment:
+                self._remember_key_names(target_folder['id'], response.get('keys', []))
+
             return {
                 'keys': response.get('keys', []),
                 'total': response.get('total', 0),
@@ -712,6 +2120,46 @@ class KeyVault:
         except Exception as e:
             raise KeyVaultError(f"Failed to get keys by path '{path}': {str(e)}")
 
+    def _get_keys_by_server_path(self, path: str, environment: Optional[str],
+                                 limit: int, offset: int) -> Optional[Dict[str, Any]]:
+        """
+        Helper method to resolve a path and list its keys through /keys/path
+        
+        Returns:
+            Same as get_keys_by_path, or None if the caller should resolve the path
+            itself (older server, or a folder the endpoint can't see)
+        """
+        if not self._server_path_lookup:
+            return None
+
+        try:
+            response = self._make_request(
+                'GET', '/keys/path', params=_server_path_params(path, environment, limit, offset)
+            )
+        except KeyVaultNotFoundError:
+            # The path doesn't exist or the route can't see it; resolve just this
+            # one client-side, which raises if it really doesn't exist
+            return None
+
+        if response.get('scope') != 'folder':
+            # Servers before scope support ignore scope, paging and environment;
+            # resolve client-side from now on
+            self._server_path_lookup = False
+            return None
+
+        folder = response['folder']
+        keys = response.get('keys', [])
+        if not environment:
+            self._remember_key_names(folder['id'], keys)
+
+        return {
+            'keys': keys,
+            'total': response.get('total', len(keys)),
+            'folder': folder,
+            'path': path
+        }
+
+    @_traced
     def _resolve_path_to_folder(self, path: str) -> Optional[Dict[str, Any]]:
         """
         Helper method to resolve a path to a folder object
@@ -720,74 +2168,88 @@ class KeyVault:
             path: Path like 'ProjectName/Subfolder/SubSubfolder'
             
         Returns:
-            Folder object or None if not found
+            Folder object
+            
+        Raises:
+            KeyVaultNotFoundError: If the project or a folder on the path doesn't exist
         """
-        if not path or not isinstance(path, str):
-            raise KeyVaultError("Path must be a non-empty string")
-
-        path_parts = [part.strip() for part in path.split('/') if part.strip()]
-        
-        if not path_parts:
-            raise KeyVaultError("Invalid path format")
+        path_parts = _split_path(path)
+        path_key = '/'.join(part.lower() for part in path_parts)
 
         try:
-            # First, get all projects to find the root project
-            projects = self.list_projects()
-            root_project = next((p for p in projects if 
-                               p['name'].lower() == path_parts[0].lower()), None)
-
-            if not root_project:
-                raise KeyVaultError(f"Project not found: {path_parts[0]}")
+            index, cached = self._get_path_index(path_parts[0])
+            folder = index.get(path_key)
 
-            # If it's just a project name, return the project
-            if len(path_parts) == 1:
-                return root_project
+            if folder is None and cached:
+                # The cached tree may predate the folder; rebuild it once before giving up
+                index, _ = self._get_path_index(path_parts[0], refresh=True)
+                folder = index.get(path_key)
 
-            # Navigate through the path to find the target folder
-            current_folder = root_project
-            
-            for i in range(1, len(path_parts)):
-                part = path_parts[i]
-                
-                # Get subfolders of current folder
-                folders_data = self.list_folders(project_id=root_project['id'])
-                
-                # Find the next folder in the path
-                next_folder = self._find_folder_in_tree(folders_data.get('folders', []), part)
-                
-                if not next_folder:
-                    raise KeyVaultError(f"Subfolder not found: {part} in path {path}")
-                
-                current_folder = next_folder
+            if folder is None:
+                missing = _missing_path_part(index, path_parts)
+                raise KeyVaultNotFoundError(f"Subfolder not found: {missing} in path {path}")
 
-            return current_folder
+            return folder
 
+        except KeyVaultNotFoundError as e:
+            raise KeyVaultNotFoundError(f"Path resolution failed: {str(e)}")
         except Exception as e:
             raise KeyVaultError(f"Path resolution failed: {str(e)}")
 
-    def _find_folder_in_tree(self, folders: List[Dict[str, Any]], folder_name: str) -> Optional[Dict[str, Any]]:
+    @_traced
+    def _get_path_index(self, project_name: str, refresh: bool = False):
         """
-        Helper method to find a folder by name in a folder tree
+        Helper method to get the path index of a project
         
         Args:
-            folders: Array of folders to search in
-            folder_name: Name of the folder to find
+            project_name: Name of the project (case-insensitive)
+            refresh: If True, ignore the cached index and rebuild it
             
         Returns:
-            Found folder or None
+            Tuple of (path index, whether it came from the cache)
         """
-        for folder in folders:
-            if folder['name'].lower() == folder_name.lower():
-                return folder
-            
-            # Search in children recursively
-            if 'children' in folder and folder['children']:
-                found = self._find_folder_in_tree(folder['children'], folder_name)
-                if found:
-                    return found
+        project_key = project_name.lower()
+
+        if self._path_index is not None and not refresh:
+            index = self._path_index.get(project_key)
+            if index is not None:
+                return index, True
+
+        projects = self.list_projects()
+        root_project = next((p for p in projects if
+                           p['name'].strip().lower() == project_key), None)
+
+        if not root_project:
+            raise KeyVaultNotFoundError(f"Project not found: {project_name}")
+
+        folders_data = self.list_folders(project_id=root_project['id'])
+        index = _build_path_index(root_project, folders_data.get('folders', []))
+
+        if self._path_index is not None:
+            self._path_index.set(project_key, index)
+
+        return index, False
+
+    def refresh_paths(self, project_name: Optional[str] = None) -> None:
+        """
+        Drop cached folder paths so the next path lookup refetches the tree
         
-        return None
+        Args:
+            project_name: Only drop this project's paths (default: all projects)
+            
+        Example:
+            >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
+            >>> kv.refresh_paths("MyApp")
+        """
+        if self._path_index is None:
+            return
+        if project_name is None:
+            self._path_index.clear()
+        else:
+            self._path_index.invalidate(project_name.strip().lower())
 
+    @_traced
+    @_via_agent
     def get_project_keys(self, project_name: str, environment: Optional[str] = None, 
                         limit: int = 100, offset: int = 0) -> Dict[str, Any]:
         """
@@ -804,6 +2266,8 @@ class KeyVault:
         """
         return self.get_keys_by_path(project_name, environment, limit, offset)
 
+    @_traced
+    @_via_agent
     def get_environment_keys(self, project_name: str, environment: str, 
                            limit: int = 100, offset: int = 0) -> Dict[str, Any]:
         """
@@ -0,0 +1,136 @@
+"""
+Key Vault Disk Cache - Encrypted on-disk snapshot of the client's caches
+
+Requires the optional ``cryptography`` dependency:
+    pip install amay-key-vault-sdk[persistent]
+"""
+
+import json
+import os
+import tempfile
+import zlib
+from typing import Any, Dict, Optional, Union
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # pragma: no cover - optional dependency
+    Fernet = None
+    InvalidToken = None
+
+from .client import KeyVaultError
+
+# File header; bump the version when the payload layout changes
+MAGIC = b'KVC1'
+
+
+class DiskCache:
+    """
+    Encrypted file holding a snapshot of a client's caches
+
+    The snapshot (resolved paths, key name to ID maps, cached key values and
+    permissions) is stored as zlib-compressed JSON inside a Fernet token
+    (AES-128-CBC with an HMAC-SHA256 tag), so the whole file is read and
+    decrypted in one go. Files are written atomically with owner-only permissions.
+
+    A file that is missing, corrupt, written with a different key or older than
+    ``max_age`` is ignored, and the client simply starts cold.
+    """
+
+    def __init__(self, path: str, key: Union[str, bytes], max_age: Optional[float] = None):
+        """
+        Initialize the disk cache
+
+        Args:
+            path: File the snapshot is stored in
+            key: Fernet key supplied by the application, see DiskCache.generate_key()
+            max_age: Ignore snapshots older than this many seconds (default: no limit)
+
+        Raises:
+            KeyVaultError: If cryptography is not installed or the key is not a valid Fernet key
+        """
+        if Fernet is None:
+            raise KeyVaultError(
+                "DiskCache requires cryptography. Install it with: pip install amay-key-vault-sdk[persistent]"
+            )
+
+        self.path = os.path.expanduser(path)
+        self.max_age = max_age
+        try:
+            self._fernet = Fernet(key)
+        except (TypeError, ValueError):
+            raise KeyVaultError("Invalid cache key: use DiskCache.generate_key() to create one")
+
+    @staticmethod
+    def generate_key() -> str:
+        """
+        Generate a new random key for encrypting the cache file
+
+        Returns:
+            URL-safe base64 encoded 32-byte key; keep it in your secret store
+        """
+        if Fernet is None:
+            raise KeyVaultError(
+                "DiskCache requires cryptography. Install it with: pip install amay-key-vault-sdk[persistent]"
+            )
+        return Fernet.generate_key().decode('ascii')
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Read and decrypt the snapshot
+
+        Returns:
+            The snapshot dictionary, or None if there is no usable snapshot
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        if not data.startswith(MAGIC):
+            return None
+
+        ttl = int(self.max_age) if self.max_age is not None else None
+        try:
+            payload = self._fernet.decrypt(data[len(MAGIC):], ttl=ttl)
+            snapshot = json.loads(zlib.decompress(payload))
+        except (InvalidToken, zlib.error, ValueError):
+            return None
+
+        return snapshot if isinstance(snapshot, dict) else None
+
+    def save(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Encrypt and write the snapshot, replacing the previous file atomically
+
+        Args:
+            snapshot: JSON-serializable snapshot dictionary
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        payload = zlib.compress(json.dumps(snapshot, separators=(',', ':')).encode('utf-8'))
+        data = MAGIC + self._fernet.encrypt(payload)
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='.kvcache-', dir=directory)  # Created with mode 0600
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def clear(self) -> None:
+        """Delete the snapshot file if it exists"""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
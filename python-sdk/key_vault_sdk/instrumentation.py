@@ -0,0 +1,176 @@
+"""
+Key Vault Instrumentation - Request hooks and a built-in metrics collector
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List
+
+# Path segments under /keys and /folders that are routes rather than IDs
+_STATIC_SEGMENTS = frozenset(['bulk', 'path', 'tree', 'changes'])
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Replace IDs in an endpoint path with placeholders
+
+    Args:
+        endpoint: Endpoint like '/keys/ck123abc'
+
+    Returns:
+        Template like '/keys/{id}', suitable as a low-cardinality metric label
+    """
+    parts = endpoint.split('?', 1)[0].strip('/').split('/')
+    for i in range(1, len(parts)):
+        if parts[i - 1] in ('keys', 'folders') and parts[i] not in _STATIC_SEGMENTS:
+            parts[i] = '{id}'
+    return '/' + '/'.join(parts)
+
+
+class Instrumentation:
+    """
+    Base class for instrumentation hooks
+
+    Subclass it, override the callbacks you need and pass instances to
+    ``KeyVault(hooks=[...])`` or ``kv.add_hook()``. Callbacks run synchronously on
+    the calling thread, so keep them fast; exceptions raised by a hook are ignored.
+
+    Request events are dictionaries with:
+        method, endpoint, route (endpoint template), params, attempt (0 for the
+        first try) and, in after_request, status (None if no response arrived),
+        latency (seconds), bytes (response body size) and error (exception or None).
+
+    Call events are dictionaries with:
+        name (SDK method), latency (seconds) and error (exception or None).
+    """
+
+    def before_request(self, event: Dict[str, Any]) -> None:
+        """Called before each HTTP attempt, including retries"""
+
+    def after_request(self, event: Dict[str, Any]) -> None:
+        """Called after each HTTP attempt, whether it succeeded or not"""
+
+    def on_call(self, event: Dict[str, Any]) -> None:
+        """Called when an instrumented SDK method returns or raises"""
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(fraction * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+class _Series:
+    """Latency samples and counters for one request route or SDK method"""
+
+    __slots__ = ('count', 'errors', 'bytes', 'retries', 'statuses', 'samples')
+
+    def __init__(self, max_samples: int):
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+        self.retries = 0
+        self.statuses: Dict[str, int] = {}
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+
+    def summary(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'p50': _percentile(ordered, 0.50),
+            'p95': _percentile(ordered, 0.95),
+            'p99': _percentile(ordered, 0.99),
+            'max': ordered[-1] if ordered else 0.0
+        }
+
+
+class MetricsCollector(Instrumentation):
+    """
+    Built-in hook that aggregates latency percentiles and counters
+
+    Requests are grouped by method and endpoint template (e.g. 'GET /keys/{id}'),
+    SDK calls by method name (e.g. '_resolve_path_to_folder'). Percentiles are
+    computed over the most recent ``max_samples`` observations of each group.
+
+    Example:
+        >>> metrics = MetricsCollector()
+        >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token", hooks=[metrics])
+        >>> kv.get_keys_by_path("MyApp/Production")
+        >>> print(metrics.snapshot()['calls']['get_keys_by_path']['p95'])
+    """
+
+    def __init__(self, max_samples: int = 1024):
+        """
+        Initialize the collector
+
+        Args:
+            max_samples: Latency samples kept per group (default: 1024)
+        """
+        if max_samples <= 0:
+            raise ValueError("max_samples must be greater than 0")
+
+        self.max_samples = max_samples
+        self._requests: Dict[str, _Series] = {}
+        self._calls: Dict[str, _Series] = {}
+        self._lock = threading.Lock()
+
+    def _series(self, groups: Dict[str, _Series], name: str) -> _Series:
+        series = groups.get(name)
+        if series is None:
+            series = groups[name] = _Series(self.max_samples)
+        return series
+
+    def after_request(self, event: Dict[str, Any]) -> None:
+        name = f"{event['method']} {event['route']}"
+        status = event.get('status')
+        with self._lock:
+            series = self._series(self._requests, name)
+            series.count += 1
+            series.samples.append(event['latency'])
+            series.bytes += event.get('bytes') or 0
+            if event.get('attempt'):
+                series.retries += 1
+            if event.get('error') is not None or (status is not None and status >= 400):
+                series.errors += 1
+            label = str(status) if status is not None else 'error'
+            series.statuses[label] = series.statuses.get(label, 0) + 1
+
+    def on_call(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            series = self._series(self._calls, event['name'])
+            series.count += 1
+            series.samples.append(event['latency'])
+            if event.get('error') is not None:
+                series.errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the aggregated metrics
+
+        Returns:
+            Dictionary with 'requests' (per 'METHOD /route': count, errors, retries,
+            bytes, statuses and p50/p95/p99/max latency in seconds) and 'calls'
+            (per SDK method: count, errors and p50/p95/p99/max latency)
+        """
+        with self._lock:
+            requests = {}
+            for name, series in self._requests.items():
+                summary = series.summary()
+                summary.update({
+                    'retries': series.retries,
+                    'bytes': series.bytes,
+                    'statuses': dict(series.statuses)
+                })
+                requests[name] = summary
+            calls = {name: series.summary() for name, series in self._calls.items()}
+        return {'requests': requests, 'calls': calls}
+
+    def reset(self) -> None:
+        """Discard all collected metrics"""
+        with self._lock:
+            self._requests.clear()
+            self._calls.clear()
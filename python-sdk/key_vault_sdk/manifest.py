@@ -0,0 +1,308 @@
+"""
+Key Vault Manifest - Declarative list of the secrets an application loads at boot
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+
+from .client import KeyVaultError, KeyVaultNotFoundError, _split_path
+
+PLAN_VERSION = 1
+
+
+class KeyVaultManifestError(KeyVaultError):
+    """Raised when a manifest is invalid or some of its secrets could not be loaded"""
+
+    def __init__(self, message: str, errors: Optional[Dict[str, Exception]] = None):
+        super().__init__(message)
+        self.errors = errors or {}
+
+
+class ManifestEntry:
+    """One secret of a manifest: where to find it and whether it may be missing"""
+
+    __slots__ = ('alias', 'path', 'name', 'optional')
+
+    def __init__(self, alias: str, path: str, name: str, optional: bool = False):
+        self.alias = alias
+        self.path = path
+        self.name = name
+        self.optional = optional
+
+    def __repr__(self) -> str:
+        return f"ManifestEntry({self.alias!r}, {self.path!r}, {self.name!r}, optional={self.optional})"
+
+
+def _read_file(path: str) -> Dict[str, Any]:
+    """Parse a manifest file according to its extension"""
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    if extension in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise KeyVaultError(
+                "YAML manifests require PyYAML. Install it with: pip install amay-key-vault-sdk[manifest]"
+            )
+        with open(path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f) or {}
+
+    if extension == '.toml':
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise KeyVaultError(
+                    "TOML manifests require tomli on Python < 3.11. "
+                    "Install it with: pip install amay-key-vault-sdk[manifest]"
+                )
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+
+    raise KeyVaultError(f"Unsupported manifest format: {path} (use .json, .yaml, .yml or .toml)")
+
+
+def parse_manifest(source: Union[str, "os.PathLike[str]", Dict[str, Any]]) -> Dict[str, ManifestEntry]:
+    """
+    Read and validate a manifest
+
+    A manifest has a 'secrets' table mapping the names the application uses to the
+    keys in the vault, either as a 'Path/To/Folder/KEY_NAME' string or as a table
+    with 'path', 'name' and an optional 'optional' flag:
+
+        secrets:
+          DATABASE_URL: MyApp/Production/DATABASE_URL
+          STRIPE_KEY:
+            path: MyApp/Production/Payments
+            name: STRIPE_SECRET_KEY
+          SENTRY_DSN:
+            path: MyApp/Production
+            name: SENTRY_DSN
+            optional: true
+
+    Args:
+        source: Path to a .json, .yaml/.yml or .toml file, or an already parsed dictionary
+
+    Returns:
+        Dictionary mapping each alias to its ManifestEntry, in manifest order
+
+    Raises:
+        KeyVaultManifestError: If the manifest is malformed (all problems are reported at once)
+    """
+    data = source if isinstance(source, dict) else _read_file(os.fspath(source))
+
+    secrets = data.get('secrets') if isinstance(data, dict) else None
+    if not isinstance(secrets, dict) or not secrets:
+        raise KeyVaultManifestError("Manifest must contain a non-empty 'secrets' table")
+
+    entries: Dict[str, ManifestEntry] = {}
+    errors: Dict[str, Exception] = {}
+    for alias, spec in secrets.items():
+        try:
+            if isinstance(spec, str):
+                parts = _split_path(spec)
+                if len(parts) < 2:
+                    raise KeyVaultError(f"Expected 'Folder/Path/KEY_NAME', got {spec!r}")
+                entries[alias] = ManifestEntry(alias, '/'.join(parts[:-1]), parts[-1])
+            elif isinstance(spec, dict):
+                unknown = set(spec) - {'path', 'name', 'optional'}
+                if unknown:
+                    raise KeyVaultError(f"Unknown field(s): {', '.join(sorted(unknown))}")
+                if not isinstance(spec.get('name'), str) or not spec['name'].strip():
+                    raise KeyVaultError("'name' is required")
+                path = '/'.join(_split_path(spec.get('path')))
+                entries[alias] = ManifestEntry(alias, path, spec['name'].strip(), bool(spec.get('optional', False)))
+            else:
+                raise KeyVaultError("Expected a 'Folder/Path/KEY_NAME' string or a table with 'path' and 'name'")
+        except KeyVaultError as e:
+            errors[alias] = e
+
+    if errors:
+        raise KeyVaultManifestError(_summarize("Invalid manifest", errors, len(secrets)), errors)
+
+    return entries
+
+
+def _summarize(prefix: str, errors: Dict[str, Exception], total: int) -> str:
+    details = '; '.join(f"{alias}: {error}" for alias, error in errors.items())
+    return f"{prefix} ({len(errors)} of {total} secrets): {details}"
+
+
+def _digest(api_url: str, entries: Dict[str, ManifestEntry]) -> str:
+    """Fingerprint of what a plan was resolved for; paths resolve case-insensitively"""
+    canonical = [api_url] + sorted(
+        [alias, entry.path.lower(), entry.name] for alias, entry in entries.items()
+    )
+    return hashlib.sha256(json.dumps(canonical).encode('utf-8')).hexdigest()
+
+
+def _read_plan(path: str, digest: str) -> Dict[str, Optional[Dict[str, str]]]:
+    """Load a cached plan; any missing, unreadable or outdated file counts as empty"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            plan = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(plan, dict) or plan.get('version') != PLAN_VERSION or plan.get('manifest') != digest:
+        return {}
+    keys = plan.get('keys')
+    return keys if isinstance(keys, dict) else {}
+
+
+def _write_plan(path: str, digest: str, keys: Dict[str, Optional[Dict[str, str]]]) -> None:
+    """Atomically replace the cached plan (key and folder IDs only, never values)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.kvplan-', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'version': PLAN_VERSION, 'manifest': digest, 'keys': keys}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _resolve(client, entries: List[ManifestEntry], errors: Dict[str, Exception]) -> Dict[str, Optional[Dict[str, str]]]:
+    """
+    Find the key and folder IDs of entries
+
+    Every distinct path is resolved once and every distinct folder is searched once,
+    both concurrently. Missing optional entries map to None instead of an error.
+
+    Returns:
+        Dictionary mapping aliases to {'id': key ID, 'folderId': folder ID} or None
+    """
+    paths: Dict[str, str] = {}
+    for entry in entries:
+        paths.setdefault(entry.path.lower(), entry.path)
+
+    workers = max(1, min(client.max_workers, len(paths)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {key: executor.submit(client._resolve_path_to_folder, path) for key, path in paths.items()}
+        folders: Dict[str, Any] = {}
+        for key, future in futures.items():
+            try:
+                folders[key] = future.result()['id']
+            except Exception as e:
+                folders[key] = e
+
+        names: Dict[str, List[str]] = {}
+        for entry in entries:
+            folder = folders[entry.path.lower()]
+            if isinstance(folder, Exception):
+                continue
+            folder_names = names.setdefault(folder, [])
+            if entry.name not in folder_names:
+                folder_names.append(entry.name)
+
+        futures = {folder_id: executor.submit(client._find_keys_by_name, folder_id, folder_names)
+                   for folder_id, folder_names in names.items()}
+        found: Dict[str, Any] = {}
+        for folder_id, future in futures.items():
+            try:
+                found[folder_id] = future.result()
+            except Exception as e:
+                found[folder_id] = e
+
+    plan = {}
+    for entry in entries:
+        folder = folders[entry.path.lower()]
+        if isinstance(folder, Exception):
+            if entry.optional and isinstance(folder, KeyVaultNotFoundError):
+                plan[entry.alias] = None
+            else:
+                errors[entry.alias] = folder
+            continue
+        key_ids = found[folder]
+        if isinstance(key_ids, Exception):
+            errors[entry.alias] = key_ids
+        elif entry.name in key_ids:
+            plan[entry.alias] = {'id': key_ids[entry.name], 'folderId': folder}
+        elif entry.optional:
+            plan[entry.alias] = None
+        else:
+            errors[entry.alias] = KeyVaultNotFoundError(f"Key not found: {entry.name} in {entry.path}")
+    return plan
+
+
+def _fetch(client, entries: Dict[str, ManifestEntry],
+           plan: Dict[str, Optional[Dict[str, str]]]) -> Dict[str, Optional[str]]:
+    """
+    Fetch the values of planned entries in bulk
+
+    Returns:
+        Dictionary mapping aliases to values, for the planned keys that still exist
+        in the planned folder under the expected name (and None for optional
+        entries known to be missing)
+    """
+    values: Dict[str, Optional[str]] = {alias: None for alias, target in plan.items() if target is None}
+    key_ids = list(dict.fromkeys(target['id'] for target in plan.values() if target is not None))
+    if not key_ids:
+        return values
+
+    keys = {key['id']: key for key in client.get_values_bulk(key_ids=key_ids)['keys']}
+
+    for alias, target in plan.items():
+        if target is None:
+            continue
+        key = keys.get(target['id'])
+        if (key is not None and key.get('name') == entries[alias].name
+                and key.get('folderId', target['folderId']) == target['folderId']):
+            values[alias] = key.get('value')
+    return values
+
+
+def load_manifest(client, manifest: Union[str, "os.PathLike[str]", Dict[str, Any]],
+                  plan_cache: Optional[str] = None) -> Dict[str, Optional[str]]:
+    """
+    Load every secret of a manifest; see KeyVault.load_manifest()
+    """
+    entries = parse_manifest(manifest)
+    digest = _digest(client.api_url, entries)
+
+    cached = _read_plan(plan_cache, digest) if plan_cache else {}
+    plan = {alias: target for alias, target in cached.items()
+            if alias in entries and (target is None or (isinstance(target, dict)
+                                                        and 'id' in target and 'folderId' in target))}
+
+    # Keys deleted, renamed or moved since the plan was cached are resolved again;
+    # optional entries found missing stay missing until the manifest or plan changes
+    values = _fetch(client, entries, plan)
+    stale = [entry for alias, entry in entries.items() if alias not in values]
+
+    if stale:
+        errors: Dict[str, Exception] = {}
+        resolved = _resolve(client, stale, errors)
+        if errors:
+            raise KeyVaultManifestError(_summarize("Failed to load manifest", errors, len(entries)), errors)
+
+        fresh = _fetch(client, entries, resolved)
+        missing = [alias for alias in resolved if alias not in fresh]
+        if missing:
+            errors = {alias: KeyVaultNotFoundError(f"Key changed while loading: {entries[alias].name}")
+                      for alias in missing}
+            raise KeyVaultManifestError(_summarize("Failed to load manifest", errors, len(entries)), errors)
+
+        values.update(fresh)
+        plan = {alias: target for alias, target in plan.items() if alias in values and alias not in resolved}
+        plan.update(resolved)
+
+    if plan_cache and plan != cached:
+        _write_plan(plan_cache, digest, plan)
+
+    return {alias: values.get(alias) for alias in entries}
@@ -0,0 +1,334 @@
+"""
+Key Vault Models - Compact typed records for large key and folder listings
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_UNLOADED = object()  # Key.value before it is fetched
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Share one copy of strings that repeat across many records (IDs, enums, tags)"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class _Record(ABC):
+    """
+    Base of the typed records
+
+    Fields are stored in ``__slots__`` instead of a per-object dictionary. The
+    server's field names still work as item lookups (``key['folderId']``), so
+    code written against the dictionary results keeps working.
+    """
+
+    __slots__ = ()
+
+    # Server field name -> attribute name
+    _FIELDS: Dict[str, str] = {}
+
+    def __getitem__(self, field: str) -> Any:
+        try:
+            return getattr(self, self._FIELDS[field])
+        except KeyError:
+            raise KeyError(field) from None
+
+    def get(self, field: str, default: Any = None) -> Any:
+        try:
+            return self[field]
+        except KeyError:
+            return default
+
+    def __contains__(self, field: object) -> bool:
+        return field in self._FIELDS
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # Mutable like the dictionaries they replace
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r}, name={self.name!r})"
+
+    @abstractmethod
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert back to the server's dictionary shape
+
+        Returns:
+            Dictionary with the server's field names
+        """
+
+
+class Key(_Record):
+    """
+    Key metadata with a lazily loaded value
+
+    Returned by list_keys(), iter_keys(), search_keys() and iter_search() when
+    called with ``typed=True``. Folder IDs, types, environments and tags are
+    interned, so 200k keys from a few hundred folders share a few hundred copies
+    of each. ``value`` is only fetched (once) when it is first read, through the
+    client that listed the key and therefore through its value cache.
+
+    Example:
+        >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
+        >>> keys = kv.list_keys(folder_id="folder-123", typed=True)['keys']
+        >>> stripe = next(key for key in keys if key.name == "STRIPE_KEY")
+        >>> print(stripe.type, stripe.value)  # the value is fetched here
+    """
+
+    __slots__ = ('id', 'name', 'description', 'type', 'tags', 'is_favorite', 'environment',
+                 'folder_id', 'expires_at', 'created_at', 'updated_at', '_value', '_client')
+
+    _FIELDS = {
+        'id': 'id', 'name': 'name', 'description': 'description', 'type': 'type', 'tags': 'tags',
+        'isFavorite': 'is_favorite', 'environment': 'environment', 'folderId': 'folder_id',
+        'expiresAt': 'expires_at', 'createdAt': 'created_at', 'updatedAt': 'updated_at',
+        'value': 'value'
+    }
+
+    def __init__(self, id: str, name: str, description: Optional[str] = None,
+                 type: Optional[str] = None, tags: Tuple[str, ...] = (),
+                 is_favorite: bool = False, environment: Optional[str] = None,
+                 folder_id: Optional[str] = None, expires_at: Optional[str] = None,
+                 created_at: Optional[str] = None, updated_at: Optional[str] = None,
+                 value: Any = _UNLOADED, client=None):
+        """
+        Initialize a key record
+
+        Args:
+            id: The key's ID
+            name: The key's name
+            description: Optional description
+            type: Key type (e.g., 'API_KEY', 'PASSWORD')
+            tags: The key's tags
+            is_favorite: Favorite status
+            environment: Environment (e.g., 'PRODUCTION')
+            folder_id: ID of the folder holding the key, if known
+            expires_at: Expiry timestamp (ISO 8601)
+            created_at: Creation timestamp (ISO 8601)
+            updated_at: Last update timestamp (ISO 8601)
+            value: The decrypted value, if it is already known
+            client: KeyVault used to fetch the value on first access
+        """
+        self.id = id
+        self.name = name
+        self.description = description
+        self.type = _intern(type)
+        self.tags = tuple(_intern(tag) for tag in tags) if tags else ()
+        self.is_favorite = bool(is_favorite)
+        self.environment = _intern(environment)
+        self.folder_id = _intern(folder_id)
+        self.expires_at = expires_at
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self._value = value
+        self._client = client
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], client=None, folder_id: Optional[str] = None) -> "Key":
+        """
+        Build a key from a server response
+
+        Args:
+            data: Key object as returned by the API
+            client: KeyVault used to fetch the value on first access
+            folder_id: Folder ID to use when the response doesn't include one
+
+        Returns:
+            The key record
+        """
+        return cls(
+            data['id'], data['name'], data.get('description'), data.get('type'),
+            data.get('tags') or (), data.get('isFavorite', False), data.get('environment'),
+            data.get('folderId', folder_id), data.get('expiresAt'), data.get('createdAt'),
+            data.get('updatedAt'), data.get('value', _UNLOADED), client
+        )
+
+    @property
+    def value(self) -> Optional[str]:
+        """The decrypted value, fetched from the API on first access"""
+        if self._value is _UNLOADED:
+            if self._client is None:
+                from .client import KeyVaultError
+                raise KeyVaultError(f"Value of key {self.id} was not loaded and no client can fetch it")
+            self._value = self._client.get_key(key_id=self.id, include_value=True).get('value')
+        return self._value
+
+    @value.setter
+    def value(self, value: Optional[str]) -> None:
+        self._value = value
+
+    @property
+    def value_loaded(self) -> bool:
+        """True once the value is held in memory"""
+        return self._value is not _UNLOADED
+
+    def __contains__(self, field: object) -> bool:
+        # Like the dictionaries, which only have 'value' when it was requested
+        return self.value_loaded if field == 'value' else field in self._FIELDS
+
+    def to_dict(self, include_value: bool = False) -> Dict[str, Any]:
+        """
+        Convert back to the server's dictionary shape
+
+        Args:
+            include_value: Include 'value', fetching it if it isn't loaded yet
+
+        Returns:
+            Dictionary with the server's field names
+        """
+        data = {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'type': self.type,
+            'tags': list(self.tags),
+            'isFavorite': self.is_favorite,
+            'environment': self.environment,
+            'expiresAt': self.expires_at,
+            'createdAt': self.created_at,
+            'updatedAt': self.updated_at
+        }
+        if self.folder_id is not None:
+            data['folderId'] = self.folder_id
+        if include_value or self.value_loaded:
+            data['value'] = self.value
+        return data
+
+
+class Folder(_Record):
+    """
+    Folder with its subfolders
+
+    Returned by list_folders() when called with ``typed=True``. Parent and owner
+    IDs are interned and children are kept in a tuple.
+
+    Example:
+        >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
+        >>> for folder in kv.list_folders(typed=True)['folders']:
+        ...     print(folder.name, folder.key_count, [child.name for child in folder.children])
+    """
+
+    __slots__ = ('id', 'name', 'description', 'color', 'parent_id', 'user_id', 'created_at',
+                 'updated_at', 'key_count', 'subfolder_count', 'children')
+
+    _FIELDS = {
+        'id': 'id', 'name': 'name', 'description': 'description', 'color': 'color',
+        'parentId': 'parent_id', 'userId': 'user_id', 'createdAt': 'created_at',
+        'updatedAt': 'updated_at', 'children': 'children'
+    }
+
+    def __init__(self, id: str, name: str, description: Optional[str] = None,
+                 color: Optional[str] = None, parent_id: Optional[str] = None,
+                 user_id: Optional[str] = None, created_at: Optional[str] = None,
+                 updated_at: Optional[str] = None, key_count: Optional[int] = None,
+                 subfolder_count: Optional[int] = None, children: Iterable["Folder"] = ()):
+        """
+        Initialize a folder record
+
+        Args:
+            id: The folder's ID
+            name: The folder's name
+            description: Optional description
+            color: Display color
+            parent_id: ID of the parent folder (None for projects)
+            user_id: ID of the owner
+            created_at: Creation timestamp (ISO 8601)
+            updated_at: Last update timestamp (ISO 8601)
+            key_count: Number of keys directly in the folder, if the server reported it
+            subfolder_count: Number of direct subfolders, if the server reported it
+            children: Subfolders
+        """
+        self.id = id
+        self.name = name
+        self.description = description
+        self.color = _intern(color)
+        self.parent_id = _intern(parent_id)
+        self.user_id = _intern(user_id)
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.key_count = key_count
+        self.subfolder_count = subfolder_count
+        self.children = tuple(children)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Folder":
+        """
+        Build a folder, and its subfolders, from a server response
+
+        Args:
+            data: Folder object as returned by the API, optionally with nested 'children'
+
+        Returns:
+            The folder record
+        """
+        counts = data.get('_count') or {}
+        return cls(
+            data['id'], data['name'], data.get('description'), data.get('color'),
+            data.get('parentId'), data.get('userId'), data.get('createdAt'), data.get('updatedAt'),
+            counts.get('keys'), counts.get('other_folders'),
+            [Folder.from_dict(child) for child in data.get('children') or ()]
+        )
+
+    def walk(self) -> Iterator["Folder"]:
+        """
+        Iterate over this folder and all of its descendants, depth first
+
+        Yields:
+            Folder records
+        """
+        stack = [self]
+        while stack:
+            folder = stack.pop()
+            yield folder
+            stack.extend(reversed(folder.children))
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'color': self.color,
+            'parentId': self.parent_id,
+            'userId': self.user_id,
+            'createdAt': self.created_at,
+            'updatedAt': self.updated_at,
+            'children': [child.to_dict() for child in self.children]
+        }
+        if self.key_count is not None or self.subfolder_count is not None:
+            data['_count'] = {'keys': self.key_count, 'other_folders': self.subfolder_count}
+        return data
+
+
+class Project(Folder):
+    """
+    Root folder, as returned by list_projects() with ``typed=True``
+    """
+
+    __slots__ = ()
+
+
+def typed_keys(result: Dict[str, Any], client, folder_id: Optional[str] = None) -> Dict[str, Any]:
+    """Replace the key dictionaries of a listing result with Key records"""
+    return dict(result, keys=[Key.from_dict(key, client, folder_id) for key in result.get('keys', [])])
+
+
+def typed_folders(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace the folder dictionaries of a folder listing with Folder records"""
+    return dict(result, folders=[Folder.from_dict(folder) for folder in result.get('folders', [])])
+
+
+def typed_projects(projects: List[Dict[str, Any]]) -> List[Project]:
+    """Convert a list_projects() result to Project records"""
+    return [Project.from_dict(project) for project in projects]
+
+
+def iter_typed_keys(keys: Iterable[Dict[str, Any]], client,
+                    folder_id: Optional[str] = None) -> Iterator[Key]:
+    """Convert key dictionaries from an iterator to Key records as they arrive"""
+    for key in keys:
+        yield Key.from_dict(key, client, folder_id)
@@ -0,0 +1,165 @@
+"""
+Key Vault Refresher - Background refresh of cached key values
+"""
+
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Set
+
+# Default seconds stop() waits for a refresh in progress to finish
+STOP_TIMEOUT = 5.0
+
+
+class BackgroundRefresher:
+    """
+    Re-fetches a registered set of keys and paths on a daemon thread
+
+    Registered values are written to the client's value cache before they expire,
+    so reads of those keys are served from memory and never wait on the network.
+    After each successful cycle the client's disk cache, if any, is rewritten.
+    Failed refreshes are recorded and retried on the next cycle; in the meantime the
+    client keeps serving the last known values within its ``max_staleness`` bound.
+    """
+
+    def __init__(self, client, interval: float):
+        """
+        Initialize the refresher
+
+        Args:
+            client: The KeyVault client whose cache is kept warm
+            interval: Seconds between refresh cycles
+        """
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+
+        self.client = client
+        self.interval = interval
+        self.key_ids: Set[str] = set()
+        self.paths: Set[str] = set()
+        self.last_refresh: Optional[float] = None
+        self.last_error: Optional[Exception] = None
+        self._covered_ids: Set[str] = set()  # Key IDs loaded through registered paths
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, key_ids: Optional[Iterable[str]] = None,
+                 paths: Optional[Iterable[str]] = None) -> None:
+        """
+        Add keys and/or folder paths to the refreshed set
+
+        Args:
+            key_ids: Key IDs to keep warm
+            paths: Folder paths like 'MyApp/Production' whose keys are kept warm
+        """
+        with self._lock:
+            self.key_ids.update(key_ids or [])
+            self.paths.update(paths or [])
+
+    def covers(self, key_id: str) -> bool:
+        """Check whether a key is kept warm by this refresher"""
+        with self._lock:
+            return key_id in self.key_ids or key_id in self._covered_ids
+
+    def refresh(self) -> None:
+        """
+        Run one refresh cycle in the calling thread
+
+        Raises:
+            KeyVaultError: If any registered key or path could not be refreshed
+        """
+        with self._lock:
+            key_ids = sorted(self.key_ids)
+            paths = sorted(self.paths)
+
+        errors = []
+        covered = set()
+
+        if key_ids:
+            try:
+                self.client.get_values_bulk(key_ids=key_ids)
+            except Exception as e:
+                errors.append(e)
+
+        for path in paths:
+            try:
+                folder = self.client._resolve_path_to_folder(path)
+                result = self.client.get_values_bulk(folder_id=folder['id'])
+                covered.update(key['id'] for key in result['keys'])
+            except Exception as e:
+                errors.append(e)
+
+        with self._lock:
+            if not errors:
+                self._covered_ids = covered
+            else:
+                # Keep covering keys from paths that failed this cycle
+                self._covered_ids |= covered
+            self.last_refresh = time.time()
+            self.last_error = errors[0] if errors else None
+
+        if errors:
+            raise errors[0]
+
+        if self.client.disk_cache is not None:
+            self.client.save_cache()
+
+    def start(self) -> None:
+        """Start the daemon refresh thread (no-op if already running)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        # Each thread gets its own event, so one still finishing a refresh after
+        # stop() can never be woken up again by a later start()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._stop,),
+            name='KeyVaultRefresher',
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = STOP_TIMEOUT) -> None:
+        """
+        Stop the refresh thread
+
+        Args:
+            timeout: Seconds to wait for a refresh in progress to finish
+                     (default: 5, None to wait as long as it takes)
+        """
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        """True while the refresh thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Get the refresher's status
+
+        Returns:
+            Dictionary with running state, interval, registered counts,
+            last refresh time and last error
+        """
+        with self._lock:
+            return {
+                'running': self.running,
+                'interval': self.interval,
+                'keys': len(self.key_ids),
+                'paths': len(self.paths),
+                'last_refresh': self.last_refresh,
+                'last_error': str(self.last_error) if self.last_error else None
+            }
+
+    def _run(self, stop: threading.Event) -> None:
+        while not stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception:
+                # Recorded in last_error; stale values keep being served meanwhile
+                pass
@@ -0,0 +1,226 @@
+"""
+Key Vault Replica - Local copy of a folder's or project's keys kept current from the change feed
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .refresher import STOP_TIMEOUT
+
+
+class KeyReplica:
+    """
+    In-memory copy of keys (with values) maintained by KeyVault.sync()
+
+    The replica remembers its position in the server's change feed, so each sync
+    only transfers the keys created, updated or deleted since the previous one.
+    Lookups never touch the network.
+
+    A replica scoped to a folder or project does not see keys moved out of that
+    scope; they stay in the replica until they are deleted or a full resync.
+    """
+
+    def __init__(self, folder_id: Optional[str] = None, project_id: Optional[str] = None):
+        """
+        Initialize an empty replica
+
+        Args:
+            folder_id: Only replicate the keys of this folder
+            project_id: Only replicate the keys of this project and all of its subfolders
+                        (default: every key the token can read)
+        """
+        if folder_id and project_id:
+            raise ValueError("Pass either folder_id or project_id, not both")
+
+        self.folder_id = folder_id
+        self.project_id = project_id
+        self.cursor: Optional[str] = None
+        self.last_sync: Optional[float] = None
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._names: Dict[Tuple[Optional[str], str], str] = {}
+        self._lock = threading.Lock()
+
+    def apply(self, updated: Iterable[Dict[str, Any]], deleted: Iterable[str],
+              cursor: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Apply one batch of changes
+
+        Args:
+            updated: Created or updated keys, including their values
+            deleted: IDs of deleted keys (unknown IDs are ignored)
+            cursor: Feed position after this batch
+
+        Returns:
+            The previous versions of the keys that were replaced or removed
+        """
+        previous = []
+        with self._lock:
+            for key in updated:
+                old = self._keys.get(key['id'])
+                if old is not None:
+                    previous.append(old)
+                    self._unindex(old)
+                self._keys[key['id']] = key
+                self._names.setdefault((key.get('folderId'), key['name']), key['id'])
+
+            for key_id in deleted:
+                old = self._keys.pop(key_id, None)
+                if old is not None:
+                    previous.append(old)
+                    self._unindex(old)
+
+            if cursor is not None:
+                self.cursor = cursor
+            self.last_sync = time.time()
+        return previous
+
+    def _unindex(self, key: Dict[str, Any]) -> None:
+        name = (key.get('folderId'), key['name'])
+        if self._names.get(name) != key['id']:
+            return
+        del self._names[name]
+        # Another key with the same name in the folder takes over
+        for other in self._keys.values():
+            if other['id'] != key['id'] and (other.get('folderId'), other['name']) == name:
+                self._names[name] = other['id']
+                break
+
+    def get(self, key_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a key by ID
+
+        Returns:
+            Copy of the key including its value, or None if it isn't replicated
+        """
+        with self._lock:
+            key = self._keys.get(key_id)
+            return dict(key) if key is not None else None
+
+    def get_by_name(self, folder_id: str, key_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a key by folder ID and name
+
+        Returns:
+            Copy of the key including its value, or None if it isn't replicated
+        """
+        with self._lock:
+            key_id = self._names.get((folder_id, key_name))
+            return dict(self._keys[key_id]) if key_id is not None else None
+
+    def keys(self, folder_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List replicated keys
+
+        Args:
+            folder_id: Only list the keys of this folder
+
+        Returns:
+            Copies of the keys including their values
+        """
+        with self._lock:
+            return [dict(key) for key in self._keys.values()
+                    if folder_id is None or key.get('folderId') == folder_id]
+
+    def reset(self) -> None:
+        """Drop all keys and the feed position so the next sync reloads everything"""
+        with self._lock:
+            self._keys.clear()
+            self._names.clear()
+            self.cursor = None
+            self.last_sync = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._keys)
+
+    def __contains__(self, key_id: object) -> bool:
+        with self._lock:
+            return key_id in self._keys
+
+
+class ReplicaWatcher:
+    """
+    Syncs a KeyReplica on a daemon thread
+
+    Created by KeyVault.watch(). Failed syncs are recorded in ``last_error`` and
+    retried on the next cycle; the replica keeps its last state meanwhile.
+    """
+
+    def __init__(self, client, replica: KeyReplica, interval: float,
+                 on_change: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Initialize the watcher
+
+        Args:
+            client: The KeyVault client used to sync
+            replica: The replica kept current
+            interval: Seconds between syncs
+            on_change: Called with the sync summary whenever keys changed
+        """
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+
+        self.client = client
+        self.replica = replica
+        self.interval = interval
+        self.on_change = on_change
+        self.last_error: Optional[Exception] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sync(self) -> Dict[str, Any]:
+        """
+        Run one sync in the calling thread
+
+        Returns:
+            The summary returned by KeyVault.sync()
+        """
+        try:
+            summary = self.client.sync(self.replica)
+        except Exception as e:
+            self.last_error = e
+            raise
+        self.last_error = None
+
+        if self.on_change is not None and (summary['updated'] or summary['deleted']):
+            self.on_change(summary)
+        return summary
+
+    def start(self) -> None:
+        """Start the daemon sync thread (no-op if already running)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        # A fresh event per thread, so a thread still finishing a sync after stop()
+        # is never woken up again by a later start()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop,),
+                                        name='KeyVaultWatcher', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = STOP_TIMEOUT) -> None:
+        """
+        Stop the sync thread
+
+        Args:
+            timeout: Seconds to wait for a sync in progress to finish
+                     (default: 5, None to wait as long as it takes)
+        """
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        """True while the sync thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self, stop: threading.Event) -> None:
+        while not stop.wait(self.interval):
+            try:
+                self.sync()
+            except Exception:
+                # Recorded in last_error; the replica keeps its last state meanwhile
+                pass
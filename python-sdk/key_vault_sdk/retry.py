@@ -0,0 +1,190 @@
+"""
+Key Vault Retry - Retry policy and circuit breaker for Key Vault API requests
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+
+class RetryPolicy:
+    """
+    Retry policy for idempotent requests
+
+    Failed requests are retried after an exponential backoff with full jitter:
+    ``random(0, min(max_backoff, backoff_factor * 2 ** attempt))``. A ``Retry-After``
+    header on a retryable response overrides the computed delay.
+
+    Timeouts are not retried unless ``retry_timeouts`` is set: each attempt already
+    waited the full client timeout, so retrying them multiplies the worst case.
+    """
+
+    def __init__(self, max_retries: int = 3, backoff_factor: float = 0.5,
+                 max_backoff: float = 10.0, jitter: bool = True,
+                 retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+                 retry_methods: Iterable[str] = ('GET', 'HEAD', 'OPTIONS'),
+                 respect_retry_after: bool = True, retry_timeouts: bool = False):
+        """
+        Initialize the retry policy
+
+        Args:
+            max_retries: Retries after the first attempt (default: 3, 0 disables retries)
+            backoff_factor: Base delay in seconds (default: 0.5)
+            max_backoff: Upper bound for a single delay in seconds (default: 10)
+            jitter: Randomize delays to spread out retries from many clients (default: True)
+            retry_statuses: HTTP statuses that are retried (default: 429 and 5xx gateway errors)
+            retry_methods: HTTP methods that are safe to retry (default: GET, HEAD, OPTIONS)
+            respect_retry_after: Honor the server's Retry-After header (default: True)
+            retry_timeouts: Also retry requests that timed out (default: False)
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+        self.respect_retry_after = respect_retry_after
+        self.retry_timeouts = retry_timeouts
+
+    def allows(self, method: str) -> bool:
+        """Check whether requests with this HTTP method may be retried"""
+        return self.max_retries > 0 and method.upper() in self.retry_methods
+
+    def should_retry_status(self, status_code: int) -> bool:
+        """Check whether a response with this status should be retried"""
+        return status_code in self.retry_statuses
+
+    def get_backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Get the delay before the next attempt
+
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            retry_after: Delay requested by the server, if any
+
+        Returns:
+            Delay in seconds
+        """
+        if retry_after is not None and self.respect_retry_after:
+            return min(max(retry_after, 0.0), self.max_backoff)
+
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Parse a Retry-After header
+
+        Args:
+            value: Header value, either delay-seconds or an HTTP date
+
+        Returns:
+            Delay in seconds, or None if the header is missing or invalid
+        """
+        if not value:
+            return None
+
+        try:
+            return float(value)
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker that fails fast while the Key Vault API is down
+
+    After ``failure_threshold`` consecutive failures the circuit opens and requests
+    are rejected immediately. Once ``reset_timeout`` seconds have passed, a single
+    trial request is let through (half-open); its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize the circuit breaker
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit (default: 5)
+            reset_timeout: Seconds to stay open before allowing a trial request (default: 30)
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: 'closed', 'open' or 'half_open'"""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent now
+
+        Returns:
+            False while the circuit is open (or a half-open trial is already in flight)
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+
+            # Half-open: let exactly one trial request through
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """Record a request that reached the API; closes the circuit"""
+        with self._lock:
+            self.failures = 0
+            self._state = self.CLOSED
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a request that could not reach the API"""
+        with self._lock:
+            self.failures += 1
+            if self._state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    def reset(self) -> None:
+        """Close the circuit and forget past failures"""
+        self.record_success()
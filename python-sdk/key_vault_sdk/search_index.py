@@ -0,0 +1,202 @@
+"""
+Key Vault Search Index - In-memory index of key metadata for local search
+"""
+
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+# Queries shorter than this are answered by scanning instead of the trigram index
+GRAM_SIZE = 3
+
+# Key fields kept in the index; values are never stored
+INDEXED_FIELDS = ('id', 'name', 'description', 'type', 'tags', 'isFavorite', 'environment',
+                  'folderId', 'expiresAt', 'createdAt', 'updatedAt')
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+class KeySearchIndex:
+    """
+    Key metadata indexed for search_keys()-style queries without a round trip
+
+    Names and descriptions are split into lowercase trigrams; a search intersects
+    the posting sets of the query's trigrams and confirms the candidates with a
+    substring check, so results match the server's search: a case-insensitive
+    match in the name or description, or an exact tag. Type and favorite filters
+    are answered from their own sets.
+
+    KeyVault keeps the index current from the change feed (see
+    refresh_search_index()) and from key listings it receives.
+
+    Example:
+        >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token",
+        ...               search_index_ttl=30)
+        >>> kv.search_keys("stri")['keys']  # answered from memory after the first load
+    """
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self.cursor: Optional[str] = None
+        self.last_sync: Optional[float] = None
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._text: Dict[str, str] = {}
+        self._grams: Dict[str, Set[str]] = {}
+        self._tags: Dict[str, Set[str]] = {}
+        self._types: Dict[str, Set[str]] = {}
+        self._favorites: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def apply(self, updated: Iterable[Dict[str, Any]], deleted: Iterable[str] = (),
+              cursor: Optional[str] = None) -> None:
+        """
+        Add, replace or remove keys
+
+        Args:
+            updated: Key objects from a listing or the change feed
+            deleted: IDs of deleted keys (unknown IDs are ignored)
+            cursor: Feed position after this batch, if it came from the change feed
+        """
+        with self._lock:
+            for key in updated:
+                self._remove(key['id'])
+                self._add({field: key[field] for field in INDEXED_FIELDS if field in key})
+            for key_id in deleted:
+                self._remove(key_id)
+
+            if cursor is not None:
+                self.cursor = cursor
+                self.last_sync = time.time()
+
+    def _add(self, key: Dict[str, Any]) -> None:
+        key_id = key['id']
+        text = f"{key.get('name') or ''}\n{key.get('description') or ''}".lower()
+        self._keys[key_id] = key
+        self._text[key_id] = text
+        for gram in _grams(text):
+            self._grams.setdefault(gram, set()).add(key_id)
+        for tag in key.get('tags') or []:
+            self._tags.setdefault(tag, set()).add(key_id)
+        if key.get('type'):
+            self._types.setdefault(key['type'], set()).add(key_id)
+        if key.get('isFavorite'):
+            self._favorites.add(key_id)
+
+    def _remove(self, key_id: str) -> None:
+        key = self._keys.pop(key_id, None)
+        if key is None:
+            return
+
+        for gram in _grams(self._text.pop(key_id)):
+            _discard(self._grams, gram, key_id)
+        for tag in key.get('tags') or []:
+            _discard(self._tags, tag, key_id)
+        if key.get('type'):
+            _discard(self._types, key['type'], key_id)
+        self._favorites.discard(key_id)
+
+    def search(self, search: str, key_type: Optional[str] = None,
+               favorite: Optional[bool] = None, limit: int = 20, offset: int = 0,
+               folder_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Search the indexed keys
+
+        Args:
+            search: Search term (an empty term matches every key)
+            key_type: Filter by key type (e.g., 'API_KEY', 'PASSWORD')
+            favorite: Filter by favorite status
+            limit: Number of keys to return (default: 20)
+            offset: Number of keys to skip (default: 0)
+            folder_id: Only return keys of this folder
+
+        Returns:
+            Dictionary shaped like search_keys(): 'keys' (most recently updated
+            first), 'total', 'limit' and 'offset'
+        """
+        with self._lock:
+            matches = self._match(search)
+            if key_type:
+                matches &= self._types.get(key_type, set())
+            if favorite is True:
+                matches &= self._favorites
+            elif favorite is False:
+                matches -= self._favorites
+
+            keys = [self._keys[key_id] for key_id in matches]
+            if folder_id is not None:
+                keys = [key for key in keys if key.get('folderId') == folder_id]
+            keys.sort(key=lambda key: (key.get('updatedAt') or '', key['id']), reverse=True)
+            page = [dict(key) for key in keys[offset:offset + limit]]
+
+        return {
+            'keys': page,
+            'total': len(keys),
+            'limit': limit,
+            'offset': offset
+        }
+
+    def _match(self, search: str) -> Set[str]:
+        """IDs of keys whose name or description contains the term, or with the term as a tag"""
+        if not search:
+            return set(self._keys)
+
+        term = search.lower()
+        if len(term) < GRAM_SIZE:
+            candidates: Iterable[str] = self._keys
+        else:
+            postings = sorted((self._grams.get(gram, set()) for gram in _grams(term)), key=len)
+            candidates = set.intersection(*postings) if postings[0] else set()
+
+        matches = {key_id for key_id in candidates if term in self._text[key_id]}
+        return matches | self._tags.get(search, set())
+
+    def get(self, key_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an indexed key by ID
+
+        Returns:
+            Copy of the key's metadata, or None if it isn't indexed
+        """
+        with self._lock:
+            key = self._keys.get(key_id)
+            return dict(key) if key is not None else None
+
+    def keys(self) -> List[Dict[str, Any]]:
+        """
+        List indexed keys
+
+        Returns:
+            Copies of the keys' metadata
+        """
+        with self._lock:
+            return [dict(key) for key in self._keys.values()]
+
+    def reset(self) -> None:
+        """Drop all keys and the feed position so the next refresh reloads everything"""
+        with self._lock:
+            self._keys.clear()
+            self._text.clear()
+            self._grams.clear()
+            self._tags.clear()
+            self._types.clear()
+            self._favorites.clear()
+            self.cursor = None
+            self.last_sync = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._keys)
+
+    def __contains__(self, key_id: object) -> bool:
+        with self._lock:
+            return key_id in self._keys
+
+
+def _discard(postings: Dict[str, Set[str]], term: str, key_id: str) -> None:
+    ids = postings.get(term)
+    if ids is not None:
+        ids.discard(key_id)
+        if not ids:
+            del postings[term]
@@ -0,0 +1,159 @@
+"""
+Key Vault Single-Flight - Coalescing of concurrent identical API requests
+"""
+
+import asyncio
+import copy
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+def request_key(method: str, endpoint: str, kwargs: Dict[str, Any]) -> Hashable:
+    """
+    Build the coalescing key of a request from its method, endpoint and arguments
+
+    Args:
+        method: HTTP method
+        endpoint: API endpoint path
+        kwargs: Request arguments such as ``params``
+
+    Returns:
+        Hashable key; requests with equal keys are interchangeable
+    """
+    return (method.upper(), endpoint, json.dumps(kwargs, sort_keys=True, default=str))
+
+
+class _Call:
+    """A request in flight and the callers waiting for it"""
+
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Collapses concurrent identical calls into one
+
+    While a call for a key is running, other threads calling ``do()`` with the
+    same key wait for it instead of repeating the work, then receive a deep copy
+    of its result (or the same exception). Nothing is cached once the call returns.
+    """
+
+    def __init__(self):
+        """Initialize an empty set of in-flight calls"""
+        self.shared = 0  # Calls answered by another caller's request
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run ``fn`` unless an identical call is already in flight
+
+        Args:
+            key: Coalescing key
+            fn: Function performing the call
+
+        Returns:
+            The call's result
+
+        Raises:
+            Exception: Whatever ``fn`` raised, in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                waiters = call.waiters
+            if waiters and call.error is None:
+                # Snapshot before releasing waiters, so the leader's caller may mutate its copy
+                call.result = copy.deepcopy(result)
+            call.done.set()
+        return result
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running"""
+        with self._lock:
+            return len(self._calls)
+
+
+class _AsyncCall:
+    """An in-flight task and the number of callers sharing it"""
+
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task: "asyncio.Future"):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of SingleFlight
+
+    The call runs as its own task, so cancelling one waiting caller does not
+    cancel the request for the others.
+    """
+
+    def __init__(self):
+        """Initialize an empty set of in-flight calls"""
+        self.shared = 0  # Calls answered by another caller's request
+        self._calls: Dict[Hashable, _AsyncCall] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await ``fn()`` unless an identical call is already in flight
+
+        Args:
+            key: Coalescing key
+            fn: Coroutine function performing the call
+
+        Returns:
+            The call's result (a deep copy when it was shared)
+        """
+        call = self._calls.get(key)
+        if call is not None and not call.task.done():
+            call.waiters += 1
+            self.shared += 1
+            return copy.deepcopy(await asyncio.shield(call.task))
+
+        call = self._calls[key] = _AsyncCall(asyncio.ensure_future(fn()))
+        call.task.add_done_callback(lambda _: self._release(key, call))
+        result = await asyncio.shield(call.task)
+        # Waiters can only join while the task is pending, so the count is final here
+        return copy.deepcopy(result) if call.waiters else result
+
+    def _release(self, key: Hashable, call: _AsyncCall) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.task.cancelled():
+            call.task.exception()  # Mark retrieved when nobody is left to await it
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running"""
+        return sum(1 for call in self._calls.values() if not call.task.done())
@@ -0,0 +1,193 @@
+"""
+Key Vault Snapshot - Read-only secret snapshot shared by forked worker processes
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .client import KeyVaultError
+
+# File layout:
+#   header   MAGIC, index entry count, key count
+#   index    one (lookup key offset, length, record offset, length) per entry,
+#            sorted by lookup key bytes
+#   blobs    lookup keys and JSON records
+MAGIC = b'KVS1'
+_HEADER = struct.Struct('<4sII')
+_ENTRY = struct.Struct('<QIQI')
+
+
+def _id_lookup(key_id: str) -> bytes:
+    return f"id:{key_id}".encode('utf-8')
+
+
+def _name_lookup(folder_id: str, key_name: str) -> bytes:
+    return f"name:{folder_id}\x00{key_name}".encode('utf-8')
+
+
+def _default_directory() -> Optional[str]:
+    """Prefer a RAM-backed tmpfs so secrets never reach a disk"""
+    return '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+class SecretSnapshot:
+    """
+    Immutable set of keys (with values) in a memory-mapped file
+
+    Lookups binary-search the sorted index directly in the mapping, so nothing is
+    parsed up front and every process that maps the file shares the same pages.
+    Create the snapshot in the parent before forking workers (for example in
+    gunicorn's ``on_starting`` hook or with ``--preload``); the workers inherit the
+    mapping and read from it without any API calls.
+
+    A snapshot never changes or expires. Keys missing from it, and every key once
+    the snapshot is closed, are fetched from the API as usual.
+    """
+
+    def __init__(self, mapping: mmap.mmap, path: Optional[str] = None):
+        """
+        Wrap an existing mapping; use SecretSnapshot.create() or SecretSnapshot.open()
+
+        Args:
+            mapping: Read-only mapping of a snapshot file
+            path: The file's path, if it still exists
+        """
+        magic, count, key_count = _HEADER.unpack_from(mapping, 0)
+        if magic != MAGIC:
+            raise KeyVaultError("Not a Key Vault snapshot file")
+
+        self.path = path
+        self._mm = mapping
+        self._count = count
+        self._key_count = key_count
+
+    @classmethod
+    def create(cls, keys: Iterable[Dict[str, Any]], path: Optional[str] = None) -> "SecretSnapshot":
+        """
+        Write keys to a snapshot file and map it
+
+        Args:
+            keys: Key dictionaries including 'id', 'name', 'folderId' and 'value'
+            path: Where to write the file. If omitted, an anonymous file is created
+                  in /dev/shm (or the temp directory) and unlinked right after it is
+                  mapped, so only this process and its forked children can read it
+
+        Returns:
+            The mapped snapshot
+        """
+        entries: List[Tuple[bytes, bytes]] = []
+        key_count = 0
+        for key in keys:
+            key_count += 1
+            record = json.dumps(key, separators=(',', ':')).encode('utf-8')
+            entries.append((_id_lookup(key['id']), record))
+            if key.get('folderId') and key.get('name'):
+                entries.append((_name_lookup(key['folderId'], key['name']), record))
+        entries.sort(key=lambda entry: entry[0])
+
+        # Records are stored once even when both lookups point to them
+        blobs = bytearray()
+        offsets: Dict[bytes, int] = {}
+        data_start = _HEADER.size + _ENTRY.size * len(entries)
+        index = bytearray()
+        for lookup, record in entries:
+            lookup_off = data_start + len(blobs)
+            blobs += lookup
+            record_off = offsets.get(record)
+            if record_off is None:
+                record_off = offsets[record] = data_start + len(blobs)
+                blobs += record
+            index += _ENTRY.pack(lookup_off, len(lookup), record_off, len(record))
+
+        data = _HEADER.pack(MAGIC, len(entries), key_count) + bytes(index) + bytes(blobs)
+
+        if path is None:
+            fd, tmp_path = tempfile.mkstemp(prefix='kvsnap-', dir=_default_directory())
+            try:
+                with os.fdopen(fd, 'w+b') as f:
+                    f.write(data)
+                    f.flush()
+                    mapping = mmap.mmap(f.fileno(), len(data), access=mmap.ACCESS_READ)
+            finally:
+                os.unlink(tmp_path)
+            return cls(mapping)
+
+        path = os.path.expanduser(path)
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(prefix='.kvsnap-', dir=directory)  # Created with mode 0600
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return cls.open(path)
+
+    @classmethod
+    def open(cls, path: str) -> "SecretSnapshot":
+        """
+        Map an existing snapshot file read-only
+
+        Args:
+            path: Snapshot file written by SecretSnapshot.create()
+
+        Returns:
+            The mapped snapshot
+        """
+        path = os.path.expanduser(path)
+        with open(path, 'rb') as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapping, path)
+
+    def _find(self, lookup: bytes) -> Optional[Dict[str, Any]]:
+        mm = self._mm
+        if mm.closed:
+            # Replaced or closed; the client falls back to the API
+            return None
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            lookup_off, lookup_len, record_off, record_len = _ENTRY.unpack_from(
+                mm, _HEADER.size + mid * _ENTRY.size
+            )
+            candidate = mm[lookup_off:lookup_off + lookup_len]
+            if candidate < lookup:
+                lo = mid + 1
+            elif candidate > lookup:
+                hi = mid
+            else:
+                return json.loads(mm[record_off:record_off + record_len])
+        return None
+
+    def get(self, key_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a key by ID
+
+        Returns:
+            A fresh key dictionary including its value, or None if not in the snapshot
+        """
+        return self._find(_id_lookup(key_id))
+
+    def get_by_name(self, folder_id: str, key_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a key by folder ID and name
+
+        Returns:
+            A fresh key dictionary including its value, or None if not in the snapshot
+        """
+        return self._find(_name_lookup(folder_id, key_name))
+
+    def close(self) -> None:
+        """Unmap the snapshot; later lookups miss"""
+        self._mm.close()
+
+    def __len__(self) -> int:
+        return self._key_count
@@ -0,0 +1,101 @@
+"""
+Key Vault Transport - Pooled HTTP transport shared between Key Vault clients
+"""
+
+import os
+import socket
+import weakref
+from typing import List, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+
+def _tcp_keepalive_options(idle: int, interval: int, count: int) -> List[Tuple[int, int, int]]:
+    """Build socket options enabling TCP keep-alive probes where the platform supports them"""
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    elif hasattr(socket, 'TCP_KEEPALIVE'):  # macOS
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle))
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval))
+    if hasattr(socket, 'TCP_KEEPCNT'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, count))
+    return options
+
+
+# Live transports, whose pools are dropped in the child process after a fork
+_transports: "weakref.WeakSet[PooledTransport]" = weakref.WeakSet()
+
+
+def _reset_transports_after_fork() -> None:
+    for transport in list(_transports):
+        transport.reset_pools()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_transports_after_fork)
+
+
+class PooledTransport(HTTPAdapter):
+    """
+    HTTP adapter with a tunable connection pool
+
+    One transport can be passed to several KeyVault clients (for example, one per
+    API token). Each client keeps its own session and headers, but they all draw
+    connections from the same pool, so no redundant sockets are opened to the
+    same host.
+
+    Retries are left to the client's RetryPolicy, so the adapter never retries.
+    After a fork the child starts with empty pools, so it never writes to a
+    socket the parent is still using.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_block: bool = False, tcp_keepalive: bool = True,
+                 tcp_keepalive_idle: int = 60, tcp_keepalive_interval: int = 15,
+                 tcp_keepalive_count: int = 4):
+        """
+        Initialize the transport
+
+        Args:
+            pool_connections: Number of per-host pools to keep (default: 10)
+            pool_maxsize: Connections kept open per host (default: 10); size it to
+                          the number of threads that call the API concurrently
+            pool_block: If True, wait for a free connection when the pool is exhausted
+                        instead of opening a throwaway one (default: False)
+            tcp_keepalive: Send TCP keep-alive probes on idle pooled sockets so
+                           firewalls and load balancers don't silently drop them (default: True)
+            tcp_keepalive_idle: Idle seconds before the first probe (default: 60)
+            tcp_keepalive_interval: Seconds between probes (default: 15)
+            tcp_keepalive_count: Failed probes before the socket is closed (default: 4)
+        """
+        self.socket_options: Optional[List[Tuple[int, int, int]]] = None
+        if tcp_keepalive:
+            self.socket_options = list(HTTPConnection.default_socket_options) + _tcp_keepalive_options(
+                tcp_keepalive_idle, tcp_keepalive_interval, tcp_keepalive_count
+            )
+
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=0
+        )
+        _transports.add(self)
+
+    def reset_pools(self) -> None:
+        """Forget all pooled connections without closing them, as after a fork"""
+        # Closing them could shut down sockets the parent process still uses
+        self.init_poolmanager(self._pool_connections, self._pool_maxsize, block=self._pool_block)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.socket_options is not None:
+            kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+    def __setstate__(self, state):
+        # HTTPAdapter pickling drops unknown attributes before rebuilding the pool
+        self.socket_options = state.pop('socket_options', None)
+        super().__setstate__(state)
@@ -0,0 +1,192 @@
+"""
+Key Vault Folder Tree - Indexed view of a nested folder tree
+"""
+
+from typing import Any, Dict, Iterator, List, Optional
+
+
+def _build_path_index(project: Dict[str, Any], folders: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Map every folder of a project tree to its normalized (lowercase) full path
+    
+    Args:
+        project: The project (root folder) object
+        folders: The project's folder tree as returned by /folders/tree
+        
+    Returns:
+        Dictionary like {'myapp': project, 'myapp/prod': folder, ...}
+    """
+    index = {project['name'].strip().lower(): project}
+    
+    # Depth-first, in tree order, so the first folder wins when names repeat
+    stack = [(folder, '') for folder in reversed(folders)]
+    while stack:
+        folder, parent_path = stack.pop()
+        name = folder['name'].strip().lower()
+        folder_path = f"{parent_path}/{name}" if parent_path else name
+        index.setdefault(folder_path, folder)
+        for child in reversed(folder.get('children') or []):
+            stack.append((child, folder_path))
+    
+    return index
+
+
+class FolderTree(dict):
+    """
+    Folder tree indexed once for cheap navigation
+
+    Built from the nested folders returned by /folders/tree. Every folder is
+    indexed by ID and by name and linked to its parent, so lookups don't walk the
+    tree and a folder's path is rebuilt in O(depth).
+
+    The tree is still a dictionary with the 'folders', 'find_folder_by_name' and
+    'get_folder_path' entries that navigate_folder_tree() has always returned, and
+    the folder objects are the server's dictionaries (including 'children').
+
+    Example:
+        >>> kv = KeyVault(api_url="https://yourdomain.com/api", token="your-token")
+        >>> tree = kv.navigate_folder_tree(project_id="project-123")
+        >>> prod = tree.find_folder_by_name("Production")
+        >>> print(tree.path_of(prod['id']))  # 'MyApp/Production'
+    """
+
+    def __init__(self, folders: List[Dict[str, Any]]):
+        """
+        Index a folder tree
+
+        Args:
+            folders: Root folders, each with nested 'children'
+        """
+        super().__init__(
+            folders=folders,
+            find_folder_by_name=self.find_folder_by_name,
+            get_folder_path=self.get_folder_path
+        )
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._parent: Dict[str, Optional[str]] = {}
+        self._by_name: Dict[str, List[Dict[str, Any]]] = {}
+        self._by_path: Dict[str, Dict[str, Any]] = {}
+        self._order: List[str] = []
+
+        # Paths are normalized the same way path resolution does it; each root is
+        # indexed like the one-project tree /folders/tree?projectId=... returns
+        for root in folders:
+            for folder_path, folder in _build_path_index(root, [root]).items():
+                self._by_path.setdefault(folder_path, folder)
+
+        # Iterative depth-first walk in tree order, so the first folder of a
+        # name is the one a recursive search would have found
+        stack = [(folder, None) for folder in reversed(folders)]
+        while stack:
+            folder, parent_id = stack.pop()
+            folder_id = folder['id']
+            if folder_id in self._by_id:
+                continue
+
+            self._by_id[folder_id] = folder
+            self._parent[folder_id] = parent_id
+            self._by_name.setdefault(folder['name'], []).append(folder)
+            self._order.append(folder_id)
+
+            for child in reversed(folder.get('children') or []):
+                stack.append((child, folder_id))
+
+    @property
+    def folder_count(self) -> int:
+        """Number of folders in the tree"""
+        return len(self._by_id)
+
+    def folder(self, folder_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a folder by ID
+
+        Returns:
+            Folder object or None if it isn't in the tree
+        """
+        return self._by_id.get(folder_id)
+
+    def parent(self, folder_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a folder's parent
+
+        Returns:
+            Parent folder object, or None for root folders and unknown IDs
+        """
+        parent_id = self._parent.get(folder_id)
+        return self._by_id[parent_id] if parent_id is not None else None
+
+    def children(self, folder_id: str) -> List[Dict[str, Any]]:
+        """
+        Get a folder's direct subfolders
+
+        Returns:
+            List of folder objects (empty for leaves and unknown IDs)
+        """
+        folder = self._by_id.get(folder_id)
+        return list(folder.get('children') or []) if folder else []
+
+    def find_folder_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a folder by exact name
+
+        Returns:
+            The first matching folder in tree order, or None
+        """
+        matches = self._by_name.get(name)
+        return matches[0] if matches else None
+
+    def find_folders_by_name(self, name: str) -> List[Dict[str, Any]]:
+        """
+        Find every folder with an exact name
+
+        Returns:
+            Matching folders in tree order
+        """
+        return list(self._by_name.get(name, []))
+
+    def find_folder_by_path(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a folder by its path from a root folder
+
+        Args:
+            path: Path like 'MyApp/Production/Payments' (case-insensitive)
+
+        Returns:
+            Folder object or None if not found
+        """
+        parts = [part.strip().lower() for part in path.split('/') if part.strip()]
+        return self._by_path.get('/'.join(parts))
+
+    def get_folder_path(self, folder_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the folders from the root down to a folder
+
+        Returns:
+            List of folder objects ending with the folder itself, or None if the
+            folder isn't in the tree
+        """
+        if folder_id not in self._by_id:
+            return None
+
+        path = []
+        current: Optional[str] = folder_id
+        while current is not None:
+            path.append(self._by_id[current])
+            current = self._parent[current]
+        path.reverse()
+        return path
+
+    def path_of(self, folder_id: str) -> Optional[str]:
+        """
+        Get a folder's path as a string
+
+        Returns:
+            Path like 'MyApp/Production', or None if the folder isn't in the tree
+        """
+        folders = self.get_folder_path(folder_id)
+        return '/'.join(folder['name'] for folder in folders) if folders is not None else None
+
+    def walk(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over every folder depth-first, parents before children"""
+        for folder_id in self._order:
+            yield self._by_id[folder_id]
@@ -33,6 +33,16 @@ setup(
         "requests>=2.25.0",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.8.0",
+        ],
+        "persistent": [
+            "cryptography>=3.4",
+        ],
+        "manifest": [
+            "pyyaml>=5.1",
+            "tomli>=1.1.0; python_version < '3.11'",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-asyncio>=0.18.0",
@@ -40,6 +50,11 @@ setup(
             "flake8>=3.8",
         ],
     },
+    entry_points={
+        "console_scripts": [
+            "key-vault-agent=key_vault_sdk.agent:main",
+        ],
+    },
     keywords="keyvault, sdk, secrets, api, vault, python",
     project_urls={
         "Bug Reports": "https://github.com/amaykorade/key-vault/issues",
@@ -0,0 +1,45 @@
+"""
+Shared fixtures: an in-process stub of the Key Vault API and clients pointed at it
+"""
+
+import os
+import sys
+
+import pytest
+
+SDK_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SDK_DIR)
+sys.path.insert(0, os.path.join(SDK_DIR, 'benchmarks'))
+
+from key_vault_sdk import KeyVault  # noqa: E402
+from stub_server import StubDataSet, StubServer  # noqa: E402
+
+
+@pytest.fixture
+def stub():
+    """Stub server with every route of the current API"""
+    with StubServer(StubDataSet(projects=2, folders_per_project=2, keys_per_folder=5)) as server:
+        yield server
+
+
+@pytest.fixture
+def legacy_stub():
+    """Stub server like an older release: unscoped /keys/path, no /keys/bulk or /keys/changes"""
+    with StubServer(StubDataSet(projects=2, folders_per_project=2, keys_per_folder=5),
+                    legacy=True) as server:
+        yield server
+
+
+@pytest.fixture
+def make_client():
+    """Factory for clients that are closed when the test ends"""
+    clients = []
+
+    def make(server, **kwargs):
+        kv = KeyVault(api_url=server.api_url, token="test-token", **kwargs)
+        clients.append(kv)
+        return kv
+
+    yield make
+    for kv in clients:
+        kv.close()
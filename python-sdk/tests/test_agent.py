@@ -0,0 +1,149 @@
+"""
+Tests for the local agent: serving lookups over its socket, and clients falling
+back to the API whenever the agent can't answer
+"""
+
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+
+import pytest
+
+from key_vault_sdk import KeyVault, KeyVaultNotFoundError
+from key_vault_sdk import agent as agent_module
+from key_vault_sdk.agent import KeyVaultAgent
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="needs Unix sockets")
+
+
+def _wait_for(path):
+    deadline = time.monotonic() + 5
+    while not os.path.exists(path):
+        assert time.monotonic() < deadline, "agent did not start"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to about 100 characters, so stay out of tmp_path
+    directory = tempfile.mkdtemp(prefix='kva-')
+    yield os.path.join(directory, 'agent.sock')
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def run_agent(stub, make_client, socket_path):
+    """Start an agent for a warm client on socket_path; stopped when the test ends"""
+    agents = []
+    agent_client = make_client(stub, cache_ttl=60, agent_socket='')
+
+    def run():
+        agent = KeyVaultAgent(agent_client, socket_path=socket_path)
+        thread = agent.start()
+        _wait_for(socket_path)
+        agents.append((agent, thread))
+        return agent, thread
+
+    yield run
+    for agent, thread in agents:
+        agent.shutdown()
+        thread.join(5)
+
+
+def test_agent_serves_lookups(stub, make_client, socket_path, run_agent):
+    agent, _ = run_agent()
+    agent.client.get_key('p0f0k1', include_value=True)
+    kv = make_client(stub, agent_socket=socket_path)
+    stub.reset_counts()
+
+    assert kv.get_key('p0f0k1', include_value=True)['value'] == 'secret-p0f0-1'
+    assert stub.request_count() == 0
+
+    # Errors raised in the agent come back with their own type
+    with pytest.raises(KeyVaultNotFoundError):
+        kv.get_key('missing')
+
+
+def test_agent_socket_is_owner_only(socket_path, run_agent):
+    run_agent()
+
+    assert os.stat(socket_path).st_mode & 0o777 == 0o600
+
+
+def test_other_token_falls_back_to_the_api(stub, socket_path, run_agent):
+    run_agent()
+    stub.reset_counts()
+
+    with KeyVault(api_url=stub.api_url, token="other-token", agent_socket=socket_path) as kv:
+        assert kv.get_key('p0f0k1', include_value=True)['value'] == 'secret-p0f0-1'
+
+    assert stub.requests['/keys/{id}'] == 1
+
+
+def test_client_survives_an_agent_restart(stub, make_client, socket_path, run_agent):
+    agent, thread = run_agent()
+    agent.client.get_key('p0f0k1', include_value=True)
+    kv = make_client(stub, agent_socket=socket_path)
+    assert kv.get_key('p0f0k1', include_value=True)['value'] == 'secret-p0f0-1'
+
+    agent.shutdown()
+    thread.join(5)
+    stub.reset_counts()
+
+    # While the agent is down the client asks the API itself
+    assert kv.get_key('p0f0k1', include_value=True)['value'] == 'secret-p0f0-1'
+    assert stub.requests['/keys/{id}'] == 1
+
+    run_agent()
+    stub.reset_counts()
+
+    assert kv.get_key('p0f0k1', include_value=True)['value'] == 'secret-p0f0-1'
+    assert stub.request_count() == 0
+
+
+def test_garbled_reply_falls_back_to_the_api(stub, make_client, socket_path):
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(1)
+
+    def serve_garbage():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            with conn, conn.makefile('rwb') as stream:
+                stream.readline()
+                stream.write(b'{"ok": true}\n')
+                stream.flush()
+                stream.readline()
+                stream.write(b'{"ok": true, "resu\n')
+                stream.flush()
+
+    thread = threading.Thread(target=serve_garbage, daemon=True)
+    thread.start()
+    try:
+        kv = make_client(stub, agent_socket=socket_path)
+        stub.reset_counts()
+
+        assert kv.get_key('p0f0k1', include_value=True)['value'] == 'secret-p0f0-1'
+        assert stub.requests['/keys/{id}'] == 1
+    finally:
+        listener.shutdown(socket.SHUT_RDWR)
+        listener.close()
+        thread.join(5)
+
+
+def test_oversized_reply_falls_back_to_the_api(stub, make_client, socket_path, run_agent, monkeypatch):
+    agent, _ = run_agent()
+    agent.client.get_key('p0f0k1', include_value=True)
+    kv = make_client(stub, agent_socket=socket_path)
+    kv.get_key('p0f0k0')  # Connect before the limit shrinks below the handshake
+    monkeypatch.setattr(agent_module, 'MAX_MESSAGE_SIZE', 100)
+    stub.reset_counts()
+
+    assert kv.get_key('p0f0k1', include_value=True)['value'] == 'secret-p0f0-1'
+    assert stub.requests['/keys/{id}'] == 1
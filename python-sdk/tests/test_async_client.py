@@ -0,0 +1,82 @@
+"""
+Tests for AsyncKeyVault against the stub server
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from key_vault_sdk import AsyncKeyVault, KeyVaultNotFoundError  # noqa: E402
+
+
+def _run(server, check, **kwargs):
+    async def main():
+        async with AsyncKeyVault(api_url=server.api_url, token="test-token", **kwargs) as kv:
+            return await check(kv)
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize('server_fixture', ['stub', 'legacy_stub'])
+def test_keys_by_path(server_fixture, request):
+    server = request.getfixturevalue(server_fixture)
+
+    async def check(kv):
+        result = await kv.get_keys_by_path('PROJECT1/folder0', limit=2, offset=3)
+        assert [key['id'] for key in result['keys']] == ['p1f0k3', 'p1f0k4']
+        with pytest.raises(KeyVaultNotFoundError):
+            await kv._resolve_path_to_folder('Project1/Nowhere')
+
+    _run(server, check)
+
+
+def test_concurrent_lookups(stub):
+    async def check(kv):
+        values = await kv.get_multiple_keys('p0f1', ['KEY_0', 'KEY_1', 'KEY_2', 'MISSING'])
+        assert values == {'KEY_0': 'secret-p0f1-0', 'KEY_1': 'secret-p0f1-1',
+                          'KEY_2': 'secret-p0f1-2', 'MISSING': None}
+
+        keys = await asyncio.gather(*(kv.get_key('p1k2', include_value=True) for _ in range(5)))
+        assert {key['value'] for key in keys} == {'secret-p1-2'}
+
+    _run(stub, check, cache_ttl=60)
+    assert stub.requests['/keys/{id}'] <= 4
+
+
+def test_search(stub):
+    async def check(kv):
+        result = await kv.search_keys('KEY_1', key_type='SECRET', limit=100)
+        assert sorted(key['id'] for key in result['keys']) == sorted(f'{folder}k1' for folder in stub.data.folders)
+
+    _run(stub, check)
+
+
+def test_value_cache_and_name_lookup(stub):
+    async def check(kv):
+        assert await kv.get_key_by_name('p1f1', 'KEY_3') == 'secret-p1f1-3'
+        stub.reset_counts()
+        assert (await kv.get_key('p1f1k3', include_value=True))['value'] == 'secret-p1f1-3'
+        assert stub.request_count() == 0
+        with pytest.raises(KeyVaultNotFoundError):
+            await kv.get_key_by_name('p1f1', 'MISSING')
+
+    _run(stub, check, cache_ttl=60)
+
+
+def test_iter_keys_pages(stub):
+    async def check(kv):
+        return [key['id'] async for key in kv.iter_keys('p0', page_size=2)]
+
+    assert _run(stub, check) == [f'p0k{k}' for k in range(5)]
+    assert stub.requests['/keys'] == 3
+
+
+def test_unchanged_listing_is_revalidated(stub):
+    async def check(kv):
+        first = await kv.list_folders()
+        assert await kv.list_folders() == first
+        assert kv.not_modified == 1
+
+    _run(stub, check)
+    assert stub.requests['/folders/tree'] == 2
@@ -0,0 +1,77 @@
+"""
+Tests for get_values_bulk(), through /keys/bulk and through its per-key fallback
+"""
+
+import pytest
+
+from key_vault_sdk import KeyVaultError
+from stub_server import StubDataSet, StubServer
+
+
+@pytest.fixture(params=['stub', 'legacy_stub'])
+def server(request):
+    """Each test runs against the current server and against an older one"""
+    return request.getfixturevalue(request.param)
+
+
+def _values(result):
+    return {key['id']: key['value'] for key in result['keys']}
+
+
+def test_bulk_values_by_folder(server, make_client):
+    kv = make_client(server)
+
+    result = kv.get_values_bulk(folder_id='p0f1')
+
+    assert _values(result) == {f'p0f1k{k}': f'secret-p0f1-{k}' for k in range(5)}
+    assert result['truncated'] is False
+
+
+def test_bulk_values_by_id_skip_unknown_keys(server, make_client):
+    kv = make_client(server)
+
+    result = kv.get_values_bulk(key_ids=['p1k0', 'missing', 'p0f0k4'])
+
+    assert _values(result) == {'p1k0': 'secret-p1-0', 'p0f0k4': 'secret-p0f0-4'}
+
+
+def test_bulk_values_fill_the_value_cache(server, make_client):
+    kv = make_client(server, cache_ttl=60)
+    kv.get_values_bulk(folder_id='p1f0')
+    server.reset_counts()
+
+    assert kv.get_key('p1f0k3', include_value=True)['value'] == 'secret-p1f0-3'
+    assert server.request_count() == 0
+
+
+def test_bulk_requires_folder_or_ids(server, make_client):
+    with pytest.raises(KeyVaultError):
+        make_client(server).get_values_bulk()
+
+
+def test_bulk_filters_by_environment(server, make_client):
+    kv = make_client(server)
+
+    assert len(kv.get_values_bulk(folder_id='p0f0', environment='production')['keys']) == 5
+    assert kv.get_values_bulk(folder_id='p0f0', environment='staging')['keys'] == []
+
+
+def test_long_id_lists_are_sent_in_chunks(make_client):
+    with StubServer(StubDataSet(projects=1, folders_per_project=1, keys_per_folder=600)) as stub:
+        kv = make_client(stub)
+        key_ids = list(stub.data.keys)[:1100]
+
+        result = kv.get_values_bulk(key_ids=key_ids)
+
+        assert [key['id'] for key in result['keys']] == key_ids
+        assert stub.requests['/keys/bulk'] == 3
+
+
+def test_folder_of_an_older_server_is_fetched_key_by_key(legacy_stub, make_client):
+    kv = make_client(legacy_stub)
+    legacy_stub.reset_counts()
+
+    kv.get_values_bulk(folder_id='p1f1')
+
+    assert legacy_stub.requests['/keys'] == 1
+    assert legacy_stub.requests['/keys/{id}'] == 6  # the missing /keys/bulk, then one per key
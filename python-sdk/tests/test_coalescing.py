@@ -0,0 +1,46 @@
+"""
+Tests for single-flight coalescing of concurrent identical requests
+"""
+
+import threading
+
+
+def _lookup_concurrently(kv, key_id, threads=8):
+    barrier = threading.Barrier(threads)
+    results = []
+
+    def lookup():
+        barrier.wait()
+        results.append(kv.get_key(key_id, include_value=True)['value'])
+
+    workers = [threading.Thread(target=lookup) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return results
+
+
+def test_concurrent_identical_lookups_are_coalesced(stub, make_client):
+    stub.latency = 0.1
+    kv = make_client(stub, max_workers=8)
+
+    assert _lookup_concurrently(kv, 'p1f0k1') == ['secret-p1f0-1'] * 8
+    assert stub.requests['/keys/{id}'] < 8
+    assert kv.metrics()['coalesced'] >= 8 - stub.requests['/keys/{id}']
+
+
+def test_coalescing_can_be_disabled(stub, make_client):
+    stub.latency = 0.1
+    kv = make_client(stub, max_workers=8, coalesce_requests=False)
+
+    assert _lookup_concurrently(kv, 'p1f0k1') == ['secret-p1f0-1'] * 8
+    assert stub.requests['/keys/{id}'] == 8
+
+
+def test_different_requests_are_not_coalesced(stub, make_client):
+    kv = make_client(stub)
+
+    assert kv.get_key('p0f0k0', include_value=True)['value'] == 'secret-p0f0-0'
+    assert kv.get_key('p0f0k0')['name'] == 'KEY_0'
+    assert 'value' not in kv.get_key('p0f0k0')
@@ -0,0 +1,129 @@
+"""
+Tests for DiskCache: warm starts from the encrypted cache file and the cases where
+the file has to be ignored
+"""
+
+import json
+import os
+import stat
+import time
+import zlib
+
+import pytest
+
+pytest.importorskip('cryptography')
+
+from cryptography.fernet import Fernet  # noqa: E402
+
+from key_vault_sdk import DiskCache, KeyVault  # noqa: E402
+from key_vault_sdk.disk_cache import MAGIC  # noqa: E402
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return str(tmp_path / 'vault.bin')
+
+
+@pytest.fixture
+def cache_key():
+    return DiskCache.generate_key()
+
+
+def _warm_up(stub, make_client, cache_file, cache_key, **kwargs):
+    """Fetch a few values with one client and save them to the cache file"""
+    kv = make_client(stub, cache_ttl=60, disk_cache=DiskCache(cache_file, cache_key), **kwargs)
+    kv.get_key('p0f0k1', include_value=True)
+    kv.get_key_by_name('p0f1', 'KEY_2')
+    kv.close()
+
+
+def test_warm_start_makes_no_requests(stub, make_client, cache_file, cache_key):
+    _warm_up(stub, make_client, cache_file, cache_key)
+    stub.reset_counts()
+
+    kv = make_client(stub, cache_ttl=60, disk_cache=DiskCache(cache_file, cache_key))
+
+    assert kv.get_key('p0f0k1', include_value=True)['value'] == 'secret-p0f0-1'
+    assert kv.get_key_by_name('p0f1', 'KEY_2') == 'secret-p0f1-2'
+    assert stub.request_count() == 0
+
+
+def test_cache_file_is_owner_only(stub, make_client, cache_file, cache_key):
+    old_umask = os.umask(0)
+    try:
+        _warm_up(stub, make_client, cache_file, cache_key)
+    finally:
+        os.umask(old_umask)
+
+    assert stat.S_IMODE(os.stat(cache_file).st_mode) == 0o600
+    assert b'secret-p0f0-1' not in open(cache_file, 'rb').read()
+
+
+def test_wrong_key_starts_cold(stub, make_client, cache_file, cache_key):
+    _warm_up(stub, make_client, cache_file, cache_key)
+    stub.reset_counts()
+
+    kv = make_client(stub, cache_ttl=60, disk_cache=DiskCache(cache_file, DiskCache.generate_key()))
+
+    assert kv.get_key('p0f0k1', include_value=True)['value'] == 'secret-p0f0-1'
+    assert stub.requests['/keys/{id}'] == 1
+
+
+@pytest.mark.parametrize('corrupt', [
+    lambda data: data[:len(data) // 2],
+    lambda data: data[:-8] + b'AAAAAAAA',
+    lambda data: b'garbage',
+    lambda data: b'',
+])
+def test_corrupt_file_starts_cold(stub, make_client, cache_file, cache_key, corrupt):
+    _warm_up(stub, make_client, cache_file, cache_key)
+    with open(cache_file, 'rb') as f:
+        data = f.read()
+    with open(cache_file, 'wb') as f:
+        f.write(corrupt(data))
+    stub.reset_counts()
+
+    kv = make_client(stub, cache_ttl=60, disk_cache=DiskCache(cache_file, cache_key))
+
+    assert not kv.load_cache()
+    assert kv.get_key('p0f0k1', include_value=True)['value'] == 'secret-p0f0-1'
+    assert stub.requests['/keys/{id}'] == 1
+
+
+def test_snapshot_of_another_token_is_ignored(stub, cache_file, cache_key, make_client):
+    _warm_up(stub, make_client, cache_file, cache_key)
+    stub.reset_counts()
+
+    with KeyVault(api_url=stub.api_url, token="other-token", cache_ttl=60,
+                  disk_cache=DiskCache(cache_file, cache_key)) as kv:
+        assert not kv.load_cache()
+        kv.get_key('p0f0k1', include_value=True)
+
+    assert stub.requests['/keys/{id}'] == 1
+
+
+def test_expired_values_are_fetched_again(stub, make_client, cache_file, cache_key):
+    kv = make_client(stub, cache_ttl=0.2, disk_cache=DiskCache(cache_file, cache_key))
+    kv.get_key('p0f0k1', include_value=True)
+    kv.close()
+    time.sleep(0.3)
+    stub.reset_counts()
+
+    kv = make_client(stub, cache_ttl=0.2, disk_cache=DiskCache(cache_file, cache_key))
+    kv.get_key('p0f0k1', include_value=True)
+
+    assert stub.requests['/keys/{id}'] == 1
+
+
+def test_snapshot_older_than_max_age_is_ignored(stub, make_client, cache_file, cache_key):
+    _warm_up(stub, make_client, cache_file, cache_key)
+    # Re-encrypt the same snapshot as if it had been written two minutes ago
+    fernet = Fernet(cache_key)
+    with open(cache_file, 'rb') as f:
+        payload = fernet.decrypt(f.read()[len(MAGIC):])
+    with open(cache_file, 'wb') as f:
+        f.write(MAGIC + fernet.encrypt_at_time(payload, int(time.time()) - 120))
+
+    assert DiskCache(cache_file, cache_key, max_age=60).load() is None
+    snapshot = DiskCache(cache_file, cache_key).load()
+    assert snapshot == json.loads(zlib.decompress(payload))
@@ -0,0 +1,39 @@
+"""
+Tests for revalidating listings with ETag / If-None-Match
+"""
+
+
+def test_unchanged_listing_is_revalidated(stub, make_client):
+    kv = make_client(stub)
+    first = kv.list_folders()
+
+    assert kv.list_folders() == first
+    assert kv.not_modified == 1
+
+
+def test_changed_listing_is_refetched(stub, make_client):
+    kv = make_client(stub)
+    kv.list_keys(folder_id='p0f0')
+    stub.data.keys['p0f0k0']['name'] = 'RENAMED'
+
+    keys = kv.list_keys(folder_id='p0f0')['keys']
+
+    assert keys[0]['name'] == 'RENAMED'
+    assert kv.not_modified == 0
+
+
+def test_revalidated_listing_is_a_copy(stub, make_client):
+    kv = make_client(stub)
+    kv.list_keys(folder_id='p1')['keys'][0]['name'] = 'changed by caller'
+
+    assert kv.list_keys(folder_id='p1')['keys'][0]['name'] == 'KEY_0'
+    assert kv.not_modified == 1
+
+
+def test_revalidation_can_be_disabled(stub, make_client):
+    kv = make_client(stub, revalidate=False)
+    kv.list_folders()
+    kv.list_folders()
+
+    assert kv.not_modified == 0
+    assert stub.requests['/folders/tree'] == 2
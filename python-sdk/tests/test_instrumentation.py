@@ -0,0 +1,180 @@
+"""
+Tests for instrumentation hooks and the MetricsCollector
+"""
+
+import socket
+
+import pytest
+
+from key_vault_sdk import (
+    Instrumentation, KeyVault, KeyVaultNotFoundError, KeyVaultUnavailableError,
+    MetricsCollector, RetryPolicy
+)
+from key_vault_sdk.instrumentation import endpoint_template
+
+
+class Recorder(Instrumentation):
+    """Keeps every event it is given"""
+
+    def __init__(self):
+        self.events = []
+
+    def before_request(self, event):
+        self.events.append(('before', dict(event)))
+
+    def after_request(self, event):
+        self.events.append(('after', dict(event)))
+
+    def on_call(self, event):
+        self.events.append(('call', dict(event)))
+
+    def of(self, kind):
+        return [event for k, event in self.events if k == kind]
+
+
+def test_hooks_see_a_successful_request(stub, make_client):
+    recorder = Recorder()
+    kv = make_client(stub, hooks=[recorder])
+
+    kv.get_key('p0f0k1', include_value=True)
+
+    after = {event['route']: event for event in recorder.of('after')}
+    assert set(after) == {'/auth/permissions', '/keys/{id}'}
+    assert len(recorder.of('before')) == 2
+    key_event = after['/keys/{id}']
+    assert key_event['method'] == 'GET'
+    assert key_event['endpoint'] == '/keys/p0f0k1'
+    assert key_event['status'] == 200
+    assert key_event['error'] is None
+    assert key_event['attempt'] == 0
+    assert key_event['bytes'] > 0 and key_event['latency'] > 0
+    calls = {event['name']: event for event in recorder.of('call')}
+    assert calls['get_key']['error'] is None
+
+
+def test_hooks_see_a_failed_request(stub, make_client):
+    recorder = Recorder()
+    kv = make_client(stub, hooks=[recorder])
+
+    with pytest.raises(KeyVaultNotFoundError):
+        kv.get_key('missing')
+
+    [key_event] = [event for event in recorder.of('after') if event['route'] == '/keys/{id}']
+    assert key_event['status'] == 404
+    [call] = [event for event in recorder.of('call') if event['name'] == 'get_key']
+    assert isinstance(call['error'], KeyVaultNotFoundError)
+
+
+def test_hooks_see_an_unreachable_api(make_client):
+    with socket.socket() as unused:
+        unused.bind(('127.0.0.1', 0))
+        port = unused.getsockname()[1]
+    recorder = Recorder()
+    kv = KeyVault(api_url=f"http://127.0.0.1:{port}/api", token="test-token", hooks=[recorder],
+                  retry_policy=RetryPolicy(max_retries=0))
+    try:
+        assert not kv.test_connection()
+    finally:
+        kv.close()
+
+    [event] = recorder.of('after')
+    assert event['status'] is None
+    assert isinstance(event['error'], KeyVaultUnavailableError)
+    assert event['bytes'] == 0
+
+
+def test_cache_hits_are_calls_without_requests(stub, make_client):
+    recorder = Recorder()
+    kv = make_client(stub, cache_ttl=60, hooks=[recorder])
+    kv.get_key('p0f0k1', include_value=True)
+    recorder.events.clear()
+
+    kv.get_key('p0f0k1', include_value=True)
+
+    assert [kind for kind, _ in recorder.events] == ['call']
+    assert recorder.events[0][1]['name'] == 'get_key'
+
+
+def test_broken_hook_does_not_break_requests(stub, make_client):
+    class Broken(Instrumentation):
+        def after_request(self, event):
+            raise RuntimeError("hook failed")
+
+    recorder = Recorder()
+    kv = make_client(stub, hooks=[Broken(), recorder])
+
+    assert kv.get_key('p0f0k1')['id'] == 'p0f0k1'
+    assert len(recorder.of('after')) == 2
+
+
+def test_metrics_match_the_requests_served(stub, make_client):
+    metrics = MetricsCollector()
+    kv = make_client(stub, cache_ttl=60)
+    kv.add_hook(metrics)
+    stub.latency = 0.02
+
+    kv.get_keys_by_path('Project0/Folder1')
+    for key_id in ('p0f0k0', 'p0f0k1', 'p0f0k1', 'p1k2'):
+        kv.get_key(key_id, include_value=True)
+    with pytest.raises(KeyVaultNotFoundError):
+        kv.get_key('missing')
+
+    snapshot = metrics.snapshot()
+    assert {name: series['count'] for name, series in snapshot['requests'].items()} == {
+        f'GET {route}': count for route, count in stub.requests.items()
+    }
+    keys = snapshot['requests']['GET /keys/{id}']
+    assert keys['count'] == 4  # The repeated key came from the cache
+    assert keys['errors'] == 1
+    assert keys['statuses'] == {'200': 3, '404': 1}
+    assert keys['retries'] == 0
+    assert keys['bytes'] > 0
+    assert 0.02 <= keys['p50'] <= keys['p95'] <= keys['p99'] <= keys['max']
+
+    calls = snapshot['calls']
+    assert calls['get_key']['count'] == 5
+    assert calls['get_key']['errors'] == 1
+    assert calls['get_keys_by_path']['count'] == 1
+    assert calls['get_key']['p50'] <= calls['get_key']['max']
+
+
+def test_metrics_count_retries(stub, make_client):
+    metrics = MetricsCollector()
+    kv = make_client(stub, hooks=[metrics], retry_policy=RetryPolicy(backoff_factor=0.01))
+    handle = stub.handle
+    failures = [503]
+
+    def flaky(path, query):
+        route, status, body = handle(path, query)
+        if route == '/keys/{id}' and failures:
+            return route, failures.pop(), {'error': 'Service unavailable'}
+        return route, status, body
+
+    stub.handle = flaky
+    kv.get_key('p0f0k1')
+
+    keys = metrics.snapshot()['requests']['GET /keys/{id}']
+    assert keys['count'] == 2
+    assert keys['retries'] == 1
+    assert keys['errors'] == 1
+    assert keys['statuses'] == {'503': 1, '200': 1}
+
+
+def test_latency_percentiles():
+    metrics = MetricsCollector(max_samples=100)
+    for latency in range(1, 201):
+        metrics.after_request({'method': 'GET', 'route': '/keys', 'latency': float(latency), 'status': 200})
+
+    series = metrics.snapshot()['requests']['GET /keys']
+    # Percentiles cover the 100 most recent samples, counters all of them
+    assert series['count'] == 200
+    assert (series['p50'], series['p95'], series['p99'], series['max']) == (150.0, 195.0, 199.0, 200.0)
+
+    metrics.reset()
+    assert metrics.snapshot() == {'requests': {}, 'calls': {}}
+
+
+def test_endpoint_template():
+    assert endpoint_template('/keys/ck123') == '/keys/{id}'
+    assert endpoint_template('/keys/bulk') == '/keys/bulk'
+    assert endpoint_template('/folders/abc/keys?limit=5') == '/folders/{id}/keys'
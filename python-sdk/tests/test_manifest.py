@@ -0,0 +1,101 @@
+"""
+Tests for loading secrets from a manifest
+"""
+
+import json
+
+import pytest
+
+from key_vault_sdk import KeyVaultError, KeyVaultNotFoundError
+from key_vault_sdk.manifest import KeyVaultManifestError, parse_manifest
+
+MANIFEST = {
+    'secrets': {
+        'FIRST': 'Project0/Folder0/KEY_1',
+        'SECOND': {'path': 'project1/folder1', 'name': 'KEY_2'},
+        'ROOT': 'Project1/KEY_0',
+        'NO_KEY': {'path': 'Project0/Folder0', 'name': 'MISSING', 'optional': True},
+        'NO_FOLDER': {'path': 'Project0/Nowhere', 'name': 'KEY_1', 'optional': True}
+    }
+}
+
+EXPECTED = {
+    'FIRST': 'secret-p0f0-1',
+    'SECOND': 'secret-p1f1-2',
+    'ROOT': 'secret-p1-0',
+    'NO_KEY': None,
+    'NO_FOLDER': None
+}
+
+
+@pytest.mark.parametrize('server', ['stub', 'legacy_stub'])
+def test_load_manifest(server, request, make_client):
+    stub = request.getfixturevalue(server)
+    kv = make_client(stub)
+
+    assert kv.load_manifest(MANIFEST) == EXPECTED
+
+
+def test_missing_required_secrets_are_reported_together(stub, make_client):
+    kv = make_client(stub)
+    manifest = {'secrets': {
+        'FIRST': 'Project0/Folder0/KEY_1',
+        'NO_KEY': 'Project0/Folder0/MISSING',
+        'NO_FOLDER': 'Project0/Nowhere/KEY_1',
+        'NO_PROJECT': 'Nowhere/KEY_1'
+    }}
+
+    with pytest.raises(KeyVaultManifestError) as raised:
+        kv.load_manifest(manifest)
+
+    assert sorted(raised.value.errors) == ['NO_FOLDER', 'NO_KEY', 'NO_PROJECT']
+    assert all(isinstance(e, KeyVaultNotFoundError) for e in raised.value.errors.values())
+
+
+def test_resolution_errors_other_than_not_found_fail_optional_entries(stub, make_client):
+    kv = make_client(stub)
+    manifest = {'secrets': {'MAYBE': {'path': 'Project0/Folder0', 'name': 'KEY_1', 'optional': True}}}
+
+    def misconfigured(path):
+        # Not a missing folder, even though the message says "not found"
+        raise KeyVaultError("Invalid JSON response: <html>Page not found</html>")
+    kv._resolve_path_to_folder = misconfigured
+
+    with pytest.raises(KeyVaultManifestError) as raised:
+        kv.load_manifest(manifest)
+    assert list(raised.value.errors) == ['MAYBE']
+
+
+def test_cached_plan_skips_resolution(stub, make_client, tmp_path):
+    plan_cache = str(tmp_path / 'plan.json')
+    make_client(stub).load_manifest(MANIFEST, plan_cache=plan_cache)
+    assert set(json.load(open(plan_cache))['keys']) == set(MANIFEST['secrets'])
+
+    stub.reset_counts()
+    assert make_client(stub).load_manifest(MANIFEST, plan_cache=plan_cache) == EXPECTED
+    assert stub.requests['/keys/bulk'] == 1
+    assert stub.requests['/folders/tree'] == 0
+    assert stub.requests['/keys'] == 0
+
+
+def test_cached_plan_recovers_from_renamed_key(stub, make_client, tmp_path):
+    plan_cache = str(tmp_path / 'plan.json')
+    make_client(stub).load_manifest(MANIFEST, plan_cache=plan_cache)
+
+    # KEY_1 now names a different key in the same folder
+    keys = stub.data.keys_by_folder['p0f0']
+    keys[1]['name'], keys[3]['name'] = 'KEY_3', 'KEY_1'
+
+    assert make_client(stub).load_manifest(MANIFEST, plan_cache=plan_cache)['FIRST'] == 'secret-p0f0-3'
+
+
+def test_parse_manifest_reports_every_problem():
+    with pytest.raises(KeyVaultManifestError) as raised:
+        parse_manifest({'secrets': {
+            'OK': 'App/KEY',
+            'NO_FOLDER': 'KEY',
+            'UNKNOWN': {'path': 'App', 'name': 'KEY', 'color': 'red'},
+            'NO_NAME': {'path': 'App'}
+        }})
+
+    assert sorted(raised.value.errors) == ['NO_FOLDER', 'NO_NAME', 'UNKNOWN']
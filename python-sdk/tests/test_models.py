@@ -0,0 +1,43 @@
+"""
+Tests for the typed Key/Folder/Project records
+"""
+
+import pytest
+
+from key_vault_sdk.models import Folder, Key, _Record
+
+
+def test_record_base_is_abstract():
+    with pytest.raises(TypeError):
+        _Record()
+
+
+def test_typed_keys_match_dictionaries(stub, make_client):
+    kv = make_client(stub)
+    plain = kv.list_keys(folder_id='p0f1', limit=100)['keys']
+    typed = kv.list_keys(folder_id='p0f1', limit=100, typed=True)['keys']
+
+    assert all(isinstance(key, Key) for key in typed)
+    # to_dict() also fills fields the listing left out, like expiresAt
+    assert [{field: key.to_dict()[field] for field in raw} for key, raw in zip(typed, plain)] == plain
+    assert typed[2]['folderId'] == typed[2].folder_id == 'p0f1'
+    assert not hasattr(typed[0], '__dict__')
+
+
+def test_key_value_is_fetched_once(stub, make_client):
+    kv = make_client(stub, cache_ttl=60)
+    key = kv.list_keys(folder_id='p1f0', typed=True)['keys'][4]
+    stub.reset_counts()
+
+    assert key.value == 'secret-p1f0-4'
+    assert key['value'] == 'secret-p1f0-4'
+    assert stub.request_count() == 1
+
+
+def test_typed_folder_tree(stub, make_client):
+    kv = make_client(stub)
+    tree = kv.list_folders(project_id='p1', typed=True)['folders']
+
+    assert isinstance(tree[0], Folder)
+    assert [child.name for child in tree[0].children] == ['Folder0', 'Folder1']
+    assert tree[0] == kv.list_folders(project_id='p1', typed=True)['folders'][0]
@@ -0,0 +1,47 @@
+"""
+Tests for get_multiple_keys(), sequential and fanned out on a thread pool
+"""
+
+import time
+
+import pytest
+
+
+@pytest.mark.parametrize('parallel', [False, True])
+def test_multiple_keys(stub, make_client, parallel):
+    kv = make_client(stub)
+
+    values = kv.get_multiple_keys('p1f1', ['KEY_0', 'KEY_4', 'MISSING'], parallel=parallel)
+
+    assert values == {'KEY_0': 'secret-p1f1-0', 'KEY_4': 'secret-p1f1-4', 'MISSING': None}
+
+
+def test_parallel_fetches_overlap(stub, make_client):
+    kv = make_client(stub, max_workers=8)
+    names = [f'KEY_{k}' for k in range(5)]
+    kv.get_multiple_keys('p0f0', names)  # fills the name index
+    stub.latency = 0.1
+
+    started = time.perf_counter()
+    values = kv.get_multiple_keys('p0f0', names, parallel=True)
+    elapsed = time.perf_counter() - started
+
+    assert values == {name: f'secret-p0f0-{k}' for k, name in enumerate(names)}
+    assert elapsed < 0.4  # five requests of 0.1s each, sent together
+
+
+def test_parallel_collects_errors(stub, make_client):
+    handle = stub.handle
+
+    def forbid_key(path, query):
+        if path == '/api/keys/p0f0k1':
+            return '/keys/{id}', 403, {'error': 'Access denied'}
+        return handle(path, query)
+    stub.handle = forbid_key
+
+    kv = make_client(stub)
+    errors = {}
+    values = kv.get_multiple_keys('p0f0', ['KEY_0', 'KEY_1'], parallel=True, errors=errors)
+
+    assert values == {'KEY_0': 'secret-p0f0-0', 'KEY_1': None}
+    assert list(errors) == ['KEY_1']
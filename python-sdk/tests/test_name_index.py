@@ -0,0 +1,55 @@
+"""
+Tests for the per-folder key name index used by get_key_by_name()
+"""
+
+import pytest
+
+from key_vault_sdk import KeyVaultNotFoundError
+
+
+def test_key_by_name_uses_name_index(stub, make_client):
+    kv = make_client(stub)
+    assert kv.get_key_by_name('p0f1', 'KEY_3') == 'secret-p0f1-3'
+    stub.reset_counts()
+
+    assert kv.get_key_by_name('p0f1', 'KEY_4') == 'secret-p0f1-4'
+    assert stub.requests['/keys'] == 0
+    assert stub.requests['/keys/{id}'] == 1
+
+
+def test_warm_name_index(stub, make_client):
+    kv = make_client(stub)
+
+    assert kv.warm_name_index(['p0f0', 'p1']) == {'p0f0': 5, 'p1': 5}
+    stub.reset_counts()
+
+    assert kv.get_key_by_name('p1', 'KEY_1') == 'secret-p1-1'
+    assert dict(stub.requests) == {'/keys/{id}': 1}
+
+
+def test_renamed_key_is_found_again(stub, make_client):
+    kv = make_client(stub)
+    kv.warm_name_index(['p0f0'])
+
+    # KEY_1 now names a different key
+    keys = stub.data.keys_by_folder['p0f0']
+    keys[1]['name'], keys[3]['name'] = 'KEY_3', 'KEY_1'
+
+    assert kv.get_key_by_name('p0f0', 'KEY_1') == 'secret-p0f0-3'
+
+
+def test_missing_name(stub, make_client):
+    kv = make_client(stub)
+
+    with pytest.raises(KeyVaultNotFoundError):
+        kv.get_key_by_name('p0f0', 'MISSING')
+
+
+def test_name_index_can_be_disabled(stub, make_client):
+    kv = make_client(stub, name_cache_ttl=0)
+    kv.get_key_by_name('p0f0', 'KEY_0')
+    stub.reset_counts()
+
+    kv.get_key_by_name('p0f0', 'KEY_1')
+
+    assert stub.requests['/keys'] == 1
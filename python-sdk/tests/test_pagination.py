@@ -0,0 +1,37 @@
+"""
+Tests for the lazily paginating iter_keys() and iter_search()
+"""
+
+
+def test_iter_keys_pages_through_folder(stub, make_client):
+    kv = make_client(stub)
+
+    for prefetch in (False, True):
+        keys = list(kv.iter_keys('p0f0', page_size=2, prefetch=prefetch))
+        assert [key['id'] for key in keys] == [f'p0f0k{k}' for k in range(5)]
+
+
+def test_iter_search_pages_through_results(stub, make_client):
+    kv = make_client(stub)
+
+    keys = list(kv.iter_search('KEY_0', page_size=4))
+
+    assert sorted(key['id'] for key in keys) == sorted(f'{folder}k0' for folder in stub.data.folders)
+
+
+def test_iter_keys_fetches_pages_lazily(stub, make_client):
+    kv = make_client(stub)
+    stub.reset_counts()
+
+    keys = kv.iter_keys('p1f1', page_size=2)
+    assert stub.request_count() == 0
+    next(keys)
+    next(keys)
+    assert stub.requests['/keys'] == 1
+
+    assert len(list(keys)) == 3
+    assert stub.requests['/keys'] == 3
+
+
+def test_iter_keys_of_empty_folder(stub, make_client):
+    assert list(make_client(stub).iter_keys('no-such-folder')) == []
@@ -0,0 +1,61 @@
+"""
+Tests for the background refresher
+"""
+
+import threading
+import time
+
+import pytest
+
+
+@pytest.mark.parametrize('server', ['stub', 'legacy_stub'])
+def test_refresh_fetches_current_values(server, request, make_client):
+    stub = request.getfixturevalue(server)
+    kv = make_client(stub, cache_ttl=60, max_staleness=3600)
+    refresher = kv.start_refresher(key_ids=['p0f0k1'], paths=['Project1/Folder1'], interval=3600)
+    try:
+        assert kv.get_key('p0f0k1', include_value=True)['value'] == 'secret-p0f0-1'
+
+        stub.data.keys['p0f0k1']['value'] = 'rotated'
+        stub.data.keys['p1f1k2']['value'] = 'rotated-too'
+        refresher.refresh()
+
+        assert refresher.last_error is None
+        stub.reset_counts()
+        assert kv.get_key('p0f0k1', include_value=True)['value'] == 'rotated'
+        assert kv.get_key('p1f1k2', include_value=True)['value'] == 'rotated-too'
+        assert stub.request_count() == 0
+    finally:
+        kv.stop_refresher()
+
+
+
+def _refresher_threads():
+    return [thread for thread in threading.enumerate() if thread.name == 'KeyVaultRefresher']
+
+
+def test_stop_waits_for_the_thread(stub, make_client):
+    kv = make_client(stub, cache_ttl=60)
+    refresher = kv.start_refresher(key_ids=['p0f0k1'], interval=0.01)
+    time.sleep(0.05)
+
+    refresher.stop()
+
+    assert not refresher.running
+    assert _refresher_threads() == []
+
+
+def test_restart_during_a_refresh_leaves_one_thread(stub, make_client):
+    kv = make_client(stub, cache_ttl=60)
+    refresher = kv.start_refresher(key_ids=['p0f0k1'], interval=0.01)
+    stub.latency = 0.3
+    time.sleep(0.1)  # A refresh is now waiting on the slow API
+
+    refresher.stop(timeout=0)
+    refresher.start()
+    time.sleep(0.6)
+
+    try:
+        assert len(_refresher_threads()) == 1
+    finally:
+        refresher.stop(timeout=None)
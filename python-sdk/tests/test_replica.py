@@ -0,0 +1,86 @@
+"""
+Tests for KeyReplica and KeyVault.sync() over the change feed
+"""
+
+import threading
+import time
+
+import pytest
+
+from key_vault_sdk import KeyReplica, KeyVaultNotFoundError
+
+
+def test_sync_loads_every_key(stub, make_client):
+    kv = make_client(stub)
+    replica = KeyReplica()
+
+    assert kv.sync(replica)['updated'] == 30
+    assert kv.sync(replica)['updated'] == 0
+    assert replica.get_by_name('p1f1', 'KEY_2')['value'] == 'secret-p1f1-2'
+
+
+def test_sync_without_change_feed(legacy_stub, make_client):
+    kv = make_client(legacy_stub)
+
+    with pytest.raises(KeyVaultNotFoundError):
+        kv.sync(KeyReplica())
+
+
+def test_sync_applies_deletions(stub, make_client):
+    kv = make_client(stub, cache_ttl=60)
+    replica = KeyReplica()
+    kv.sync(replica)
+    kv.get_key('p0f0k1', include_value=True)
+    handle = stub.handle
+
+    def feed_with_deletion(path, query):
+        if path == '/api/keys/changes' and query.get('cursor') == replica.cursor:
+            return '/keys/changes', 200, {'success': True, 'updated': [], 'cursor': 'after-delete',
+                                          'deleted': [{'id': 'p0f0k1', 'folderId': 'p0f0'}],
+                                          'hasMore': False}
+        return handle(path, query)
+    stub.handle = feed_with_deletion
+
+    assert kv.sync(replica) == {'updated': 0, 'deleted': 1, 'cursor': 'after-delete'}
+    assert 'p0f0k1' not in replica
+    assert replica.get_by_name('p0f0', 'KEY_1') is None
+    assert kv.cache.get('p0f0k1') is None
+
+
+def test_replica_apply():
+    replica = KeyReplica()
+    replica.apply([{'id': 'a', 'folderId': 'f', 'name': 'TOKEN', 'value': '1'},
+                   {'id': 'b', 'folderId': 'f', 'name': 'OTHER', 'value': '2'}], [], 'c1')
+
+    # Renaming b to TOKEN leaves a as the key found by that name
+    previous = replica.apply([{'id': 'b', 'folderId': 'f', 'name': 'TOKEN', 'value': '3'}], [], 'c2')
+    assert [key['value'] for key in previous] == ['2']
+    assert replica.get_by_name('f', 'TOKEN')['id'] == 'a'
+
+    # Once a is deleted, b takes the name over
+    replica.apply([], ['a', 'unknown'], 'c3')
+    assert replica.get_by_name('f', 'TOKEN')['id'] == 'b'
+    assert replica.cursor == 'c3'
+    assert [key['id'] for key in replica.keys('f')] == ['b']
+
+
+def test_replica_scope_is_exclusive():
+    with pytest.raises(ValueError):
+        KeyReplica(folder_id='f', project_id='p')
+
+
+def test_restarted_watcher_runs_one_thread(stub, make_client):
+    kv = make_client(stub)
+    watcher = kv.watch(KeyReplica(), interval=0.01)
+    stub.latency = 0.3
+    time.sleep(0.1)  # A sync is now waiting on the slow API
+
+    watcher.stop(timeout=0)
+    watcher.start()
+    time.sleep(0.6)
+
+    try:
+        assert len([t for t in threading.enumerate() if t.name == 'KeyVaultWatcher']) == 1
+    finally:
+        watcher.stop(timeout=None)
+    assert not watcher.running
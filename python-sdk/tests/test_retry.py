@@ -0,0 +1,151 @@
+"""
+Tests for RetryPolicy and CircuitBreaker against the stub server
+"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+
+from key_vault_sdk import (
+    CircuitBreaker, KeyVaultCircuitOpenError, KeyVaultUnavailableError, RetryPolicy
+)
+
+FAST = dict(backoff_factor=0.01, max_backoff=0.05)
+
+
+def _fail_keys(stub, statuses):
+    """Answer the next requests for single keys with the given error statuses"""
+    handle = stub.handle
+    pending = list(statuses)
+
+    def failing(path, query):
+        route, status, body = handle(path, query)
+        if route == '/keys/{id}' and pending:
+            return route, pending.pop(0), {'error': 'Service unavailable'}
+        return route, status, body
+
+    stub.handle = failing
+
+
+def test_5xx_responses_are_retried(stub, make_client):
+    kv = make_client(stub, retry_policy=RetryPolicy(**FAST))
+    _fail_keys(stub, [500, 503])
+
+    assert kv.get_key('p0f0k1')['id'] == 'p0f0k1'
+    assert stub.requests['/keys/{id}'] == 3
+
+
+def test_retries_give_up_after_max_retries(stub, make_client):
+    kv = make_client(stub, retry_policy=RetryPolicy(max_retries=2, **FAST))
+    _fail_keys(stub, [503] * 5)
+
+    with pytest.raises(KeyVaultUnavailableError):
+        kv.get_key('p0f0k1')
+    assert stub.requests['/keys/{id}'] == 3
+
+
+def test_retry_after_is_honoured(stub, make_client):
+    kv = make_client(stub, retry_policy=RetryPolicy(backoff_factor=0.01, max_backoff=1))
+    kv.get_key('p0f0k0')
+    stub.headers['Retry-After'] = '0.3'
+    _fail_keys(stub, [429])
+
+    started = time.monotonic()
+    kv.get_key('p0f0k1')
+
+    assert time.monotonic() - started >= 0.3
+
+
+def test_retry_after_can_be_ignored(stub, make_client):
+    kv = make_client(stub, retry_policy=RetryPolicy(**FAST, respect_retry_after=False))
+    kv.get_key('p0f0k0')
+    stub.headers['Retry-After'] = '5'
+    _fail_keys(stub, [503])
+
+    started = time.monotonic()
+    kv.get_key('p0f0k1')
+
+    assert time.monotonic() - started < 1
+    assert stub.requests['/keys/{id}'] == 3
+
+
+def test_retry_after_parsing():
+    assert RetryPolicy.parse_retry_after('2') == 2.0
+    assert 8 < RetryPolicy.parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert RetryPolicy.parse_retry_after(formatdate(time.time() - 10, usegmt=True)) == 0.0
+    assert RetryPolicy.parse_retry_after('soon') is None
+    assert RetryPolicy(max_backoff=1).get_backoff(0, retry_after=30) == 1
+
+
+def test_non_idempotent_requests_are_not_retried(stub, make_client):
+    kv = make_client(stub, retry_policy=RetryPolicy(**FAST))
+    handle = stub.handle
+    stub.handle = lambda path, query: (handle(path, query)[0], 503, {'error': 'Service unavailable'})
+
+    with pytest.raises(KeyVaultUnavailableError):
+        kv._make_request('POST', '/keys', json={'name': 'NEW_KEY'})
+    assert stub.requests['/keys'] == 1
+
+
+def test_timeouts_are_not_retried_by_default(stub, make_client):
+    kv = make_client(stub, timeout=0.1, retry_policy=RetryPolicy(**FAST))
+    kv.has_permission('keys:read')
+    stub.latency = 0.3
+
+    with pytest.raises(KeyVaultUnavailableError):
+        kv.get_key('p0f0k1')
+    assert stub.requests['/keys/{id}'] == 1
+
+
+def test_timeouts_are_retried_when_enabled(stub, make_client):
+    kv = make_client(stub, timeout=0.1, retry_policy=RetryPolicy(max_retries=2, retry_timeouts=True, **FAST))
+    kv.has_permission('keys:read')
+    stub.latency = 0.3
+
+    with pytest.raises(KeyVaultUnavailableError):
+        kv.get_key('p0f0k1')
+    assert stub.requests['/keys/{id}'] == 3
+
+
+def test_circuit_opens_half_opens_and_closes(stub, make_client):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.2)
+    kv = make_client(stub, retry_policy=RetryPolicy(max_retries=0), circuit_breaker=breaker)
+    kv.has_permission('keys:read')
+    _fail_keys(stub, [503, 503])
+
+    for _ in range(2):
+        with pytest.raises(KeyVaultUnavailableError):
+            kv.get_key('p0f0k1')
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # Open: fail fast without a request
+    stub.reset_counts()
+    with pytest.raises(KeyVaultCircuitOpenError):
+        kv.get_key('p0f0k1')
+    assert stub.request_count() == 0
+
+    time.sleep(0.25)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    # The trial request succeeds and closes the circuit
+    assert kv.get_key('p0f0k1')['id'] == 'p0f0k1'
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+
+
+def test_failed_trial_reopens_the_circuit(stub, make_client):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.2)
+    kv = make_client(stub, retry_policy=RetryPolicy(max_retries=0), circuit_breaker=breaker)
+    kv.has_permission('keys:read')
+    _fail_keys(stub, [503, 503])
+
+    with pytest.raises(KeyVaultUnavailableError):
+        kv.get_key('p0f0k1')
+    time.sleep(0.25)
+    with pytest.raises(KeyVaultUnavailableError):
+        kv.get_key('p0f0k1')
+
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(KeyVaultCircuitOpenError):
+        kv.get_key('p0f0k1')
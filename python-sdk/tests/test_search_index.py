@@ -0,0 +1,67 @@
+"""
+Tests for search_keys() answered from the local search index
+"""
+
+from key_vault_sdk.search_index import KeySearchIndex
+
+
+def _ids(result):
+    return sorted(key['id'] for key in result['keys'])
+
+
+def test_index_matches_server_search(stub, make_client):
+    plain = make_client(stub)
+    indexed = make_client(stub, search_index_ttl=300)
+
+    for term in ('key_1', 'KEY', 'nothing'):
+        expected = plain.search_keys(term, limit=100)
+        result = indexed.search_keys(term, limit=100)
+        assert _ids(result) == _ids(expected)
+        assert result['total'] == expected['total']
+
+    typed_filter = indexed.search_keys('key', key_type='SECRET', favorite=False, limit=100)
+    assert _ids(typed_filter) == _ids(plain.search_keys('key', key_type='SECRET', favorite=False,
+                                                        limit=100))
+
+
+def test_index_answers_without_requests_once_loaded(stub, make_client):
+    kv = make_client(stub, search_index_ttl=300)
+    kv.search_keys('KEY_2')
+    stub.reset_counts()
+
+    kv.search_keys('KEY_3')
+    kv.search_keys('KEY_4', key_type='API_KEY')
+
+    assert stub.request_count() == 0
+
+
+def test_search_without_change_feed_uses_server(legacy_stub, make_client):
+    kv = make_client(legacy_stub, search_index_ttl=300)
+
+    result = kv.search_keys('KEY_1', limit=100)
+
+    assert len(result['keys']) == 6
+    assert all(key['name'] == 'KEY_1' for key in result['keys'])
+    assert kv.search_index is None
+    assert legacy_stub.requests['/keys'] == 1
+
+    # The feed isn't asked again
+    legacy_stub.reset_counts()
+    kv.search_keys('KEY_2')
+    assert legacy_stub.requests['other'] == 0
+    assert legacy_stub.requests['/keys'] == 1
+
+
+def test_index_apply_replaces_and_removes():
+    index = KeySearchIndex()
+    index.apply([{'id': 'a', 'name': 'STRIPE_KEY', 'tags': ['payments'], 'type': 'API_KEY'}])
+    assert [key['id'] for key in index.search('stripe')['keys']] == ['a']
+    assert [key['id'] for key in index.search('payments')['keys']] == ['a']
+
+    index.apply([{'id': 'a', 'name': 'GITHUB_TOKEN', 'tags': [], 'type': 'TOKEN'}])
+    assert index.search('stripe')['keys'] == []
+    assert index.search('payments')['keys'] == []
+    assert [key['id'] for key in index.search('hub', key_type='TOKEN')['keys']] == ['a']
+
+    index.apply([], ['a'])
+    assert len(index) == 0
@@ -0,0 +1,81 @@
+"""
+Tests for get_keys_by_path() through /keys/path, and its client-side fallback
+"""
+
+import pytest
+
+from key_vault_sdk import KeyVaultError
+
+
+@pytest.fixture(params=['stub', 'legacy_stub'])
+def server(request):
+    """Each test runs against the current server and against an older one"""
+    return request.getfixturevalue(request.param)
+
+
+def test_keys_by_path(server, make_client):
+    kv = make_client(server)
+
+    result = kv.get_keys_by_path('project0/FOLDER1')
+
+    assert [key['id'] for key in result['keys']] == [f'p0f1k{k}' for k in range(5)]
+    assert result['folder']['id'] == 'p0f1'
+    assert 'value' not in result['keys'][0]
+
+
+def test_keys_by_path_paging(server, make_client):
+    kv = make_client(server)
+
+    result = kv.get_keys_by_path('Project1/Folder0', limit=2, offset=1)
+
+    assert [key['id'] for key in result['keys']] == ['p1f0k1', 'p1f0k2']
+
+
+def test_keys_by_missing_path(server, make_client):
+    kv = make_client(server)
+
+    with pytest.raises(KeyVaultError, match='Nowhere'):
+        kv.get_keys_by_path('Project0/Nowhere')
+
+
+def test_one_request_per_lookup(stub, make_client):
+    kv = make_client(stub)
+    kv.get_keys_by_path('Project0/Folder0')
+    stub.reset_counts()
+
+    kv.get_keys_by_path('Project1/Folder1')
+
+    assert dict(stub.requests) == {'/keys/path': 1}
+
+
+def test_older_server_is_detected_once(legacy_stub, make_client):
+    kv = make_client(legacy_stub)
+    kv.get_keys_by_path('Project0/Folder0')
+    legacy_stub.reset_counts()
+
+    kv.get_keys_by_path('Project0/Folder1')
+
+    assert legacy_stub.requests['/keys/path'] == 0  # not asked again
+    assert legacy_stub.requests['/folders/tree'] == 0  # the path index is reused
+
+
+def test_folder_the_route_cannot_see_keeps_server_lookup(stub, make_client):
+    handle = stub.handle
+
+    def hide_folder(path, query):
+        # Like a folder outside the route's access filter: its own JSON 404
+        if path == '/api/keys/path' and query.get('path', '').lower() == 'project0/folder0':
+            return '/keys/path', 404, {'error': 'Subfolder not found', 'path': query['path']}
+        return handle(path, query)
+    stub.handle = hide_folder
+
+    kv = make_client(stub)
+    result = kv.get_keys_by_path('Project0/Folder0')
+    assert result['folder']['id'] == 'p0f0'
+    with pytest.raises(KeyVaultError):
+        kv.get_keys_by_path('Project0/Nowhere')
+    stub.reset_counts()
+
+    kv.get_keys_by_path('Project1/Folder0')
+
+    assert dict(stub.requests) == {'/keys/path': 1}
@@ -0,0 +1,98 @@
+"""
+Tests for SecretSnapshot: forked workers reading shared secrets without API calls,
+and falling back to the API for everything the snapshot can't answer
+"""
+
+import json
+import os
+
+import pytest
+
+from key_vault_sdk import KeyVault, KeyVaultError, SecretSnapshot
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="needs os.fork()")
+def test_forked_child_reads_without_requests(stub, make_client):
+    kv = make_client(stub)
+    kv.create_snapshot(folder_ids=['p0f0'], key_ids=['p1k2'])
+    stub.reset_counts()
+
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            os.close(read_end)
+            result = {
+                'by_id': kv.get_key('p0f0k1', include_value=True)['value'],
+                'by_name': kv.get_key_by_name('p0f0', 'KEY_3'),
+                'extra': kv.get_key('p1k2', include_value=True)['value'],
+            }
+            with os.fdopen(write_end, 'w') as out:
+                json.dump(result, out)
+            status = 0
+        finally:
+            os._exit(status)
+
+    os.close(write_end)
+    with os.fdopen(read_end) as result:
+        child = json.loads(result.read() or 'null')
+    _, status = os.waitpid(pid, 0)
+
+    assert os.WEXITSTATUS(status) == 0
+    assert child == {'by_id': 'secret-p0f0-1', 'by_name': 'secret-p0f0-3', 'extra': 'secret-p1-2'}
+    assert stub.request_count() == 0
+
+
+def test_snapshot_hides_values_unless_asked(stub, make_client):
+    kv = make_client(stub)
+    kv.create_snapshot(folder_ids=['p0f0'])
+
+    assert 'value' not in kv.get_key('p0f0k1')
+    assert len(kv.snapshot) == 5
+
+
+def test_keys_missing_from_the_snapshot_come_from_the_api(stub, make_client):
+    kv = make_client(stub)
+    kv.create_snapshot(folder_ids=['p0f0'])
+    stub.reset_counts()
+
+    assert kv.get_key('p1f1k4', include_value=True)['value'] == 'secret-p1f1-4'
+    assert kv.get_key_by_name('p0f1', 'KEY_0') == 'secret-p0f1-0'
+    assert stub.request_count() > 0
+
+
+def test_replaced_snapshot_falls_back_to_the_api(stub, make_client):
+    kv = make_client(stub)
+    old = kv.create_snapshot(folder_ids=['p0f0'])
+    other = make_client(stub, snapshot=old)
+
+    # Replacing the snapshot closes the old one, which the other client still holds
+    kv.create_snapshot(folder_ids=['p0f1'])
+    stub.reset_counts()
+
+    assert old.get('p0f0k1') is None
+    assert other.get_key('p0f0k1', include_value=True)['value'] == 'secret-p0f0-1'
+    assert stub.requests['/keys/{id}'] == 1
+
+
+def test_snapshot_file_can_be_opened_by_another_client(stub, make_client, tmp_path):
+    path = str(tmp_path / 'secrets.snap')
+    make_client(stub).create_snapshot(folder_ids=['p1f0'], path=path)
+    stub.reset_counts()
+
+    kv = make_client(stub, snapshot=SecretSnapshot.open(path))
+
+    assert kv.get_key('p1f0k2', include_value=True)['value'] == 'secret-p1f0-2'
+    assert stub.request_count() == 0
+    assert os.stat(path).st_mode & 0o777 == 0o600
+
+
+def test_missing_or_foreign_snapshot_file_is_an_error(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        SecretSnapshot.open(str(tmp_path / 'missing.snap'))
+
+    path = tmp_path / 'other.snap'
+    path.write_bytes(b'\0' * 64)
+    with pytest.raises(KeyVaultError):
+        SecretSnapshot.open(str(path))
@@ -0,0 +1,94 @@
+"""
+Tests for PooledTransport: sharing one pool between clients, pool and timeout
+settings, and fork safety
+"""
+
+import json
+import os
+
+import pytest
+
+from key_vault_sdk import KeyVault
+
+
+def test_client_as_context_manager(stub):
+    with KeyVault(api_url=stub.api_url, token="test-token") as kv:
+        assert kv.test_connection()
+
+
+def test_clients_share_one_transport(stub, make_client):
+    transport = KeyVault.create_transport(pool_maxsize=4)
+    kv_a = make_client(stub, transport=transport)
+    kv_b = KeyVault(api_url=stub.api_url, token="other-token", transport=transport)
+
+    kv_a.get_key('p0f0k0')
+    kv_b.get_key('p0f0k1')
+
+    assert kv_a.session.adapters['http://'] is kv_b.session.adapters['http://'] is transport
+    [pool] = kv_a.pool_stats()['pools']
+    assert pool['connections_opened'] == 1
+    assert pool['requests'] == stub.request_count()
+
+    # Closing one client leaves the shared pool to the other
+    kv_b.close()
+    assert kv_a.get_key('p0f0k2')['id'] == 'p0f0k2'
+    assert kv_a.pool_stats()['pools'][0]['connections_opened'] == 1
+
+
+def test_pool_settings_reach_the_adapter(stub, make_client):
+    kv = make_client(stub, pool_connections=3, pool_maxsize=32, pool_block=True)
+
+    kv.get_key('p0f0k0')
+
+    assert kv.transport._pool_connections == 3
+    assert kv.transport.poolmanager.connection_pool_kw['maxsize'] == 32
+    assert kv.transport.poolmanager.connection_pool_kw['block'] is True
+    assert kv.pool_stats()['maxsize'] == 32
+
+
+def test_timeouts_reach_the_adapter(stub, make_client, monkeypatch):
+    kv = make_client(stub, timeout=9, connect_timeout=2)
+    timeouts = []
+    send = kv.transport.send
+
+    def recording_send(request, **kwargs):
+        timeouts.append(kwargs.get('timeout'))
+        return send(request, **kwargs)
+
+    monkeypatch.setattr(kv.transport, 'send', recording_send)
+    kv.get_key('p0f0k0')
+
+    assert timeouts and set(timeouts) == {(2, 9)}
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="needs os.fork()")
+def test_pools_are_reset_after_fork(stub, make_client):
+    kv = make_client(stub)
+    kv.get_key('p0f0k0')
+    assert kv.pool_stats()['pools'][0]['idle'] == 1
+
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            os.close(read_end)
+            pools_after_fork = len(kv.pool_stats()['pools'])
+            key = kv.get_key('p0f0k1')
+            with os.fdopen(write_end, 'w') as out:
+                json.dump({'pools': pools_after_fork, 'key': key['id'],
+                           'opened': kv.pool_stats()['pools'][0]['connections_opened']}, out)
+            status = 0
+        finally:
+            os._exit(status)
+
+    os.close(write_end)
+    with os.fdopen(read_end) as result:
+        child = json.loads(result.read() or 'null')
+    _, status = os.waitpid(pid, 0)
+
+    assert os.WEXITSTATUS(status) == 0
+    assert child == {'pools': 0, 'key': 'p0f0k1', 'opened': 1}
+    # The parent's pooled connection was left alone and is still reused
+    kv.get_key('p0f0k2')
+    assert kv.pool_stats()['pools'][0]['connections_opened'] == 1
@@ -0,0 +1,48 @@
+"""
+Tests for the indexed folder tree
+"""
+
+from key_vault_sdk.tree import FolderTree
+
+
+def _tree():
+    return FolderTree([
+        {'id': 'a', 'name': 'App', 'children': [
+            {'id': 'b', 'name': ' Prod ', 'children': [
+                {'id': 'c', 'name': 'Payments', 'children': []}
+            ]},
+            {'id': 'd', 'name': 'prod', 'children': []}
+        ]},
+        {'id': 'e', 'name': 'Other', 'children': []}
+    ])
+
+
+def test_paths_follow_path_resolution_rules():
+    tree = _tree()
+
+    assert tree.find_folder_by_path('app')['id'] == 'a'
+    assert tree.find_folder_by_path('APP/prod/payments')['id'] == 'c'
+    assert tree.find_folder_by_path('/App//Prod/ ')['id'] == 'b'  # first of the repeated names
+    assert tree.find_folder_by_path('Other')['id'] == 'e'
+    assert tree.find_folder_by_path('App/Payments') is None
+
+
+def test_navigation():
+    tree = _tree()
+
+    assert tree.folder_count == 5
+    assert tree.parent('c')['id'] == 'b'
+    assert tree.parent('a') is None
+    assert [folder['id'] for folder in tree.children('a')] == ['b', 'd']
+    assert tree.path_of('c') == 'App/ Prod /Payments'
+    assert tree.find_folder_by_name('prod')['id'] == 'd'
+    assert [folder['id'] for folder in tree.walk()] == ['a', 'b', 'c', 'd', 'e']
+    assert tree['get_folder_path']('c')[0]['id'] == 'a'
+
+
+def test_tree_agrees_with_client_resolution(stub, make_client):
+    kv = make_client(stub)
+    tree = kv.navigate_folder_tree(project_id='p1')
+
+    for path in ('Project1', 'project1/FOLDER0', 'Project1/Folder1'):
+        assert tree.find_folder_by_path(path)['id'] == kv._resolve_path_to_folder(path)['id']
@@ -0,0 +1,72 @@
+"""
+Tests for the in-memory cache of decrypted key values
+"""
+
+import time
+
+from key_vault_sdk import TTLCache
+
+
+def test_value_cache(stub, make_client):
+    kv = make_client(stub, cache_ttl=60)
+    assert kv.get_key('p0f0k2', include_value=True)['value'] == 'secret-p0f0-2'
+    stub.reset_counts()
+
+    assert kv.get_key('p0f0k2', include_value=True)['value'] == 'secret-p0f0-2'
+    assert stub.request_count() == 0
+    assert kv.cache_stats()['hits'] == 1
+
+    stub.data.keys['p0f0k2']['value'] = 'rotated'
+    assert kv.invalidate('p0f0k2')
+    assert kv.get_key('p0f0k2', include_value=True)['value'] == 'rotated'
+
+
+def test_value_cache_is_off_by_default(stub, make_client):
+    kv = make_client(stub)
+    kv.get_key('p0f0k2', include_value=True)
+    stub.reset_counts()
+
+    kv.get_key('p0f0k2', include_value=True)
+
+    assert stub.requests['/keys/{id}'] == 1
+    assert kv.cache_stats() == {}
+
+
+def test_cached_values_are_copies(stub, make_client):
+    kv = make_client(stub, cache_ttl=60)
+    kv.get_key('p1k1', include_value=True)['value'] = 'changed by caller'
+
+    assert kv.get_key('p1k1', include_value=True)['value'] == 'secret-p1-1'
+
+
+def test_cached_values_expire(stub, make_client):
+    kv = make_client(stub, cache_ttl=0.2)
+    kv.get_key('p0k0', include_value=True)
+    stub.data.keys['p0k0']['value'] = 'rotated'
+
+    assert kv.get_key('p0k0', include_value=True)['value'] == 'secret-p0-0'
+    time.sleep(0.3)
+    assert kv.get_key('p0k0', include_value=True)['value'] == 'rotated'
+
+
+def test_clear_cache(stub, make_client):
+    kv = make_client(stub, cache_ttl=60)
+    kv.get_key('p0k0', include_value=True)
+    kv.clear_cache()
+    stub.reset_counts()
+
+    kv.get_key('p0k0', include_value=True)
+
+    assert stub.requests['/keys/{id}'] == 1
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
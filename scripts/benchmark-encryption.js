@@ -0,0 +1,85 @@
+#!/usr/bin/env node
+
+/**
+ * Decrypt throughput benchmark
+ *
+ * Compares the original scheme (one PBKDF2 run per decrypt) with the current
+ * one: v2 values (HKDF from a once-derived master key) and v1 values read
+ * through the derived-key cache before they are migrated.
+ *
+ * Usage: node scripts/benchmark-encryption.js [values] [rounds]
+ */
+
+import crypto from 'crypto'
+import { encrypt, decrypt, deriveKey } from '../src/lib/encryption.js'
+
+const VALUES = parseInt(process.argv[2]) || 50
+const ROUNDS = parseInt(process.argv[3]) || 3
+const PASSWORD = crypto.randomBytes(32).toString('hex')
+
+// The original v1 format and decrypt path, without any caching
+function encryptV1(text, password) {
+  const salt = crypto.randomBytes(64)
+  const iv = crypto.randomBytes(16)
+  const cipher = crypto.createCipheriv('aes-256-gcm', deriveKey(password, salt), iv)
+  cipher.setAAD(Buffer.from('key-vault', 'utf8'))
+  let encrypted = cipher.update(text, 'utf8', 'hex')
+  encrypted += cipher.final('hex')
+  return [salt, iv, cipher.getAuthTag()].map(b => b.toString('hex')).join(':') + ':' + encrypted
+}
+
+function decryptV1Uncached(encryptedData, password) {
+  const [salt, iv, tag, encrypted] = encryptedData.split(':')
+  const decipher = crypto.createDecipheriv('aes-256-gcm', deriveKey(password, Buffer.from(salt, 'hex')), Buffer.from(iv, 'hex'))
+  decipher.setAAD(Buffer.from('key-vault', 'utf8'))
+  decipher.setAuthTag(Buffer.from(tag, 'hex'))
+  return decipher.update(encrypted, 'hex', 'utf8') + decipher.final('utf8')
+}
+
+function measure(name, values, fn) {
+  const latencies = []
+  const start = process.hrtime.bigint()
+  for (let round = 0; round < ROUNDS; round++) {
+    for (const value of values) {
+      const t = process.hrtime.bigint()
+      fn(value)
+      latencies.push(Number(process.hrtime.bigint() - t) / 1e6)
+    }
+  }
+  const seconds = Number(process.hrtime.bigint() - start) / 1e9
+  latencies.sort((a, b) => a - b)
+  const p = q => latencies[Math.max(Math.ceil(q * latencies.length) - 1, 0)]
+  return {
+    name,
+    opsPerSec: Math.round(latencies.length / seconds),
+    p50: p(0.5).toFixed(3),
+    p99: p(0.99).toFixed(3)
+  }
+}
+
+const plaintexts = Array.from({ length: VALUES }, (_, i) => `sk_live_${i}_${crypto.randomBytes(16).toString('hex')}`)
+const v1Values = plaintexts.map(text => encryptV1(text, PASSWORD))
+
+// Derives the master key once, outside the measurements
+const v2Values = plaintexts.map(text => encrypt(text, PASSWORD))
+
+for (let i = 0; i < VALUES; i++) {
+  if (decrypt(v1Values[i], PASSWORD) !== plaintexts[i] || decrypt(v2Values[i], PASSWORD) !== plaintexts[i]) {
+    throw new Error('Round trip failed')
+  }
+}
+
+const results = [
+  measure('before: v1, PBKDF2 per decrypt', v1Values, value => decryptV1Uncached(value, PASSWORD)),
+  measure('after: v1, repeat read (key cache)', v1Values, value => decrypt(value, PASSWORD)),
+  measure('after: v2 (migrated)', v2Values, value => decrypt(value, PASSWORD)),
+  measure('after: v2 encrypt', plaintexts, value => encrypt(value, PASSWORD))
+]
+
+console.log(`${VALUES} values x ${ROUNDS} rounds\n`)
+console.table(results.map(r => ({
+  scheme: r.name,
+  'ops/s': r.opsPerSec,
+  'p50 ms': r.p50,
+  'p99 ms': r.p99
+})))
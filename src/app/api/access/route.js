@@ -438,7 +438,7 @@ export async function GET(request) {
           id: key.id,
           name: key.name,
           description: key.description,
-          value: await decryptKeyValue(key.value),
+          value: await decryptKeyValue(key.value, key),
           type: key.type,
           environment: key.environment,
           tags: key.tags,
@@ -489,7 +489,7 @@ export async function GET(request) {
         const decryptedKeys = await Promise.all(
           folderKeys.map(async (key) => ({
             ...key,
-            value: await decryptKeyValue(key.value)
+            value: await decryptKeyValue(key.value, key)
           }))
         )
 
@@ -591,7 +591,7 @@ export async function GET(request) {
         const decryptedKeys = await Promise.all(
           folderKeys.map(async (key) => ({
             ...key,
-            value: await decryptKeyValue(key.value)
+            value: await decryptKeyValue(key.value, key)
           }))
         )
 
@@ -2,6 +2,7 @@ import { NextResponse } from 'next/server'
 import { getCurrentUser } from '../../../lib/auth.js'
 import { createFolder, getUserFolders } from '../../../lib/folders.js'
 import prisma from '../../../lib/database.js'
+import { jsonWithETag } from '../../../lib/etag.js'
 import { updateUserUsage, getUserUsageStats } from '../../../lib/planMiddleware.js'
 import { canCreateProject, getUpgradeMessage } from '../../../lib/planLimits.js'
 
@@ -53,7 +54,7 @@ export async function GET(request) {
     console.log('   Plan usage:', planUsage ? 'success' : 'null');
 
     console.log('   ✅ GET /api/folders - Success, returning response');
-    return NextResponse.json({ 
+    return jsonWithETag(request, { 
       folders,
       planUsage
     })
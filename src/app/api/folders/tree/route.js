@@ -2,6 +2,7 @@ import { NextResponse } from 'next/server'
 import { getCurrentUser } from '../../../../lib/auth'
 import { getFolderTree } from '../../../../lib/folders'
 import prisma from '../../../../lib/database'
+import { jsonWithETag } from '../../../../lib/etag'
 
 export async function GET(request) {
   try {
@@ -39,7 +40,7 @@ export async function GET(request) {
     // Get user's folder tree (filtered by project if specified)
     const folders = await getFolderTree(user.id, projectId)
 
-    return NextResponse.json({ folders })
+    return jsonWithETag(request, { folders })
 
   } catch (error) {
     console.error('Folder tree fetch error:', error)
@@ -70,7 +70,7 @@ export async function GET(request, context) {
     // Include decrypted value if requested
     if (includeValue) {
       try {
-        const decryptedValue = await decryptKeyValue(key.value)
+        const decryptedValue = await decryptKeyValue(key.value, key)
         keyData.value = decryptedValue
         // AUDIT LOG: Note that decrypted value was accessed (already logged above, but you can add a special log if desired)
       } catch (error) {
@@ -0,0 +1,158 @@
+import { NextResponse } from 'next/server'
+import { getCurrentUser } from '../../../../lib/auth.js'
+import { getKeysWithValues, decryptKeyValue } from '../../../../lib/keyManagement.js'
+import { logAccess } from '../../../../lib/permissions.js'
+import { logExport } from '../../../../lib/audit.js'
+import prisma from '../../../../lib/database.js'
+
+// Upper bound on keys decrypted by a single bulk request
+const MAX_BULK_KEYS = 500
+
+export async function GET(request) {
+  try {
+    const user = await getCurrentUser(request)
+    if (!user) {
+      return NextResponse.json({ success: false, error: 'Unauthorized' }, { status: 401 })
+    }
+
+    // Enhanced RBAC: Check if user has permission to read keys (supports JWT tokens)
+    if (user.permissions && Array.isArray(user.permissions)) {
+      // Token-based permission check (fast)
+      if (!user.permissions.includes('keys:read') && !user.permissions.includes('*')) {
+        await logAccess(user.id, 'keys', null, 'bulk_read_denied', 'denied', {
+          source: 'token',
+          ipAddress: request.headers.get('x-forwarded-for') || request.headers.get('x-real-ip'),
+          userAgent: request.headers.get('user-agent')
+        })
+
+        return NextResponse.json({
+          success: false,
+          error: 'Insufficient permissions: keys:read required'
+        }, { status: 403 })
+      }
+    } else {
+      // Database-based permission check (fallback for session tokens)
+      const { PermissionManager } = await import('../../../../lib/permissions.js')
+      const pm = new PermissionManager(user)
+      await pm.loadPermissions()
+
+      if (!pm.hasPermission('keys:read')) {
+        await logAccess(user.id, 'keys', null, 'bulk_read_denied', 'denied', {
+          source: 'database',
+          ipAddress: request.headers.get('x-forwarded-for') || request.headers.get('x-real-ip'),
+          userAgent: request.headers.get('user-agent')
+        })
+
+        return NextResponse.json({
+          success: false,
+          error: 'Insufficient permissions: keys:read required'
+        }, { status: 403 })
+      }
+    }
+
+    // Check subscription status for key access
+    const currentUser = await prisma.users.findUnique({
+      where: { id: user.id },
+      select: { plan: true, subscriptionExpiresAt: true }
+    });
+
+    const now = new Date();
+    const hasActiveSubscription = currentUser.subscriptionExpiresAt && currentUser.subscriptionExpiresAt > now;
+
+    // Block key access for expired subscriptions (except FREE plan)
+    if (currentUser.plan !== 'FREE' && !hasActiveSubscription) {
+      return NextResponse.json({
+        success: false,
+        error: 'Your subscription has expired. Renew your subscription to access your keys.',
+        requiresRenewal: true
+      }, { status: 403 });
+    }
+
+    const { searchParams } = new URL(request.url)
+    const folderId = searchParams.get('folderId')
+    const environment = searchParams.get('environment')
+    const ids = (searchParams.get('ids') || '')
+      .split(',')
+      .map(id => id.trim())
+      .filter(Boolean)
+
+    if (!folderId && ids.length === 0) {
+      return NextResponse.json({
+        success: false,
+        error: 'Either folderId or ids is required'
+      }, { status: 400 })
+    }
+
+    if (ids.length > MAX_BULK_KEYS) {
+      return NextResponse.json({
+        success: false,
+        error: `Cannot fetch more than ${MAX_BULK_KEYS} keys in one request`
+      }, { status: 400 })
+    }
+
+    // Fetch one extra row so we can tell the caller the result was truncated
+    const keys = await getKeysWithValues(user.id, {
+      folderId,
+      ids: ids.length > 0 ? ids : undefined,
+      environment,
+      limit: MAX_BULK_KEYS + 1
+    })
+
+    const truncated = keys.length > MAX_BULK_KEYS
+    const exportedKeys = truncated ? keys.slice(0, MAX_BULK_KEYS) : keys
+
+    const results = await Promise.all(exportedKeys.map(async key => {
+      let value
+      try {
+        value = await decryptKeyValue(key.value, key)
+      } catch (error) {
+        console.error('Error decrypting key value:', error)
+        value = '[Encrypted]'
+      }
+
+      return {
+        id: key.id,
+        name: key.name,
+        description: key.description,
+        type: key.type,
+        tags: key.tags,
+        isFavorite: key.isFavorite,
+        environment: key.environment,
+        folderId: key.folderId,
+        expiresAt: key.expiresAt,
+        createdAt: key.createdAt,
+        updatedAt: key.updatedAt,
+        value
+      }
+    }))
+
+    // AUDIT LOG: One export entry listing every decrypted key
+    await logExport(user.id, {
+      resourceType: 'keys',
+      folderId,
+      environment,
+      keyIds: results.map(key => key.id),
+      count: results.length
+    }, {
+      ipAddress: request.headers.get('x-forwarded-for') || request.headers.get('x-real-ip'),
+      userAgent: request.headers.get('user-agent'),
+      method: 'GET',
+      endpoint: '/api/keys/bulk',
+      statusCode: 200
+    })
+
+    return NextResponse.json({
+      success: true,
+      keys: results,
+      total: results.length,
+      truncated
+    })
+
+  } catch (error) {
+    console.error('Error exporting keys:', error)
+    return NextResponse.json({
+      success: false,
+      error: error.message || 'Failed to export keys'
+    }, { status: 500 })
+  }
+}
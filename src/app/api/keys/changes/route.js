@@ -0,0 +1,260 @@
+import { NextResponse } from 'next/server'
+import { getCurrentUser } from '../../../../lib/auth.js'
+import { logAccess } from '../../../../lib/permissions.js'
+import prisma from '../../../../lib/database.js'
+import { getUserTeamIds, keyAccessWhere } from '../../../../lib/keyManagement.js'
+import { getSubfolderIds } from '../../../../lib/folders.js'
+
+// Largest number of updated keys (and of deletion or sharing events) read per page
+const MAX_PAGE_SIZE = 500
+
+// Rows written in the last moments may still be committing with an earlier
+// timestamp; the feed only reports changes older than this so a cursor never
+// skips past a row that becomes visible later
+const SETTLE_MS = 2000
+
+// Key metadata reported for created, updated and newly shared keys
+const KEY_SELECT = {
+  id: true,
+  name: true,
+  description: true,
+  type: true,
+  environment: true,
+  tags: true,
+  isFavorite: true,
+  folderId: true,
+  expiresAt: true,
+  createdAt: true,
+  updatedAt: true
+}
+
+function encodeCursor(position) {
+  return Buffer.from(JSON.stringify(position)).toString('base64url')
+}
+
+function decodeCursor(cursor) {
+  try {
+    const position = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'))
+    const valid = ['u', 'd'].every(field => !isNaN(new Date(position[field]).getTime()))
+    return valid ? { u: position.u, k: position.k || '', d: position.d, l: position.l || '' } : null
+  } catch {
+    return null
+  }
+}
+
+export async function GET(request) {
+  try {
+    const user = await getCurrentUser(request)
+    if (!user) {
+      return NextResponse.json({ success: false, error: 'Unauthorized' }, { status: 401 })
+    }
+
+    // Enhanced RBAC: Check if user has permission to read keys (supports JWT tokens)
+    if (user.permissions && Array.isArray(user.permissions)) {
+      // Token-based permission check (fast)
+      if (!user.permissions.includes('keys:read') && !user.permissions.includes('*')) {
+        await logAccess(user.id, 'keys', null, 'changes_read_denied', 'denied', {
+          source: 'token',
+          ipAddress: request.headers.get('x-forwarded-for') || request.headers.get('x-real-ip'),
+          userAgent: request.headers.get('user-agent')
+        })
+
+        return NextResponse.json({
+          success: false,
+          error: 'Insufficient permissions: keys:read required'
+        }, { status: 403 })
+      }
+    } else {
+      // Database-based permission check (fallback for session tokens)
+      const { PermissionManager } = await import('../../../../lib/permissions.js')
+      const pm = new PermissionManager(user)
+      await pm.loadPermissions()
+
+      if (!pm.hasPermission('keys:read')) {
+        await logAccess(user.id, 'keys', null, 'changes_read_denied', 'denied', {
+          source: 'database',
+          ipAddress: request.headers.get('x-forwarded-for') || request.headers.get('x-real-ip'),
+          userAgent: request.headers.get('user-agent')
+        })
+
+        return NextResponse.json({
+          success: false,
+          error: 'Insufficient permissions: keys:read required'
+        }, { status: 403 })
+      }
+    }
+
+    const { searchParams } = new URL(request.url)
+    const folderId = searchParams.get('folderId')
+    const projectId = searchParams.get('projectId')
+    const cursorParam = searchParams.get('cursor')
+    const since = searchParams.get('since')
+    const limit = Math.min(Math.max(parseInt(searchParams.get('limit')) || MAX_PAGE_SIZE, 1), MAX_PAGE_SIZE)
+
+    if (folderId && projectId) {
+      return NextResponse.json({
+        success: false,
+        error: 'Pass either folderId or projectId, not both'
+      }, { status: 400 })
+    }
+
+    const until = new Date(Date.now() - SETTLE_MS)
+
+    // Position in the feed: last key update (u, k) and last deletion (d, l) seen
+    let position
+    if (cursorParam) {
+      position = decodeCursor(cursorParam)
+      if (!position) {
+        return NextResponse.json({ success: false, error: 'Invalid cursor' }, { status: 400 })
+      }
+    } else if (since) {
+      if (isNaN(new Date(since).getTime())) {
+        return NextResponse.json({ success: false, error: 'Invalid since timestamp' }, { status: 400 })
+      }
+      const sinceIso = new Date(since).toISOString()
+      position = { u: sinceIso, k: '', d: sinceIso, l: '' }
+    } else {
+      // Full listing: every current key, and deletions from now on
+      position = { u: new Date(0).toISOString(), k: '', d: until.toISOString(), l: '' }
+    }
+
+    // The same keys the listing and bulk routes return: owned or shared with one of the user's teams
+    const teamIds = await getUserTeamIds(user.id)
+    const accessWhere = keyAccessWhere(user.id, teamIds)
+
+    let scopeIds = null
+    const scopeRoot = folderId || projectId
+    if (scopeRoot) {
+      const root = await prisma.folders.findFirst({
+        where: { id: scopeRoot, ...(projectId && { parentId: null }) },
+        select: { id: true, userId: true }
+      })
+      if (root) {
+        scopeIds = projectId ? [projectId, ...await getSubfolderIds(projectId, root.userId)] : [folderId]
+      }
+
+      // Someone else's folder is in scope when it holds keys shared with the user's teams
+      const accessible = root && (root.userId === user.id || await prisma.keys.count({
+        where: { folderId: { in: scopeIds }, key_accesses: { some: { teamId: { in: teamIds } } } }
+      }) > 0)
+      if (!accessible) {
+        return NextResponse.json({ success: false, error: folderId ? 'Folder not found' : 'Project not found' }, { status: 404 })
+      }
+    }
+
+    const updatedAfter = new Date(position.u)
+    const deletedAfter = new Date(position.d)
+
+    const [keys, deletions] = await Promise.all([
+      prisma.keys.findMany({
+        where: {
+          ...(scopeIds && { folderId: { in: scopeIds } }),
+          updatedAt: { lte: until },
+          AND: [
+            accessWhere,
+            {
+              OR: [
+                { updatedAt: { gt: updatedAfter } },
+                { updatedAt: updatedAfter, id: { gt: position.k } }
+              ]
+            }
+          ]
+        },
+        select: KEY_SELECT,
+        orderBy: [{ updatedAt: 'asc' }, { id: 'asc' }],
+        take: limit
+      }),
+      prisma.audit_logs.findMany({
+        where: {
+          createdAt: { lte: until },
+          AND: [
+            {
+              OR: [
+                // Keys deleted by the user, or shared with one of their teams when deleted
+                {
+                  resource: 'key',
+                  action: 'DELETE',
+                  OR: [
+                    { userId: user.id },
+                    ...teamIds.map(teamId => ({ details: { path: ['teamIds'], array_contains: [teamId] } }))
+                  ]
+                },
+                // Keys shared with or revoked from one of the user's teams
+                ...teamIds.map(teamId => ({
+                  resource: 'key_access',
+                  action: { in: ['SHARE', 'REVOKE'] },
+                  details: { path: ['teamId'], equals: teamId }
+                }))
+              ]
+            },
+            {
+              OR: [
+                { createdAt: { gt: deletedAfter } },
+                { createdAt: deletedAfter, id: { gt: position.l } }
+              ]
+            }
+          ]
+        },
+        select: { id: true, resource: true, resourceId: true, details: true, createdAt: true },
+        orderBy: [{ createdAt: 'asc' }, { id: 'asc' }],
+        take: limit
+      })
+    ])
+
+    const lastKey = keys[keys.length - 1]
+    const lastDeletion = deletions[deletions.length - 1]
+    const next = {
+      u: lastKey ? lastKey.updatedAt.toISOString() : position.u,
+      k: lastKey ? lastKey.id : position.k,
+      d: lastDeletion ? lastDeletion.createdAt.toISOString() : position.d,
+      l: lastDeletion ? lastDeletion.id : position.l
+    }
+
+    // A share or revocation changes what the user can read without touching the
+    // key, so its current state decides: still readable keys are reported as
+    // updated, the others as deleted
+    const accessChanges = deletions.filter(log => log.resource === 'key_access' && log.details?.keyId)
+    const changedIds = [...new Set(accessChanges.map(log => log.details.keyId))]
+    const readable = changedIds.length ? await prisma.keys.findMany({
+      where: {
+        id: { in: changedIds },
+        ...(scopeIds && { folderId: { in: scopeIds } }),
+        ...accessWhere
+      },
+      select: KEY_SELECT
+    }) : []
+    const readableIds = new Set(readable.map(key => key.id))
+    const updatedIds = new Set(keys.map(key => key.id))
+    const updated = [...keys, ...readable.filter(key => !updatedIds.has(key.id))]
+
+    // Deletions logged before folderId was recorded can't be scoped; they are
+    // reported to every scope, and clients ignore IDs they don't hold
+    const deleted = deletions
+      .filter(log => log.resource === 'key' && log.resourceId)
+      .filter(log => !scopeIds || !log.details?.folderId || scopeIds.includes(log.details.folderId))
+      .map(log => ({
+        id: log.resourceId,
+        folderId: log.details?.folderId ?? null,
+        deletedAt: log.createdAt
+      }))
+    for (const log of accessChanges) {
+      if (!readableIds.has(log.details.keyId)) {
+        deleted.push({ id: log.details.keyId, folderId: null, deletedAt: log.createdAt })
+      }
+    }
+
+    return NextResponse.json({
+      success: true,
+      updated,
+      deleted,
+      cursor: encodeCursor(next),
+      hasMore: keys.length === limit || deletions.length === limit
+    })
+  } catch (error) {
+    console.error('Error fetching key changes:', error)
+    return NextResponse.json({
+      success: false,
+      error: 'Failed to fetch key changes'
+    }, { status: 500 })
+  }
+}
@@ -1,6 +1,23 @@
 import { NextResponse } from 'next/server'
 import { getCurrentUser } from '../../../../lib/auth'
 import prisma from '../../../../lib/database'
+import { logAccess } from '../../../../lib/permissions.js'
+import { getUserTeamIds, keyAccessWhere } from '../../../../lib/keyManagement.js'
+import { getSubfolderIds } from '../../../../lib/folders.js'
+
+// Largest page of keys returned when the caller passes a limit
+const MAX_PAGE_SIZE = 100
+
+// Someone else's folder is visible when its subtree holds keys shared with one of
+// the user's teams, like the keys the listing routes return
+async function holdsSharedKeys(folder, teamIds) {
+  if (teamIds.length === 0) return false
+  const scopeIds = [folder.id, ...await getSubfolderIds(folder.id, folder.userId)]
+  const shared = await prisma.keys.count({
+    where: { folderId: { in: scopeIds }, key_accesses: { some: { teamId: { in: teamIds } } } }
+  })
+  return shared > 0
+}
 
 export async function GET(request) {
   try {
@@ -16,9 +33,53 @@ export async function GET(request) {
       )
     }
 
-    // Get path from query parameter
+    // Enhanced RBAC: Check if user has permission to read keys (supports JWT tokens)
+    if (user.permissions && Array.isArray(user.permissions)) {
+      // Token-based permission check (fast)
+      if (!user.permissions.includes('keys:read') && !user.permissions.includes('*')) {
+        await logAccess(user.id, 'keys', null, 'path_read_denied', 'denied', {
+          source: 'token',
+          ipAddress: request.headers.get('x-forwarded-for') || request.headers.get('x-real-ip'),
+          userAgent: request.headers.get('user-agent')
+        })
+
+        return NextResponse.json({
+          success: false,
+          error: 'Insufficient permissions: keys:read required'
+        }, { status: 403 })
+      }
+    } else {
+      // Database-based permission check (fallback for session tokens)
+      const { PermissionManager } = await import('../../../../lib/permissions.js')
+      const pm = new PermissionManager(user)
+      await pm.loadPermissions()
+
+      if (!pm.hasPermission('keys:read')) {
+        await logAccess(user.id, 'keys', null, 'path_read_denied', 'denied', {
+          source: 'database',
+          ipAddress: request.headers.get('x-forwarded-for') || request.headers.get('x-real-ip'),
+          userAgent: request.headers.get('user-agent')
+        })
+
+        return NextResponse.json({
+          success: false,
+          error: 'Insufficient permissions: keys:read required'
+        }, { status: 403 })
+      }
+    }
+
+    // Get path and options from query parameters
     const { searchParams } = new URL(request.url)
     const path = searchParams.get('path')
+    const environment = searchParams.get('environment')
+    // 'folder' returns only the target folder's keys; by default a project path
+    // also includes the keys of its direct subfolders
+    const scope = searchParams.get('scope') === 'folder' ? 'folder' : 'default'
+    const limitParam = searchParams.get('limit')
+    const limit = limitParam !== null
+      ? Math.min(Math.max(parseInt(limitParam) || MAX_PAGE_SIZE, 1), MAX_PAGE_SIZE)
+      : undefined
+    const offset = Math.max(parseInt(searchParams.get('offset')) || 0, 0)
 
     if (!path) {
       return NextResponse.json(
@@ -121,14 +182,27 @@ export async function GET(request) {
 
     console.log('🔍 Parsed path:', { projectName, remainingPath })
 
-    // Find the project (root folder) by name
-    const project = await prisma.folders.findFirst({
+    // Same access as the listing routes: own keys and keys shared with the user's teams
+    const teamIds = await getUserTeamIds(user.id)
+
+    // Find the project (root folder) by name; the user's own project comes first,
+    // then projects of other owners that share keys with the user's teams
+    const projects = await prisma.folders.findMany({
       where: {
-        name: projectName,
-        userId: user.id,
-        parentId: null // Root level project
-      }
+        name: { equals: projectName, mode: 'insensitive' },
+        parentId: null, // Root level project
+        OR: [
+          { userId: user.id },
+          { users: { keys: { some: { key_accesses: { some: { teamId: { in: teamIds } } } } } } }
+        ]
+      },
+      orderBy: { createdAt: 'asc' }
     })
+    let project = projects.find(candidate => candidate.userId === user.id) || null
+    for (const candidate of projects) {
+      if (project) break
+      if (await holdsSharedKeys(candidate, teamIds)) project = candidate
+    }
 
     if (!project) {
       return NextResponse.json(
@@ -148,9 +222,8 @@ export async function GET(request) {
       )
     }
 
-    let keys = []
     let targetFolder = null
-    let folderPath = [projectName]
+    let folderPath = [project.name]
 
     // Navigate through the folder hierarchy
     if (remainingPath.length > 0) {
@@ -162,15 +235,16 @@ export async function GET(request) {
         // Find the subfolder
         const subfolder = await prisma.folders.findFirst({
           where: {
-            name: folderName,
-            userId: user.id,
+            name: { equals: folderName, mode: 'insensitive' },
+            userId: project.userId,
             parentId: currentParentId
           }
         })
 
-        if (!subfolder) {
+        if (!subfolder || (project.userId !== user.id && !await holdsSharedKeys(subfolder, teamIds))) {
           // Get available subfolders at this level for better error message
-          const availableSubfolders = await prisma.folders.findMany({
+          // (only in the user's own projects)
+          const availableSubfolders = project.userId === user.id ? await prisma.folders.findMany({
             where: {
               userId: user.id,
               parentId: currentParentId
@@ -179,7 +253,7 @@ export async function GET(request) {
               name: true,
               description: true
             }
-          })
+          }) : []
 
           return NextResponse.json(
             { 
@@ -203,94 +277,105 @@ export async function GET(request) {
 
         // Update for next iteration
         currentParentId = subfolder.id
-        folderPath.push(folderName)
+        folderPath.push(subfolder.name)
         targetFolder = subfolder
         
         console.log(`✅ Found subfolder: ${folderName} (ID: ${subfolder.id})`)
       }
+    }
 
-      // Get keys from the target subfolder
-      keys = await prisma.keys.findMany({
-        where: {
-          folderId: targetFolder.id,
-          userId: user.id
-        },
-        orderBy: {
-          updatedAt: 'desc'
-        }
-      })
-
-      console.log(`✅ Found ${keys.length} keys in ${folderPath.join('/')}`)
+    const folder = targetFolder || project
+    const fullPath = folderPath.join('/')
 
-    } else {
-      // Get all keys from the project (including all subfolders)
-      const projectKeys = await prisma.keys.findMany({
-        where: {
-          folderId: project.id,
-          userId: user.id
-        },
-        orderBy: {
-          updatedAt: 'desc'
-        }
-      })
+    // Keys of the target folder; a project path also covers its direct subfolders
+    const keyWhere = {
+      AND: [
+        keyAccessWhere(user.id, teamIds),
+        targetFolder || scope === 'folder'
+          ? { folderId: folder.id }
+          : { OR: [{ folderId: project.id }, { folders: { userId: project.userId, parentId: project.id } }] }
+      ],
+      ...(environment && { environment: { equals: environment, mode: 'insensitive' } })
+    }
 
-      // Get keys from all subfolders recursively
-      const subfolderKeys = await prisma.keys.findMany({
-        where: {
-          folders: {
-            userId: user.id,
-            parentId: project.id
-          }
-        },
-        include: {
+    const [keys, total] = await Promise.all([
+      prisma.keys.findMany({
+        where: keyWhere,
+        select: {
+          id: true,
+          name: true,
+          description: true,
+          type: true,
+          environment: true,
+          tags: true,
+          isFavorite: true,
+          folderId: true,
+          expiresAt: true,
+          createdAt: true,
+          updatedAt: true,
           folders: {
             select: {
-              name: true,
-              parentId: true
+              name: true
             }
           }
         },
         orderBy: {
           updatedAt: 'desc'
-        }
-      })
+        },
+        skip: offset,
+        ...(limit !== undefined && { take: limit })
+      }),
+      prisma.keys.count({ where: keyWhere })
+    ])
 
-      keys = [...projectKeys, ...subfolderKeys]
-      console.log(`✅ Found ${keys.length} total keys in project ${projectName}`)
-    }
+    console.log(`✅ Found ${total} keys in ${fullPath}`)
 
-    // Format the response
-    const formattedKeys = keys.map(key => ({
-      id: key.id,
-      name: key.name,
-      description: key.description,
-      value: key.value,
-      type: key.type,
-      environment: key.environment,
-      tags: key.tags,
-      isFavorite: key.isFavorite,
-      createdAt: key.createdAt,
-      updatedAt: key.updatedAt,
-      folderName: key.folders?.name || projectName,
-      folderPath: key.folders ? `${projectName}/${key.folders.name}` : projectName
-    }))
+    // Format the response; encrypted values are never returned
+    const formattedKeys = keys.map(key => {
+      const inTarget = key.folderId === folder.id
+      return {
+        id: key.id,
+        name: key.name,
+        description: key.description,
+        type: key.type,
+        environment: key.environment,
+        tags: key.tags,
+        isFavorite: key.isFavorite,
+        folderId: key.folderId,
+        expiresAt: key.expiresAt,
+        createdAt: key.createdAt,
+        updatedAt: key.updatedAt,
+        folderName: inTarget ? folder.name : key.folders?.name,
+        folderPath: inTarget ? fullPath : `${fullPath}/${key.folders?.name}`
+      }
+    })
 
     // Return success response
     return NextResponse.json({
       success: true,
       path: path,
-      project: projectName,
-      fullPath: folderPath.join('/'),
+      project: project.name,
+      fullPath,
+      scope,
       targetFolder: targetFolder ? {
         id: targetFolder.id,
         name: targetFolder.name,
         description: targetFolder.description
       } : null,
+      folder: {
+        id: folder.id,
+        name: folder.name,
+        description: folder.description,
+        parentId: folder.parentId
+      },
       totalKeys: formattedKeys.length,
+      total,
+      limit: limit ?? null,
+      offset,
       keys: formattedKeys,
-      message: keys.length === 0 ? 
-        `No keys found in "${folderPath.join('/')}"` : 
-        `Successfully fetched ${keys.length} keys from "${folderPath.join('/')}"`
+      message: total === 0 ? 
+        `No keys found in "${fullPath}"` : 
+        `Successfully fetched ${formattedKeys.length} keys from "${fullPath}"`
     })
 
   } catch (error) {
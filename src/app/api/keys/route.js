@@ -1,11 +1,12 @@
 import { NextResponse } from 'next/server'
 import { PrismaClient } from '@prisma/client'
 import { getCurrentUser } from '../../../lib/auth.js'
-import { createKey, getKeysByFolder, validateKeyData } from '../../../lib/keyManagement.js'
+import { createKey, getKeysByFolder, getKeysByFolderVersion, keyListingVersion, validateKeyData } from '../../../lib/keyManagement.js'
 import { requirePermissionFromToken, logAccess } from '../../../lib/permissions.js'
 import { logKeyCreation, logKeyAccess } from '../../../lib/audit.js'
 import { canCreateKey, getUpgradeMessage, hasFeature } from '../../../lib/planLimits.js'
 import { updateUserUsage } from '../../../lib/planMiddleware.js'
+import { jsonWithETag, notModified, versionETag } from '../../../lib/etag.js'
 // import { checkUserRateLimit } from '../../../lib/rateLimit.js'
 
 const prisma = new PrismaClient()
@@ -201,29 +202,45 @@ export async function GET(request) {
       return NextResponse.json({ success: false, error: 'Folder ID is required' }, { status: 400 })
     }
 
+    const logListingAccess = async () => {
+      // Get folder name for context
+      const folder = await prisma.folders.findUnique({
+        where: { id: folderId },
+        select: { name: true }
+      });
+
+      // Log successful key retrieval with enhanced details
+      await logKeyAccess(folderId, user.id, {
+        ipAddress: request.headers.get('x-forwarded-for') || request.headers.get('x-real-ip'),
+        userAgent: request.headers.get('user-agent'),
+        method: 'GET',
+        endpoint: '/api/keys',
+        statusCode: 200
+      }, {
+        name: `Folder: ${folder?.name || folderId}`,
+        type: 'folder_access',
+        folderName: folder?.name,
+        tags: [],
+        authMethod: 'session'
+      });
+    }
+
+    // Revalidations are answered from the page's key IDs and update times alone;
+    // the keys themselves are only loaded when the listing changed
+    if (request.headers.get('if-none-match')) {
+      const version = await getKeysByFolderVersion(user.id, folderId, limit, offset)
+      const unchanged = notModified(request, versionETag(version))
+      if (unchanged) {
+        // A revalidated listing is still an access
+        await logListingAccess()
+        return unchanged
+      }
+    }
+
     // Get keys for the specified folder with pagination (including team access)
     const { keys, total } = await getKeysByFolder(user.id, folderId, limit, offset)
 
-    // Get folder name for context
-    const folder = await prisma.folders.findUnique({
-      where: { id: folderId },
-      select: { name: true }
-    });
-
-    // Log successful key retrieval with enhanced details
-    await logKeyAccess(folderId, user.id, {
-      ipAddress: request.headers.get('x-forwarded-for') || request.headers.get('x-real-ip'),
-      userAgent: request.headers.get('user-agent'),
-      method: 'GET',
-      endpoint: '/api/keys',
-      statusCode: 200
-    }, {
-      name: `Folder: ${folder?.name || folderId}`,
-      type: 'folder_access',
-      folderName: folder?.name,
-      tags: [],
-      authMethod: 'session'
-    });
+    await logListingAccess()
 
     // Return keys without the encrypted values
     const safeKeys = keys.map(key => ({
@@ -239,13 +256,13 @@ export async function GET(request) {
       updatedAt: key.updatedAt
     }))
 
-    return NextResponse.json({ 
+    return jsonWithETag(request, { 
       success: true, 
       keys: safeKeys,
       total,
       limit,
       offset
-    })
+    }, { etag: versionETag(keyListingVersion(keys, total, limit, offset)) })
 
   } catch (error) {
     console.error('Error fetching keys:', error)
@@ -2,55 +2,119 @@ import crypto from 'crypto'
 
 const ALGORITHM = 'aes-256-gcm'
 const IV_LENGTH = 16
-const SALT_LENGTH = 64
 const TAG_LENGTH = 16
 const KEY_LENGTH = 32
 const ITERATIONS = 100000
 
+// v2 values are "v2:salt:iv:tag:data". The password is stretched with PBKDF2 once
+// per process into a master key; each value is then encrypted under its own key
+// expanded from the master key and the value's random salt with HKDF, which costs
+// microseconds instead of 100,000 hash iterations per decrypt
+const V2_PREFIX = 'v2:'
+const V2_SALT_LENGTH = 32
+const MASTER_SALT = Buffer.from('key-vault/v2/master', 'utf8')
+const HKDF_INFO = Buffer.from('key-vault/v2/value', 'utf8')
+
+// Derived keys of v1 values (one PBKDF2 run each) are kept in a bounded LRU so
+// repeated reads of values that haven't been migrated yet stay cheap
+const V1_KEY_CACHE_SIZE = 1000
+
+const masterKeys = new Map()
+const v1Keys = new Map()
+
 export function deriveKey(password, salt) {
   return crypto.pbkdf2Sync(password, salt, ITERATIONS, KEY_LENGTH, 'sha512')
 }
 
+function getMasterKey(password) {
+  let masterKey = masterKeys.get(password)
+  if (!masterKey) {
+    masterKey = deriveKey(password, MASTER_SALT)
+    masterKeys.set(password, masterKey)
+  }
+  return masterKey
+}
+
+function getValueKey(password, salt) {
+  return Buffer.from(crypto.hkdfSync('sha256', getMasterKey(password), salt, HKDF_INFO, KEY_LENGTH))
+}
+
+function getV1Key(password, salt) {
+  // Keyed by a digest so the password itself is not repeated in every entry
+  const cacheKey = crypto.createHash('sha256').update(password).update(salt).digest('base64')
+  let key = v1Keys.get(cacheKey)
+  if (key) {
+    // Refresh the entry's position in the LRU order
+    v1Keys.delete(cacheKey)
+  } else {
+    key = deriveKey(password, salt)
+    if (v1Keys.size >= V1_KEY_CACHE_SIZE) {
+      v1Keys.delete(v1Keys.keys().next().value)
+    }
+  }
+  v1Keys.set(cacheKey, key)
+  return key
+}
+
+function decryptWithKey(key, iv, tag, encrypted) {
+  const decipher = crypto.createDecipheriv(ALGORITHM, key, iv)
+  decipher.setAAD(Buffer.from('key-vault', 'utf8'))
+  decipher.setAuthTag(tag)
+
+  let decrypted = decipher.update(encrypted, 'hex', 'utf8')
+  decrypted += decipher.final('utf8')
+
+  return decrypted
+}
+
 export function encrypt(text, password) {
-  const salt = crypto.randomBytes(SALT_LENGTH)
+  const salt = crypto.randomBytes(V2_SALT_LENGTH)
   const iv = crypto.randomBytes(IV_LENGTH)
-  const key = deriveKey(password, salt)
-  
+  const key = getValueKey(password, salt)
+
   const cipher = crypto.createCipheriv(ALGORITHM, key, iv)
   cipher.setAAD(Buffer.from('key-vault', 'utf8'))
-  
+
   let encrypted = cipher.update(text, 'utf8', 'hex')
   encrypted += cipher.final('hex')
-  
+
   const tag = cipher.getAuthTag()
-  
-  // Combine salt + iv + tag + encrypted data
-  const result = salt.toString('hex') + ':' + iv.toString('hex') + ':' + tag.toString('hex') + ':' + encrypted
-  
-  return result
+
+  // Combine version + salt + iv + tag + encrypted data
+  return V2_PREFIX + salt.toString('hex') + ':' + iv.toString('hex') + ':' + tag.toString('hex') + ':' + encrypted
 }
 
 export function decrypt(encryptedData, password) {
+  if (encryptedData.startsWith(V2_PREFIX)) {
+    const parts = encryptedData.slice(V2_PREFIX.length).split(':')
+    if (parts.length !== 4) {
+      throw new Error('Invalid encrypted data format')
+    }
+
+    const salt = Buffer.from(parts[0], 'hex')
+    const key = getValueKey(password, salt)
+    return decryptWithKey(key, Buffer.from(parts[1], 'hex'), Buffer.from(parts[2], 'hex'), parts[3])
+  }
+
+  // v1: salt + iv + tag + encrypted data, with a PBKDF2 key per value
   const parts = encryptedData.split(':')
   if (parts.length !== 4) {
     throw new Error('Invalid encrypted data format')
   }
-  
+
   const salt = Buffer.from(parts[0], 'hex')
   const iv = Buffer.from(parts[1], 'hex')
   const tag = Buffer.from(parts[2], 'hex')
   const encrypted = parts[3]
-  
-  const key = deriveKey(password, salt)
-  
-  const decipher = crypto.createDecipheriv(ALGORITHM, key, iv)
-  decipher.setAAD(Buffer.from('key-vault', 'utf8'))
-  decipher.setAuthTag(tag)
-  
-  let decrypted = decipher.update(encrypted, 'hex', 'utf8')
-  decrypted += decipher.final('utf8')
-  
-  return decrypted
+
+  const key = getV1Key(password, salt)
+
+  return decryptWithKey(key, iv, tag, encrypted)
+}
+
+// True for values written in an older format that should be re-encrypted
+export function needsReencryption(encryptedData) {
+  return !encryptedData.startsWith(V2_PREFIX)
 }
 
 export function generateSecureKey(length = 32) {
@@ -59,4 +123,4 @@ export function generateSecureKey(length = 32) {
 
 export function hashData(data) {
   return crypto.createHash('sha256').update(data).digest('hex')
-} 
\ No newline at end of file
+}
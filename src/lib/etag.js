@@ -0,0 +1,61 @@
+import { createHash } from 'crypto'
+import { NextResponse } from 'next/server'
+
+// Strong validator over the serialized body, so any change to the response
+// (including nested folders or key metadata) produces a new tag
+export function computeETag(json) {
+  return `"${createHash('sha1').update(json).digest('base64url')}"`
+}
+
+// Weak validator over a cheap version string (for example the IDs and update
+// times of the rows behind a response), so a route can answer revalidations
+// without building the response
+export function versionETag(version) {
+  return `W/${computeETag(version)}`
+}
+
+// If-None-Match uses weak comparison: W/ prefixes are ignored on both sides
+function opaqueTag(tag) {
+  return tag.trim().replace(/^W\//, '')
+}
+
+function matchesIfNoneMatch(request, etag) {
+  const header = request.headers.get('if-none-match')
+  if (!header) return false
+  if (header.trim() === '*') return true
+  return header.split(',').some(tag => opaqueTag(tag) === opaqueTag(etag))
+}
+
+function etagHeaders(etag, init) {
+  return {
+    ETag: etag,
+    // Responses are per user: only the client may keep them, and must revalidate
+    'Cache-Control': 'private, no-cache',
+    Vary: 'Authorization, Cookie',
+    ...init.headers
+  }
+}
+
+// Bodyless 304 if the client already holds etag, otherwise null
+export function notModified(request, etag, init = {}) {
+  if (!matchesIfNoneMatch(request, etag)) return null
+  return new NextResponse(null, { status: 304, headers: etagHeaders(etag, init) })
+}
+
+// JSON response with an ETag; answers 304 without a body when the client
+// already holds the current version. init.etag overrides the tag computed
+// from the body, e.g. with a versionETag()
+export function jsonWithETag(request, body, init = {}) {
+  const json = JSON.stringify(body)
+  const etag = init.etag || computeETag(json)
+  const headers = etagHeaders(etag, init)
+
+  if (matchesIfNoneMatch(request, etag)) {
+    return new NextResponse(null, { status: 304, headers })
+  }
+
+  return new NextResponse(json, {
+    status: init.status || 200,
+    headers: { ...headers, 'Content-Type': 'application/json' }
+  })
+}
@@ -122,24 +122,19 @@ export async function deleteFolder(folderId, userId) {
   return true
 }
 
-async function getSubfolderIds(folderId, userId) {
-  const subfolders = await prisma.folders.findMany({
-    where: {
-      parentId: folderId,
-      userId
-    },
-    select: { id: true }
-  })
-  
-  const subfolderIds = subfolders.map(f => f.id)
-  
-  // Recursively get subfolders of subfolders
-  for (const subId of subfolderIds) {
-    const nestedIds = await getSubfolderIds(subId, userId)
-    subfolderIds.push(...nestedIds)
-  }
-  
-  return subfolderIds
+// IDs of every folder below folderId (not folderId itself) in the owner's tree
+export async function getSubfolderIds(folderId, userId) {
+  // The whole subtree in one round trip; UNION (not UNION ALL) stops on cycles
+  const subfolders = await prisma.$queryRaw`
+    WITH RECURSIVE subtree AS (
+      SELECT id FROM folders WHERE "parentId" = ${folderId} AND "userId" = ${userId}
+      UNION
+      SELECT f.id FROM folders f JOIN subtree s ON f."parentId" = s.id WHERE f."userId" = ${userId}
+    )
+    SELECT id FROM subtree
+  `
+  
+  return subfolders.map(f => f.id)
 }
 
 export async function getUserFolders(userId) {
@@ -177,17 +172,7 @@ export async function getFolderTree(userId, projectId = null) {
   let folderIds = []
   
   if (projectId) {
-    // Get the project folder and all its descendants
-    const projectFolder = await prisma.folders.findFirst({
-      where: { id: projectId, userId },
-      select: { id: true }
-    })
-    
-    if (!projectFolder) {
-      return []
-    }
-    
-    // Get all descendant folder IDs
+    // Get all descendant folder IDs; an unknown project yields no folders below
     const descendantIds = await getSubfolderIds(projectId, userId)
     folderIds = [projectId, ...descendantIds]
   }
@@ -210,32 +195,33 @@ export async function getFolderTree(userId, projectId = null) {
     }
   })
   
-  // Build tree structure
+  // Build tree structure in one pass. A child can come before its parent, so a
+  // parent starts as a placeholder that is filled in when its row arrives;
+  // placeholders never filled (parents outside the result) are left out
   const folderMap = new Map()
   const rootFolders = []
   
-  // Create map of all folders
-  folders.forEach(folder => {
-    folderMap.set(folder.id, {
-      ...folder,
-      children: []
-    })
-  })
-  
-  // Build tree structure
-  folders.forEach(folder => {
+  for (const folder of folders) {
+    let node = folderMap.get(folder.id)
+    if (node) {
+      Object.assign(node, folder)
+    } else {
+      node = { ...folder, children: [] }
+      folderMap.set(folder.id, node)
+    }
+    
     if (folder.parentId) {
-      const parent = folderMap.get(folder.parentId)
-      if (parent) {
-        parent.children.push(folderMap.get(folder.id))
+      let parent = folderMap.get(folder.parentId)
+      if (!parent) {
+        parent = { children: [] }
+        folderMap.set(folder.parentId, parent)
       }
-    } else {
+      parent.children.push(node)
+    } else if (!projectId || folder.id === projectId) {
       // Only add to root folders if it's the project folder or if no project filtering
-      if (!projectId || folder.id === projectId) {
-        rootFolders.push(folderMap.get(folder.id))
-      }
+      rootFolders.push(node)
     }
-  })
+  }
   
   return rootFolders
 }
@@ -1,5 +1,5 @@
 import { PrismaClient } from '@prisma/client'
-import { encrypt, decrypt } from './encryption.js'
+import { encrypt, decrypt, needsReencryption } from './encryption.js'
 import { logAction } from './audit.js'
 
 const prisma = new PrismaClient()
@@ -13,6 +13,31 @@ if (!ENCRYPTION_KEY) {
   return ENCRYPTION_KEY
 }
 
+// IDs of the teams a user owns or belongs to
+export async function getUserTeamIds(userId) {
+  const userTeams = await prisma.teams.findMany({
+    where: {
+      OR: [
+        { ownerId: userId },
+        { team_members: { some: { userId } } }
+      ]
+    },
+    select: { id: true }
+  })
+
+  return userTeams.map(team => team.id)
+}
+
+// Keys a user can read: their own and those shared with one of their teams
+export function keyAccessWhere(userId, teamIds) {
+  return {
+    OR: [
+      { userId }, // User's own keys
+      { key_accesses: { some: { teamId: { in: teamIds } } } } // Team shared keys
+    ]
+  }
+}
+
 export async function createKey(userId, folderId, keyData) {
   const { name, description, value, type, tags, isFavorite, environment, expiresAt } = keyData
 
@@ -72,27 +97,13 @@ export async function createKey(userId, folderId, keyData) {
 
 export async function getKeysByFolder(userId, folderId, limit = 20, offset = 0) {
   try {
-    // Get user's teams
-    const userTeams = await prisma.teams.findMany({
-      where: {
-        OR: [
-          { ownerId: userId },
-          { team_members: { some: { userId } } }
-        ]
-      },
-      select: { id: true }
-    })
-
-    const teamIds = userTeams.map(team => team.id)
+    const teamIds = await getUserTeamIds(userId)
 
     // Get keys that user owns or has team access to
     const keys = await prisma.keys.findMany({
       where: {
         folderId,
-        OR: [
-          { userId }, // User's own keys
-          { key_accesses: { some: { teamId: { in: teamIds } } } } // Team shared keys
-        ]
+        ...keyAccessWhere(userId, teamIds)
       },
       orderBy: {
         createdAt: 'desc'
@@ -114,10 +125,7 @@ export async function getKeysByFolder(userId, folderId, limit = 20, offset = 0)
     const total = await prisma.keys.count({
       where: {
         folderId,
-        OR: [
-          { userId },
-          { key_accesses: { some: { teamId: { in: teamIds } } } }
-        ]
+        ...keyAccessWhere(userId, teamIds)
       }
     })
 
@@ -127,28 +135,72 @@ export async function getKeysByFolder(userId, folderId, limit = 20, offset = 0)
   }
 }
 
-export async function getKeyById(userId, keyId) {
+// Version of one page of a folder listing: the paging, the total and the ID
+// and update time of each key on the page. Every edit bumps updatedAt, so the
+// version changes whenever the listing's body would
+export function keyListingVersion(keys, total, limit, offset) {
+  return JSON.stringify([limit, offset, total, keys.map(key => [key.id, key.updatedAt])])
+}
+
+// keyListingVersion() of getKeysByFolder(), from two light queries that load
+// neither the keys nor their team accesses
+export async function getKeysByFolderVersion(userId, folderId, limit = 20, offset = 0) {
   try {
-    // Get user's teams
-    const userTeams = await prisma.teams.findMany({
+    const teamIds = await getUserTeamIds(userId)
+    const where = {
+      folderId,
+      ...keyAccessWhere(userId, teamIds)
+    }
+
+    const [page, total] = await Promise.all([
+      prisma.keys.findMany({
+        where,
+        orderBy: {
+          createdAt: 'desc'
+        },
+        take: limit,
+        skip: offset,
+        select: { id: true, updatedAt: true }
+      }),
+      prisma.keys.count({ where })
+    ])
+
+    return keyListingVersion(page, total, limit, offset)
+  } catch (error) {
+    throw new Error(`Failed to fetch keys: ${error.message}`)
+  }
+}
+
+export async function getKeysWithValues(userId, { folderId, ids, environment, limit = 500 } = {}) {
+  try {
+    const teamIds = await getUserTeamIds(userId)
+
+    // Get keys that user owns or has team access to, encrypted values included
+    return await prisma.keys.findMany({
       where: {
-        OR: [
-          { ownerId: userId },
-          { team_members: { some: { userId } } }
-        ]
+        ...(folderId && { folderId }),
+        ...(ids && { id: { in: ids } }),
+        ...(environment && { environment: { equals: environment, mode: 'insensitive' } }),
+        ...keyAccessWhere(userId, teamIds)
+      },
+      orderBy: {
+        createdAt: 'desc'
       },
-      select: { id: true }
+      take: limit
     })
+  } catch (error) {
+    throw new Error(`Failed to fetch keys: ${error.message}`)
+  }
+}
 
-    const teamIds = userTeams.map(team => team.id)
+export async function getKeyById(userId, keyId) {
+  try {
+    const teamIds = await getUserTeamIds(userId)
 
     const key = await prisma.keys.findFirst({
       where: {
         id: keyId,
-        OR: [
-          { userId }, // User's own keys
-          { key_accesses: { some: { teamId: { in: teamIds } } } } // Team shared keys
-        ]
+        ...keyAccessWhere(userId, teamIds)
       },
       include: {
         key_accesses: {
@@ -245,6 +297,13 @@ export async function deleteKey(userId, keyId) {
       throw new Error('Key not found')
     }
 
+    // Shares are removed with the key; remember them so team members' change
+    // feeds still report the deletion
+    const shares = await prisma.key_accesses.findMany({
+      where: { keyId },
+      select: { teamId: true }
+    })
+
     await prisma.keys.delete({
       where: { id: keyId }
     })
@@ -253,7 +312,9 @@ export async function deleteKey(userId, keyId) {
     await logAction('DELETE', 'key', userId, { 
       resourceId: keyId,
       name: key.name, 
-      type: key.type 
+      type: key.type,
+      folderId: key.folderId, // Lets the change feed scope deletions to a folder
+      teamIds: shares.map(share => share.teamId)
     })
 
     return { success: true }
@@ -262,12 +323,31 @@ export async function deleteKey(userId, keyId) {
   }
 }
 
-export async function decryptKeyValue(encryptedValue) {
+export async function decryptKeyValue(encryptedValue, key = null) {
+  let value
   try {
-    return decrypt(encryptedValue, getEncryptionKey())
+    value = decrypt(encryptedValue, getEncryptionKey())
   } catch (error) {
     throw new Error(`Failed to decrypt key value: ${error.message}`)
   }
+
+  // Values in the old format are re-encrypted in the background on first read
+  if (key?.id && key.updatedAt && needsReencryption(encryptedValue)) {
+    migrateKeyValue(key, encryptedValue, value)
+  }
+
+  return value
+}
+
+function migrateKeyValue(key, encryptedValue, value) {
+  // Only replaces the exact ciphertext that was read, so a concurrent update wins.
+  // updatedAt is kept because the key itself did not change
+  prisma.keys.updateMany({
+    where: { id: key.id, value: encryptedValue },
+    data: { value: encrypt(value, getEncryptionKey()), updatedAt: key.updatedAt }
+  }).catch(error => {
+    console.error('Failed to re-encrypt key value:', error)
+  })
 }
 
 export function validateKeyData(keyData) {